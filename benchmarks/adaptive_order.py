@@ -0,0 +1,51 @@
+"""
+The `adaptive_order` benchmark compares resolving a mixed log with strategies walked in
+declaration order, pinned to the first match (`cache=True`) and ordered by how often they
+matched (`adaptive=True`), in line rate and lines resolved.
+
+Run from the repository root with `python -m benchmarks.adaptive_order [lines]`
+"""
+import sys
+from time import perf_counter
+
+from gla.plugins.resolver.resolver import Resolver
+from gla.plugins.transformer.log4j_transformer import Log4jTransformer
+
+
+def line(number: int) -> str:
+    if number % 20 == 0:
+        # Continuation lines which no layout matches
+        return f"\tat com.example.Service.method{number}(Service.java:{number})"
+    if number % 20 < 4:
+        # Matches the first layout
+        return f"2020-02-01 [worker-{number % 16}] WARN app.module - processed request {number}"
+    # Matches a late layout
+    return f"api.request - Timeout error {number} 2021-09-10 ERROR [main]"
+
+
+def measure(resolver: Resolver, lines: list) -> tuple:
+    resolve = resolver.resolve
+    start = perf_counter()
+    resolved = sum(1 for entry in lines if resolve(entry) is not None)
+    return resolved, perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    lines = [line(number) for number in range(count)]
+    strategies = Log4jTransformer.STRATEGIES
+    resolvers = (
+        ("sequential", lambda: Resolver(strategies, False)),
+        ("sequential cached", lambda: Resolver(strategies, True)),
+        ("sequential adaptive", lambda: Resolver(strategies, False, True)),
+        ("dispatch", Log4jTransformer),
+        ("dispatch cached", lambda: Log4jTransformer(cache=True)),
+        ("dispatch adaptive", lambda: Log4jTransformer(adaptive=True)),
+    )
+    for name, resolver in resolvers:
+        resolved, elapsed = measure(resolver(), lines)
+        print(f"{name:<20} {count / elapsed:>12,.0f} lines/s {resolved:>9,} resolved")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+The `cef_extensions` benchmark measures the line rate of `CefTransformer` for consumers
+that only read the header fields and for consumers that read the parsed extensions,
+against parsing every extension block eagerly.
+
+Run from the repository root with `python -m benchmarks.cef_extensions`
+"""
+from time import perf_counter
+
+from gla.plugins.transformer.cef_transformer import CefTransformer, parse_extensions
+
+LINES = 50_000
+
+
+def lines():
+    return [
+        f"CEF:0|Acme|Firewall|2.5|{100 + line % 7}|Blocked access|{line % 10}|"
+        f"src=10.0.{line % 255}.{line % 7} dst=198.51.100.{line % 255} spt={1024 + line} "
+        f"dpt=443 proto=TCP suser=user{line % 50} act=blocked "
+        f"request=/search?q\\=item{line} msg=Blocked external access from zone {line % 9}"
+        for line in range(LINES)
+    ]
+
+
+def header(log):
+    return log.level, log.source
+
+
+def extensions(log):
+    return log.extensions["src"], log.extensions["act"]
+
+
+def eager(log):
+    return parse_extensions(log._raw)  # pylint: disable=protected-access
+
+
+def rate(access, entries) -> float:
+    """Lines transformed and accessed per second"""
+    transformer = CefTransformer(cache=True)
+    start = perf_counter()
+    for entry in entries:
+        access(transformer.transform(entry))
+    return len(entries) / (perf_counter() - start)
+
+
+def main():
+    entries = lines()
+    print(f"{LINES} CEF lines")
+    for name, access in (
+        ("header only", header),
+        ("extensions", extensions),
+        ("eager parse", eager),
+    ):
+        print(f"{name:<12} {rate(access, entries):>12,.0f} lines/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+The `custom_csv` benchmark compares quoted `CustomTransformer` templates streaming a CSV file
+through one `csv` reader against parsing it line by line, with the plain split of an unquoted
+file for reference.
+
+Run from the repository root with `python -m benchmarks.custom_csv [lines]`
+"""
+import os
+import sys
+import tempfile
+from time import perf_counter
+
+from gla.plugins.transformer.custom_transformer import CustomTransformer
+from gla.utilities.timestamp import TimestampMemo
+
+TEMPLATE = [",", "time", "lvl", "src", "msg"]
+
+
+def measure(transform, path: str) -> tuple:
+    start = perf_counter()
+    count = sum(1 for _ in transform(path))
+    return count, perf_counter() - start
+
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    with tempfile.TemporaryDirectory() as directory:
+        quoted = os.path.join(directory, "quoted.csv")
+        with open(quoted, "w", encoding="utf-8") as file:
+            file.writelines(
+                f'2024-05-{line % 28 + 1:02d},WARNING,"worker, {line % 8}",'
+                f'"request {line} failed, said ""retry"""\n'
+                for line in range(lines)
+            )
+        plain = os.path.join(directory, "plain.log")
+        with open(plain, "w", encoding="utf-8") as file:
+            file.writelines(
+                f"2024-05-{line % 28 + 1:02d},WARNING,worker {line % 8},request {line} failed\n"
+                for line in range(lines)
+            )
+
+        memo = TimestampMemo()
+        streamed = CustomTransformer(TEMPLATE, memo, quoted=True)
+        split = CustomTransformer(TEMPLATE, memo)
+
+        def by_line(path: str):
+            with open(path, encoding="utf-8") as file:
+                yield from streamed.transform_many(file)
+
+        for name, transform, path in (
+            ("quoted, csv reader", streamed.transform_file, quoted),
+            ("quoted, per line", by_line, quoted),
+            ("unquoted, split", split.transform_file, plain),
+        ):
+            count, elapsed = measure(transform, path)
+            print(f"{name:<20} {count:>8,} logs {lines / elapsed:>10,.0f} lines/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+The `follow_latency` benchmark measures how long a line written to a followed log file
+takes to come out of `FileFollower`, and the cpu time an idle follower uses.
+
+Run from the repository root with `python -m benchmarks.follow_latency [lines]`
+"""
+import asyncio
+import os
+import sys
+import tempfile
+from time import perf_counter, process_time
+
+from gla.utilities.follow import FileFollower
+
+
+def percentile(values: list, fraction: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+async def latency(path: str, lines: int, gap: float) -> list:
+    """Writes timestamped lines `gap` seconds apart and measures when each is yielded"""
+    latencies = []
+
+    async def write():
+        await asyncio.sleep(0.1)
+        with open(path, "a", encoding="utf-8") as file:
+            for _ in range(lines):
+                file.write(f"{perf_counter()!r}\n")
+                file.flush()
+                await asyncio.sleep(gap)
+
+    async def read():
+        follow = FileFollower(path).lines()
+        try:
+            async for line in follow:
+                latencies.append(perf_counter() - float(line))
+                if len(latencies) == lines:
+                    break
+        finally:
+            await follow.aclose()
+
+    await asyncio.gather(read(), write())
+    return latencies
+
+
+async def idle(path: str, seconds: float) -> float:
+    """Follows a file nothing is written to and measures the cpu time spent"""
+    follow = FileFollower(path).lines()
+    task = asyncio.ensure_future(follow.__anext__())
+    start = process_time()
+    await asyncio.sleep(seconds)
+    spent = process_time() - start
+    task.cancel()
+    try:
+        await task
+    except (asyncio.CancelledError, StopAsyncIteration):
+        pass
+    return spent
+
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    loop = asyncio.new_event_loop()
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "follow.log")
+            open(path, "w", encoding="utf-8").close()
+            for gap in (0.001, 0.05):
+                latencies = loop.run_until_complete(latency(path, lines, gap))
+                print(
+                    f"gap {gap * 1000:>5.0f} ms  p50 {percentile(latencies, 0.5) * 1000:>7.2f} ms  "
+                    f"p99 {percentile(latencies, 0.99) * 1000:>7.2f} ms"
+                )
+            spent = loop.run_until_complete(idle(path, 5))
+            print(f"idle 5 s  cpu {spent * 1000:.1f} ms")
+    finally:
+        loop.close()
+
+
+if __name__ == "__main__":
+    main()
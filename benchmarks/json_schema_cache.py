@@ -0,0 +1,74 @@
+"""
+The `json_schema_cache` benchmark compares `JsonTransformer` schema resolution on a mixed
+ECS, Log4j-JSON and syslog-JSON NDJSON corpus when every record is scored, when the schema
+is remembered per key set, and when the first schema is pinned with `cache=True`.
+
+Run from the repository root with `python -m benchmarks.json_schema_cache [records]`
+"""
+import json
+import sys
+from time import perf_counter
+
+from gla.plugins.transformer.json_transformer import JsonTransformer
+
+
+def record(number: int) -> str:
+    kind = number % 3
+    if kind == 0:
+        fields = {
+            "@timestamp": "2019-08-06T14:08:40.199Z",
+            "log.level": "INFO",
+            "log.logger": "app.service",
+            "service.name": "petclinic",
+            "message": f"ecs record {number}",
+        }
+        if number % 2:
+            fields["trace.id"] = "2869b25b5469590610fea49ac04af7da"
+    elif kind == 1:
+        fields = {
+            "timestamp": "2019-08-06T14:08:40.199Z",
+            "level": "WARN",
+            "loggerName": "auth.service",
+            "threadName": "main",
+            "message": f"log4j record {number}",
+        }
+    else:
+        fields = {
+            "timestamp": "2019-08-06T14:08:40.199",
+            "severity": "ERROR",
+            "appname": "sshd",
+            "host": "server-01",
+            "msg": f"syslog record {number}",
+        }
+    return json.dumps(fields)
+
+
+def measure(json_transformer: JsonTransformer, records: list) -> tuple:
+    resolve = json_transformer.resolve
+    start = perf_counter()
+    mappings = [resolve(entry) for entry in records]
+    return mappings, perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    records = [json.loads(record(number)) for number in range(count)]
+
+    scored = JsonTransformer()
+    # Scores every record, as before schemas were remembered per key set
+    scored._signature = None  # pylint: disable=protected-access
+    expected, _ = measure(scored, records)
+    for name, transformer in (
+        ("scored", scored),
+        ("key set cache", JsonTransformer()),
+        ("cache=True", JsonTransformer(cache=True)),
+    ):
+        mappings, elapsed = measure(transformer, records)
+        wrong = sum(
+            1 for mapping, right in zip(mappings, expected) if mapping.mapping != right.mapping
+        )
+        print(f"{name:<14} {count / elapsed:>12,.0f} records/s {wrong:>9,} wrong schemas")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+The `log4j_dispatch` benchmark compares the per-line resolution cost of the `Log4jTransformer`
+layouts when walked in sequence versus dispatched on the kinds of the first two tokens of the line.
+
+Run from the repository root with `python -m benchmarks.log4j_dispatch`
+"""
+from timeit import repeat
+
+from gla.plugins.resolver.resolver import DispatchResolver, Resolver
+from gla.plugins.transformer.log4j_transformer import Log4jTransformer, _classify, _route
+
+LINES = [
+    # Matches the first layout
+    "2020-02-01 [worker-thread] WARN database.connection - Failed to connect to database",
+    # Matches late layouts
+    "api.request - Timeout error 2021-09-10 ERROR [main]",
+    "api.request - Timeout error 2021-09-10 [main] ERROR",
+    # Matches no layout
+    "- 2021-09-10 a line no layout starts with",
+    "class.example Error message goes here 02-01-2020 ERROR [main]",
+]
+LAYOUTS = (5, 10, 20, 30)
+NUMBER = 2000
+
+
+def per_line(resolver: Resolver, line: str) -> float:
+    """Best per-line resolution time in microseconds"""
+    best = min(repeat(lambda: resolver.resolve(line), number=NUMBER, repeat=5))
+    return best / NUMBER * 1e6
+
+
+def main():
+    strategies = Log4jTransformer.STRATEGIES
+    print(f"{'layouts':>8} {'line':<60} {'sequential':>12} {'dispatch':>12}")
+    for count in LAYOUTS:
+        subset = strategies[:count]
+        sequential = Resolver(subset, False)
+        dispatch = DispatchResolver(subset, False, _classify, _route(subset))
+        for line in LINES:
+            print(
+                f"{count:>8} {line[:60]:<60} "
+                f"{per_line(sequential, line):>10.2f}us {per_line(dispatch, line):>10.2f}us"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+The `log4j_layout` benchmark measures the line rate of `Log4jTransformer` on homogeneous
+files, one per layout, resolving every line against the layouts, reusing the last matched
+layout through `cache`, and parsing by token positions through a learned layout.
+
+Run from the repository root with `python -m benchmarks.log4j_layout`
+"""
+from time import perf_counter
+
+from gla.plugins.transformer.log4j_transformer import Log4jTransformer
+from gla.utilities.timestamp import TimestampMemo
+
+LINES = 20_000
+
+# One line of each layout, its message to be numbered
+LAYOUTS = {
+    "first": "2020-02-01 [worker-thread] WARN database.connection - Failed to connect {}",
+    "thread first": "[main-thread] 2020-01-02 ERROR db.connect - Failed to connect {}",
+    "time last": "ERROR [network-thread] api.request - Timeout error {} 2021-09-10",
+    "module first": "api.request - Timeout error {} 2021-09-10 ERROR [main]",
+}
+
+
+def rate(transformer, lines) -> float:
+    """Lines transformed per second"""
+    start = perf_counter()
+    for line in lines:
+        transformer.transform(line)
+    return len(lines) / (perf_counter() - start)
+
+
+def main():
+    print(f"{LINES} lines per layout")
+    for name, layout in LAYOUTS.items():
+        lines = [layout.format(line) for line in range(LINES)]
+        for mode, options in (
+            ("resolve", {}),
+            ("cache", {"cache": True}),
+            ("learn", {"learn": True}),
+        ):
+            transformer = Log4jTransformer(memo=TimestampMemo(), **options)
+            print(f"{name:<14} {mode:<8} {rate(transformer, lines):>12,.0f} lines/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+The `mapped_lines` benchmark compares `transform_file`, which decodes every line, against
+`transform_mapped`, which reads lines through a memory map and matches the log4j ones in
+place, decoding only their matches, in line rate and peak traced memory.
+
+Run from the repository root with `python -m benchmarks.mapped_lines [lines]`
+"""
+import os
+import sys
+import tempfile
+import tracemalloc
+from time import perf_counter
+
+from gla.plugins.transformer.log4j_transformer import Log4jTransformer
+from gla.plugins.transformer.ncsa_transformer import NcsaTransformer
+
+RUNS = 3
+LEVELS = ("ERROR", "WARN", "INFO", "DEBUG", "TRACE")
+
+
+def log4j_line(line: int) -> str:
+    if line % 4 == 0:
+        # Continuation lines which no layout matches
+        return f"\tat com.example.Service.method{line}(Service.java:{line})\n"
+    return (
+        f"2020-02-{line % 28 + 1:02d} [worker-{line % 16}] {LEVELS[line % 5]} "
+        f"app.module{line % 7} - processed request {line}\n"
+    )
+
+
+def ncsa_line(line: int) -> str:
+    return (
+        f"192.168.1.{line % 255} - - [10/Mar/2024:12:{line % 60:02d}:00 +0000] "
+        f'"GET /item/{line} HTTP/1.1" 200 {line} "-" "Mozilla/5.0 (X11; Linux x86_64)" "-"\n'
+    )
+
+
+def measure(transform, path: str) -> tuple:
+    # The best of a few runs, as a busy machine only ever slows a run down
+    elapsed = float("inf")
+    for _ in range(RUNS):
+        start = perf_counter()
+        count = sum(1 for _ in transform(path))
+        elapsed = min(elapsed, perf_counter() - start)
+
+    tracemalloc.start()
+    sum(1 for _ in transform(path))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, elapsed, peak
+
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    with tempfile.TemporaryDirectory() as directory:
+        for name, transformer, line in (
+            ("log4j", Log4jTransformer, log4j_line),
+            ("ncsa", NcsaTransformer, ncsa_line),
+        ):
+            path = os.path.join(directory, f"bench-{name}.log")
+            with open(path, "w", encoding="utf-8") as file:
+                file.writelines(line(number) for number in range(lines))
+
+            for method in ("transform_file", "transform_mapped"):
+                count, elapsed, peak = measure(getattr(transformer(), method), path)
+                print(
+                    f"{name:<6} {method:<17} {count:>8,} logs {lines / elapsed:>10,.0f} lines/s "
+                    f"peak {peak / 1024:>8,.1f} KiB"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+The `multiline_records` benchmark measures `Log4jTransformer` on a log where every fifth
+record carries a Java stack trace, transforming each physical line on its own against
+assembling multi-line records, and counts the strategies tried by each.
+
+Run from the repository root with `python -m benchmarks.multiline_records`
+"""
+from time import perf_counter
+
+from gla.plugins.transformer.log4j_transformer import Log4jTransformer
+from gla.utilities.strategy import Strategy
+from gla.utilities.timestamp import TimestampMemo
+
+RECORDS = 10_000
+FRAMES = 20
+
+
+def lines():
+    result = []
+    for record in range(RECORDS):
+        result.append(
+            f"2024-03-10 [worker-{record % 8}] INFO api.service - Request {record} served"
+        )
+        if record % 5 == 0:
+            result.append("java.lang.IllegalStateException: connection reset")
+            result.extend(
+                f"\tat com.example.layer{frame}.Handler.handle(Handler.java:{frame + 10})"
+                for frame in range(FRAMES)
+            )
+            result.append("Caused by: java.io.IOException: broken pipe")
+            result.append(f"\t... {FRAMES} more")
+    return result
+
+
+class Counted(Strategy):
+    """A strategy counting each time it is tried"""
+
+    def __init__(self, strategy, tried: list):
+        self._match = strategy.match
+        self._tried = tried
+
+    def match(self, entry):
+        self._tried[0] += 1
+        return self._match(entry)
+
+
+def counting(transformer: Log4jTransformer) -> list:
+    """Counts each strategy tried by the transformer
+
+    NOTE: the strategies are shared by every instance, so the counting copies
+    are only swapped into this one
+    """
+    # pylint: disable=protected-access
+    tried = [0]
+    copies = {id(strategy): Counted(strategy, tried) for strategy in transformer._strategies}
+    transformer._strategies = list(copies.values())
+    transformer._routes = {
+        kind: [copies[id(strategy)] for strategy in route]
+        for kind, route in transformer._routes.items()
+    }
+    return tried
+
+
+def main():
+    entries = lines()
+    print(f"{len(entries)} lines, {RECORDS} records, a stack trace every 5 records")
+    for name, transform in (
+        ("per line", lambda transformer: transformer.transform_many(entries)),
+        ("records", lambda transformer: transformer.transform_records(entries)),
+    ):
+        transformer = Log4jTransformer(memo=TimestampMemo())
+        tried = counting(transformer)
+        start = perf_counter()
+        batch = transform(transformer)
+        logs = sum(1 for _ in batch)
+        elapsed = perf_counter() - start
+        print(
+            f"{name:<9} {len(entries) / elapsed:>12,.0f} lines/s  {logs} logs  "
+            f"{batch.failed} failed  {tried[0]:,} strategies tried"
+        )
+
+
+if __name__ == "__main__":
+    main()
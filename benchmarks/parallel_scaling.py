@@ -0,0 +1,51 @@
+"""
+The `parallel_scaling` benchmark measures how `transform_parallel` scales with the number of
+worker processes on a generated log4j file, against a sequential `transform_file`.
+
+Run from the repository root with `python -m benchmarks.parallel_scaling [lines]`
+"""
+import os
+import sys
+import tempfile
+from time import perf_counter
+
+from gla.plugins.transformer.log4j_transformer import Log4jTransformer
+from gla.plugins.transformer.parallel import transform_parallel
+
+WORKERS = (1, 2, 4, 8)
+LEVELS = ("ERROR", "WARN", "INFO", "DEBUG", "TRACE")
+
+
+def generate(path: str, lines: int):
+    with open(path, "w", encoding="utf-8") as file:
+        for line in range(lines):
+            file.write(
+                f"2020-{line % 12 + 1:02d}-{line % 28 + 1:02d} [worker-{line % 16}] "
+                f"{LEVELS[line % 5]} app.module{line % 7} - processed request {line}\n"
+            )
+
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bench-log4j.log")
+        generate(path, lines)
+
+        start = perf_counter()
+        count = sum(1 for _ in Log4jTransformer().transform_file(path))
+        sequential = perf_counter() - start
+        print(f"{os.cpu_count()} cpus, {count:,} lines")
+        print(f"{'sequential':>10} {sequential:>8.2f}s {count / sequential:>12,.0f} lines/s")
+
+        for workers in WORKERS:
+            start = perf_counter()
+            count = sum(1 for _ in transform_parallel(Log4jTransformer, path, workers=workers))
+            elapsed = perf_counter() - start
+            print(
+                f"{workers:>10} {elapsed:>8.2f}s {count / elapsed:>12,.0f} lines/s "
+                f"{sequential / elapsed:>6.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
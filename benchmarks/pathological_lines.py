@@ -0,0 +1,64 @@
+"""
+The `pathological_lines` benchmark measures the per-line cost of adversarial lines that
+almost match a layout, such as long whitespace runs inside a Log4j message or unbalanced
+quotes in an NCSA request, as the lines grow. A bounded cost per character shows matching
+stays linear in the length of the line instead of backtracking catastrophically.
+
+Run from the repository root with `python -m benchmarks.pathological_lines`
+"""
+from time import perf_counter
+
+from gla.plugins.transformer.cef_transformer import CefTransformer
+from gla.plugins.transformer.log4j_transformer import Log4jTransformer
+from gla.plugins.transformer.ncsa_transformer import NcsaTransformer
+from gla.plugins.transformer.syslog_transformer import SyslogTransformer
+
+LENGTHS = (1_000, 4_000, 16_000, 64_000)
+
+# Builds an adversarial line of about the given length
+CASES = {
+    "log4j spaces": (Log4jTransformer, lambda size: "ERROR mod - x" + " " * size + "y"),
+    "log4j words": (Log4jTransformer, lambda size: "api.request - " + "a " * (size // 2)),
+    "ncsa time": (NcsaTransformer, lambda size: "1.1.1.1 - - [" + '] "' * (size // 3)),
+    "ncsa request": (
+        NcsaTransformer,
+        lambda size: '1.1.1.1 - - [10/Oct/2000:13:55:36 -0700] "' + '" 200 1 "' * (size // 9),
+    ),
+    "ncsa referrer": (
+        NcsaTransformer,
+        lambda size: '1.1.1.1 - - [x] "GET /" 200 1 "' + '" "' * (size // 3),
+    ),
+    "cef header": (CefTransformer, lambda size: "CEF:0|" + "a|" * 5 + "a" * size),
+    "syslog data": (
+        SyslogTransformer,
+        lambda size: "<34>1 2003-10-11T22:14:15Z host app 1 ID " + "[a" * (size // 2),
+    ),
+}
+
+
+def per_line(transformer, line: str) -> float:
+    """Best time in seconds to transform the line"""
+    best = float("inf")
+    for _ in range(3):
+        start = perf_counter()
+        try:
+            transformer.transform(line)
+        except ValueError:
+            pass
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def main():
+    print(f"{'case':<14}" + "".join(f"{size:>12,} chars" for size in LENGTHS))
+    for name, (factory, build) in CASES.items():
+        transformer = factory()
+        per_char = []
+        for size in LENGTHS:
+            line = build(size)
+            per_char.append(per_line(transformer, line) / len(line) * 1e9)
+        print(f"{name:<14}" + "".join(f"{cost:>12.1f} ns/ch" for cost in per_char))
+
+
+if __name__ == "__main__":
+    main()
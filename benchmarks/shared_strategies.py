@@ -0,0 +1,71 @@
+"""
+The `shared_strategies` benchmark measures the construction time and memory of each regex
+transformer instance now that its strategies are compiled once per class, against building
+the strategy table again for every instance as the transformers used to.
+
+Run from the repository root with `python -m benchmarks.shared_strategies`
+"""
+import re
+import tracemalloc
+from functools import partial
+from time import perf_counter
+
+from gla.plugins.transformer.cef_transformer import CefTransformer
+from gla.plugins.transformer.log4j_transformer import Log4jTransformer
+from gla.plugins.transformer.ncsa_transformer import NcsaTransformer
+from gla.plugins.transformer.sip_transformer import SipTransformer
+from gla.plugins.transformer.syslog_transformer import SyslogTransformer
+from gla.utilities.strategy import RegexStrategy
+
+INSTANCES = 200
+
+
+def rebuilt(transformer):
+    """The transformer along with the strategy table it used to build for itself"""
+    table = [
+        RegexStrategy(re.compile(strategy.pattern.pattern, strategy.pattern.flags))
+        for strategy in transformer.STRATEGIES
+    ]
+    return transformer(), table
+
+
+def construct(build) -> float:
+    """Microseconds to build one instance"""
+    start = perf_counter()
+    for _ in range(INSTANCES):
+        build()
+    return (perf_counter() - start) / INSTANCES * 1e6
+
+
+def footprint(build) -> float:
+    """KiB held by one instance"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [build() for _ in range(INSTANCES)]
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del instances
+    return size / INSTANCES / 1024
+
+
+def main():
+    print(f"{INSTANCES} instances per transformer")
+    for transformer in (
+        Log4jTransformer,
+        SyslogTransformer,
+        NcsaTransformer,
+        SipTransformer,
+        CefTransformer,
+    ):
+        for mode, build in (
+            ("per instance", partial(rebuilt, transformer)),
+            ("shared", transformer),
+        ):
+            print(
+                f"{transformer.__name__:<18} {mode:<13}"
+                f"{construct(build):>10,.1f} us  {footprint(build):>8,.1f} KiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
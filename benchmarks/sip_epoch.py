@@ -0,0 +1,57 @@
+"""
+The `sip_epoch` benchmark measures the cost of converting SIP CLF epochs to timestamps:
+the original round trip through `strftime` and pydantic parsing, a float `fromtimestamp`,
+and the `SipTransformer` conversion that reuses the whole second of the previous line.
+
+Run from the repository root with `python -m benchmarks.sip_epoch`
+"""
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Optional
+
+from gla.models.log import Log
+from gla.plugins.transformer.sip_transformer import SipTransformer
+
+SECONDS = 100
+BURST = 200
+
+
+def epochs():
+    return [
+        f"{1275930743 + second}.{(line * 37) % 1000:03}"
+        for second in range(SECONDS)
+        for line in range(BURST)
+    ]
+
+
+def round_trip(epoch: str) -> Optional[datetime]:
+    """The conversion `SipTransformer` used to do, string formatting and parsing included"""
+    text = datetime.fromtimestamp(float(epoch), timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+    return Log(timestamp=text).timestamp
+
+
+def from_float(epoch: str) -> datetime:
+    return datetime.fromtimestamp(float(epoch), timezone.utc)
+
+
+def rate(convert, values) -> float:
+    """Epochs converted per second"""
+    start = perf_counter()
+    for value in values:
+        convert(value)
+    return len(values) / (perf_counter() - start)
+
+
+def main():
+    values = epochs()
+    print(f"{SECONDS} distinct seconds x {BURST} epochs each")
+    for name, convert in (
+        ("round trip", round_trip),
+        ("float", from_float),
+        ("second reuse", SipTransformer()._to_datetime),  # pylint: disable=protected-access
+    ):
+        print(f"{name:<14} {rate(convert, values):>12,.0f} epochs/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+The `syslog_structured` benchmark measures PRI decoding through the precomputed table
+against the previous if/elif chain, and the line rate of `SyslogTransformer` on RFC 5424
+lines for consumers that skip and that read the structured data.
+
+Run from the repository root with `python -m benchmarks.syslog_structured`
+"""
+from time import perf_counter
+
+from gla.plugins.transformer.syslog_transformer import SyslogTransformer, decode_priority
+from gla.utilities.timestamp import TimestampMemo
+
+LINES = 50_000
+
+
+def chain(lvl: str):
+    """The previous severity decoding, without a facility"""
+    res = int(lvl) % 8
+    if res == 0:
+        return "EMERGENCY"
+    elif res == 1:
+        return "ALERT"
+    elif res == 2:
+        return "CRITICAL"
+    elif res == 3:
+        return "ERROR"
+    elif res == 4:
+        return "WARN"
+    elif res == 5:
+        return "NOTICE"
+    elif res == 6:
+        return "INFO"
+    elif res == 7:
+        return "DEBUG"
+    return None
+
+
+def lines():
+    return [
+        f"<{line % 192}>1 2024-03-10T12:00:{line % 60:02}.003Z host{line % 9} app 42 ID{line % 5} "
+        f'[origin ip="192.0.2.{line % 255}" software="app"][meta sequenceId="{line}"] '
+        f"request {line} served"
+        for line in range(LINES)
+    ]
+
+
+def rate(call, values) -> float:
+    """Calls per second"""
+    start = perf_counter()
+    for value in values:
+        call(value)
+    return len(values) / (perf_counter() - start)
+
+
+def accessing(transformer: SyslogTransformer, access):
+    """Transforms an entry and accesses the resulting log"""
+    transform = transformer.transform
+    return lambda entry: access(transform(entry))
+
+
+def main():
+    pris = [str(pri % 192) for pri in range(LINES)]
+    print(f"{LINES} PRI values")
+    for name, decode in (("if/elif", chain), ("table", decode_priority)):
+        print(f"{name:<16} {rate(decode, pris):>12,.0f} values/s")
+
+    entries = lines()
+    print(f"{LINES} RFC 5424 lines")
+    for name, access in (
+        ("header only", lambda log: log.level),
+        ("structured data", lambda log: log.structured_data["origin"]["ip"]),
+    ):
+        transformer = SyslogTransformer(cache=True, memo=TimestampMemo())
+        result = rate(accessing(transformer, access), entries)
+        print(f"{name:<16} {result:>12,.0f} lines/s")
+
+
+if __name__ == "__main__":
+    main()
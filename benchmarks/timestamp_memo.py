@@ -0,0 +1,61 @@
+"""
+The `timestamp_memo` benchmark measures the line rate of transformers on bursty logs,
+where hundreds of consecutive lines share a timestamp, with and without a `TimestampMemo`.
+
+Run from the repository root with `python -m benchmarks.timestamp_memo`
+"""
+from datetime import datetime, timedelta
+from time import perf_counter
+
+from gla.plugins.transformer.ncsa_transformer import NcsaTransformer
+from gla.plugins.transformer.syslog_transformer import SyslogTransformer
+from gla.utilities.timestamp import TimestampMemo
+
+SECONDS = 50
+BURST = 200
+
+
+def syslog_lines():
+    start = datetime(2024, 3, 10, 12, 0, 0)
+    return [
+        f"<165>{(start + timedelta(seconds=second)).strftime('%b %d %H:%M:%S')} "
+        f"myserver myapp[{line}]: request {line} served"
+        for second in range(SECONDS)
+        for line in range(BURST)
+    ]
+
+
+def ncsa_lines():
+    start = datetime(2024, 3, 10, 12, 0, 0)
+    return [
+        f"192.168.1.{line % 255} - - "
+        f"[{(start + timedelta(seconds=second)).strftime('%d/%b/%Y:%H:%M:%S')} +0000] "
+        f'"GET /item/{line} HTTP/1.1" 200 {line}'
+        for second in range(SECONDS)
+        for line in range(BURST)
+    ]
+
+
+def rate(transformer, lines) -> float:
+    """Lines transformed per second"""
+    start = perf_counter()
+    for line in lines:
+        transformer.transform(line)
+    return len(lines) / (perf_counter() - start)
+
+
+def main():
+    print(f"{SECONDS} distinct timestamps x {BURST} lines each")
+    for name, transformer, lines in (
+        ("syslog", SyslogTransformer, syslog_lines()),
+        ("ncsa", NcsaTransformer, ncsa_lines()),
+    ):
+        for size in (None, 1, 16, 1024):
+            memo = TimestampMemo(size) if size else None
+            result = rate(transformer(memo=memo), lines)
+            hit_rate = f"{memo.hit_rate:.3f}" if memo else "-"
+            print(f"{name:<8} memo={str(size):<6} {result:>12,.0f} lines/s  hit rate {hit_rate}")
+
+
+if __name__ == "__main__":
+    main()
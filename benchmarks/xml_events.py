@@ -0,0 +1,77 @@
+"""
+The `xml_events` benchmark measures the per-event cost of transforming a Windows Event
+with the single-pass child walk of `WinEvent` against the descendant searches it replaced.
+
+Run from the repository root with `python -m benchmarks.xml_events`
+"""
+from timeit import repeat
+from typing import Optional
+from xml.etree.ElementTree import Element, fromstring
+
+from gla.plugins.transformer.xml_transformer import WinEvent, XMLTransformer
+
+EVENT = (
+    "<Event xmlns='http://schemas.microsoft.com/win/2004/08/events/event'><System>"
+    "<Provider Name='Microsoft-Windows-Security-Auditing' "
+    "Guid='{54849625-5478-4994-a5ba-3e3b0328c30d}'/><EventID>4624</EventID><Version>2</Version>"
+    "<Level>4</Level><Task>12544</Task><Opcode>0</Opcode><Keywords>0x8020000000000000</Keywords>"
+    "<TimeCreated SystemTime='2025-02-07T14:32:44.319460Z'/><EventRecordID>13</EventRecordID>"
+    "<Correlation/><Execution ProcessID='1000' ThreadID='1040'/><Channel>Security</Channel>"
+    "<Computer>devlap</Computer><Security/></System><EventData>"
+    "<Data Name='SubjectUserSid'>S-1-5-18</Data><Data Name='SubjectUserName'>DEVLAP$</Data>"
+    "<Data Name='TargetUserName'>SYSTEM</Data><Data Name='LogonType'>5</Data>"
+    "<Data Name='ProcessName'>C:\\Windows\\System32\\services.exe</Data></EventData></Event>"
+)
+NUMBER = 20000
+
+
+class SearchingWinEvent(WinEvent):
+    """Matches with a descendant search per field, as `WinEvent` used to"""
+
+    def match(self, entry: Element) -> Optional[dict]:
+        ns = self.NS
+        res = {
+            "module": self._attribute(entry, f"{ns}System/{ns}Provider", "Name"),
+            "level": self.LEVELS.get(self._text(entry, f"{ns}System/{ns}Level") or ""),
+            "source": self._text(entry, f"{ns}System/{ns}Computer"),
+            "timestamp": self._attribute(entry, f"{ns}System/{ns}TimeCreated", "SystemTime"),
+        }
+        event_id = self._text(entry, f"{ns}System/{ns}EventID")
+        data_entries = entry.findall(f".//{ns}EventData/{ns}Data")
+        extra_data = {data.get("Name"): data.text for data in data_entries if data.get("Name")}
+        data_pieces = [data.text for data in data_entries if not data.get("Name") and data.text]
+        message_parts = [f"EventID: {event_id}"]
+        if extra_data:
+            message_parts.append(str(extra_data))
+        if data_pieces:
+            message_parts.append(" ".join(data_pieces))
+        res["message"] = " - ".join(message_parts)
+        return res
+
+    def _text(self, entry: Element, path: str) -> Optional[str]:
+        element = entry.find(f".//{path}")
+        return element.text if element is not None else None
+
+    def _attribute(self, entry: Element, path: str, attr: str) -> Optional[str]:
+        element = entry.find(f"./{path}")
+        return element.get(attr) if element is not None else None
+
+
+def per_event(match) -> float:
+    """Best per-event time in microseconds"""
+    event = fromstring(EVENT)
+    best = min(repeat(lambda: match(event), number=NUMBER, repeat=5))
+    return best / NUMBER * 1e6
+
+
+def main():
+    searching = per_event(SearchingWinEvent().match)
+    walking = per_event(WinEvent().match)
+    transform = per_event(XMLTransformer().transform)
+    print(f"descendant searches {searching:>8.2f}us/event")
+    print(f"single-pass walk    {walking:>8.2f}us/event ({searching / walking:.1f}x)")
+    print(f"full transform      {transform:>8.2f}us/event ({1e6 / transform:,.0f} events/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+The `xml_stream` benchmark measures the event rate and peak traced memory of
+`XMLTransformer.transform_file` on Windows Event exports of growing size, showing
+memory stays flat as the file grows.
+
+Run from the repository root with `python -m benchmarks.xml_stream`
+"""
+import os
+import tempfile
+import tracemalloc
+from time import perf_counter
+
+from gla.plugins.transformer.xml_transformer import XMLTransformer
+
+EVENT = (
+    "<Event xmlns='http://schemas.microsoft.com/win/2004/08/events/event'><System>"
+    "<Provider Name='Microsoft-Windows-Security-Auditing'/><EventID>4624</EventID>"
+    "<Level>4</Level><TimeCreated SystemTime='2025-02-07T14:32:{second:02d}.319460Z'/>"
+    "<Computer>devlap</Computer></System><EventData>"
+    "<Data Name='SubjectUserName'>DEVLAP$</Data><Data Name='TargetUserName'>SYSTEM</Data>"
+    "<Data Name='LogonType'>5</Data></EventData></Event>\n"
+)
+SIZES = (1000, 10000, 100000)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        for events in SIZES:
+            path = os.path.join(directory, f"events-{events}.xml")
+            with open(path, "w", encoding="utf-16") as file:
+                file.writelines(EVENT.format(second=event % 60) for event in range(events))
+
+            start = perf_counter()
+            count = sum(1 for _ in XMLTransformer().transform_file(path))
+            elapsed = perf_counter() - start
+
+            tracemalloc.start()
+            sum(1 for _ in XMLTransformer().transform_file(path))
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(
+                f"{count:>8,} events {os.path.getsize(path) / 1024 ** 2:>8.1f} MiB "
+                f"{events / elapsed:>10,.0f} events/s peak {peak / 1024:>8,.1f} KiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+"""
+The `models` module contains the structured data models shared across the application
+"""
@@ -36,6 +36,36 @@ class Log(BaseModel):
     )
     """The name of the host, machine, or thread that generated the log entry"""
 
+    @classmethod
+    def trusted(
+        cls,
+        level: Optional[str] = None,
+        module: Optional[str] = None,
+        message: Optional[str] = None,
+        timestamp: Optional[datetime] = None,
+        source: Optional[str] = None,
+    ) -> "Log":
+        """Creates a `Log` from values already typed by a transformer, skipping validation
+
+        NOTE: meant for internal transformers only, as nothing is validated nor coerced
+        so every value must already be of its field's type. Only the fields given a
+        value count as set
+        """
+        values = {
+            "level": level,
+            "module": module,
+            "message": message,
+            "timestamp": timestamp,
+            "source": source,
+        }
+        # Same state as `construct` leaves, without its per field default lookups
+        log = cls.__new__(cls)
+        object.__setattr__(log, "__dict__", values)
+        object.__setattr__(
+            log, "__fields_set__", {name for name, value in values.items() if value is not None}
+        )
+        return log
+
     def __str__(self):
         parts = []
 
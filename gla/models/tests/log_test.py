@@ -0,0 +1,38 @@
+from datetime import datetime
+
+from pydantic import ValidationError
+from pytest import raises
+
+from gla.models.log import Log
+
+
+def test_trusted_log_matches_validated_log():
+    fields = {
+        "level": "INFO",
+        "module": "api.controller",
+        "message": "Creating new user",
+        "timestamp": datetime(2020, 9, 10),
+        "source": "api-thread",
+    }
+
+    trusted = Log.trusted(**fields)
+
+    assert trusted == Log(**fields)
+    assert str(trusted) == str(Log(**fields))
+    assert trusted.dict() == Log(**fields).dict()
+
+
+def test_trusted_log_fields_set():
+    log = Log.trusted(message="hello world", level=None)
+
+    assert log.dict(exclude_unset=True) == Log(message="hello world").dict(exclude_unset=True)
+    assert log.__fields_set__ == {"message"}
+
+
+def test_trusted_log_still_validates_assignment():
+    log = Log.trusted(message="hello world")
+
+    log.timestamp = "2020-09-10T00:00:00"
+    assert log.timestamp == datetime(2020, 9, 10)
+    with raises(ValidationError):
+        log.timestamp = "not a timestamp"
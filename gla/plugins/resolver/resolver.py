@@ -3,10 +3,46 @@ The `resolver` module provides classes for resolving log entries based on a list
 """
 
 import sys
-from typing import Any, List, Optional
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
 
 from gla.utilities.strategy import ScoringStrategy, Strategy
 
+# Resolutions after which adaptive hit counts are halved, so the order keeps up with the input
+ADAPTIVE_DECAY = 1 << 12
+
+
+class _AdaptiveOrder:
+    """Strategies kept sorted by how often they matched, most often first"""
+
+    def __init__(self, strategies: Sequence[Strategy]):
+        self._strategies = list(strategies)
+        self._hits = [0] * len(self._strategies)
+        self._resolutions = 0
+
+    def match(self, entry: Any) -> Tuple[Optional[Strategy], Optional[Any]]:
+        for index, strategy in enumerate(self._strategies):
+            match = strategy.match(entry)
+            if match:
+                self._hit(index)
+                return strategy, match
+        return None, None
+
+    def _hit(self, index: int):
+        strategies = self._strategies
+        hits = self._hits
+        hits[index] += 1
+        # Moves the strategy ahead of the ones that matched less often
+        while index and hits[index] > hits[index - 1]:
+            hits[index], hits[index - 1] = hits[index - 1], hits[index]
+            strategies[index], strategies[index - 1] = strategies[index - 1], strategies[index]
+            index -= 1
+
+        self._resolutions += 1
+        if self._resolutions == ADAPTIVE_DECAY:
+            self._resolutions = 0
+            self._hits = [count >> 1 for count in hits]
+
 
 class Resolver:
     """
@@ -14,22 +50,34 @@ class Resolver:
     resolution capabilities with a list of strategies
     """
 
-    def __init__(self, strategies: List[Strategy], cache: bool):
+    def __init__(self, strategies: Sequence[Strategy], cache: bool, adaptive: bool = False):
         """
         Create a new `Resolver`
 
         NOTE: cache set to `True` will enable the use of the same strategy for
-        future log entries seen by this instance
+        future log entries seen by this instance. adaptive set to `True` will instead
+        try strategies most often matched first, falling back to the others whenever
+        they miss, so an entry matched by several strategies resolves to the one
+        matched most often rather than the first declared. The strategies are only
+        read, so they may be shared between resolvers
         """
         self._cache = cache
-        self._strategies: List[Strategy] = strategies
+        self._adaptive = adaptive
+        self._strategies: Sequence[Strategy] = strategies
         self._cache_strategy: Optional[Strategy] = None
+        self._order = _AdaptiveOrder(strategies) if adaptive else None
 
     def resolve(self, entry: Any) -> Optional[Any]:
         """Resolves to the correct strategy for the given entry"""
         if self._cache and self._cache_strategy:
             return self._cache_strategy.match(entry)
 
+        if self._order is not None:
+            strategy, match = self._order.match(entry)
+            if match:
+                self._cache_strategy = strategy
+            return match
+
         for strategy in self._strategies:
             match = strategy.match(entry)
             if match:
@@ -38,6 +86,91 @@ class Resolver:
                 return match
         return None
 
+    def binary(self) -> "Resolver":
+        """Creates the same resolver for ASCII byte entries, such as memory-mapped lines
+
+        NOTE: only `RegexStrategy` strategies can resolve byte entries
+        """
+        return Resolver(
+            [strategy.binary() for strategy in self._strategies], self._cache, self._adaptive
+        )
+
+
+class DispatchResolver(Resolver):
+    """
+    The `DispatchResolver` is an extension class to extend
+    resolution capabilities by routing an entry only to the strategies
+    that could possibly match it
+    """
+
+    def __init__(
+        self,
+        strategies: Sequence[Strategy],
+        cache: bool,
+        classify: Callable[[Any], Optional[Hashable]],
+        routes: Dict[Hashable, Sequence[Strategy]],
+        classify_binary: Optional[Callable[[Any], Optional[Hashable]]] = None,
+        adaptive: bool = False,
+    ):
+        """
+        Create a new `DispatchResolver`
+
+        NOTE: `classify` reduces an entry to a route key and `routes` maps each key to
+        the strategies worth trying for it. An entry whose key has no route is never
+        matched, so routes must keep every strategy that could match their entries.
+        `classify_binary` does the same for ASCII byte entries. adaptive set to `True`
+        orders each route by how often its strategies matched
+        """
+        super().__init__(strategies, cache)
+        self._classify = classify
+        self._routes = routes
+        self._classify_binary = classify_binary
+        self._adaptive = adaptive
+        self._orders: Optional[Dict[Hashable, _AdaptiveOrder]] = (
+            {key: _AdaptiveOrder(route) for key, route in routes.items()} if adaptive else None
+        )
+
+    def resolve(self, entry: Any) -> Optional[Any]:
+        """Resolves to the correct strategy among the ones routed for the given entry"""
+        if self._cache and self._cache_strategy:
+            return self._cache_strategy.match(entry)
+
+        if self._orders is not None:
+            order = self._orders.get(self._classify(entry))
+            if order is None:
+                return None
+            strategy, match = order.match(entry)
+            if match:
+                self._cache_strategy = strategy
+            return match
+
+        for strategy in self._routes.get(self._classify(entry), ()):
+            match = strategy.match(entry)
+            if match:
+                # Save strategy for redundant uses
+                self._cache_strategy = strategy
+                return match
+        return None
+
+    def binary(self) -> Resolver:
+        """Creates the same resolver for ASCII byte entries, such as memory-mapped lines
+
+        NOTE: without `classify_binary` every strategy is tried in order
+        """
+        if self._classify_binary is None:
+            return super().binary()
+        twins = {id(strategy): strategy.binary() for strategy in self._strategies}
+        return DispatchResolver(
+            list(twins.values()),
+            self._cache,
+            self._classify_binary,
+            {
+                key: [twins[id(strategy)] for strategy in strategies]
+                for key, strategies in self._routes.items()
+            },
+            adaptive=self._adaptive,
+        )
+
 
 class BestResolver:
     """
@@ -45,10 +178,30 @@ class BestResolver:
     resolution capabilities with a "highest scorer" scoring system
     """
 
-    def __init__(self, strategies: List[ScoringStrategy], cache: bool):
+    def __init__(
+        self,
+        strategies: List[ScoringStrategy],
+        cache: bool,
+        signature: Optional[Callable[[Any], Optional[Hashable]]] = None,
+        size: int = 256,
+    ):
+        """
+        Create a new `BestResolver`
+
+        NOTE: cache set to `True` will enable the use of the same result for
+        future entries seen by this instance. `signature` reduces an entry to what
+        its scores depend on, such as the key set of a record, so the result for each
+        of the `size` most recently seen signatures is reused without scoring again.
+        Entries with a `None` signature are always scored
+        """
+        if size < 1:
+            raise ValueError("signature cache size must be atleast 'one'")
         self._cache = cache
         self._strategies: List[ScoringStrategy] = strategies
         self._cache_value: Optional[Any] = None
+        self._signature = signature
+        self._size = size
+        self._results: "OrderedDict[Hashable, Any]" = OrderedDict()
 
     def resolve(self, entry: Any) -> Any:
         """Resolves to the best strategy based on a "highest scorer" scoring system
@@ -58,6 +211,23 @@ class BestResolver:
         if self._cache and self._cache_value:
             return self._cache_value
 
+        key = None if self._signature is None else self._signature(entry)
+        if key is None:
+            return self._score(entry)
+
+        results = self._results
+        try:
+            value = results[key]
+        except KeyError:
+            value = self._score(entry)
+            results[key] = value
+            if len(results) > self._size:
+                results.popitem(last=False)
+            return value
+        results.move_to_end(key)
+        return value
+
+    def _score(self, entry: Any) -> Any:
         max_scorer = (-sys.maxsize - 1, None)
         for strategy in self._strategies:
             (max_score, _) = max_scorer
@@ -1,6 +1,8 @@
 from re import compile
 
-from gla.plugins.resolver.resolver import BestResolver, Resolver
+from pytest import raises
+
+from gla.plugins.resolver.resolver import BestResolver, DispatchResolver, Resolver
 from gla.utilities.strategy import RegexStrategy, ScoringStrategy
 
 
@@ -71,3 +73,76 @@ def test_best_resolver_cache():
     assert resolve.resolve("test") == "hello_world"
     assert resolve.resolve("longgggggggggg") == "hello_world"
     assert resolve.resolve("verylonggggg") == "hello_world"
+
+
+def test_dispatch_resolver():
+    digits = RegexStrategy(compile(r"(\d+)"))
+    words = RegexStrategy(compile(r"([a-z]+)"))
+    resolve = DispatchResolver(
+        [digits, words],
+        False,
+        lambda entry: "digit" if entry[:1].isdigit() else None,
+        {"digit": [digits]},
+    )
+
+    assert resolve.resolve("2024") is not None
+    assert resolve.resolve("hello") is None
+
+
+def test_resolver_adaptive():
+    date = RegexStrategy(compile(r"^(\d{4}-\d{2}-\d{2})$"))
+    digits = RegexStrategy(compile(r"^(\d+)$"))
+    resolve = Resolver([date, digits], False, True)
+
+    for _ in range(3):
+        assert resolve.resolve("434243") is not None
+    # The most often matched strategy is tried first
+    assert resolve._order._strategies == [digits, date]
+    # Misses of the hot strategy still fall back to the others
+    assert resolve.resolve("2024-04-01").group(1) == "2024-04-01"
+    assert resolve.resolve(" ") is None
+
+
+def test_dispatch_resolver_adaptive():
+    digits = RegexStrategy(compile(r"^(\d+)$"))
+    hexadecimal = RegexStrategy(compile(r"^([\da-f]+)$"))
+    resolve = DispatchResolver(
+        [digits, hexadecimal],
+        False,
+        lambda entry: "digit" if entry[:1].isdigit() else None,
+        {"digit": [digits, hexadecimal]},
+        adaptive=True,
+    )
+
+    for _ in range(3):
+        assert resolve.resolve("4f") is not None
+    assert resolve.resolve("42") is not None
+    assert resolve.resolve("hello") is None
+    assert resolve._orders["digit"]._strategies == [hexadecimal, digits]
+
+
+def test_best_resolver_signature():
+    class CountingStrategy(ScoringStrategy):
+        def __init__(self, field: str):
+            self._field = field
+            self.scored = 0
+
+        def score(self, entry: dict):
+            self.scored += 1
+            return (int(self._field in entry), self._field)
+
+    first, second = CountingStrategy("message"), CountingStrategy("msg")
+    resolve = BestResolver([first, second], False, lambda entry: frozenset(entry), 1)
+
+    assert resolve.resolve({"message": "a"}) == "message"
+    assert resolve.resolve({"message": "b"}) == "message"
+    assert first.scored == 1, "Records of a seen shape should not be scored again"
+    assert resolve.resolve({"msg": "c"}) == "msg"
+    # The first shape was evicted to keep a single signature
+    assert resolve.resolve({"message": "d"}) == "message"
+    assert first.scored == 3
+
+
+def test_best_resolver_invalid_size():
+    with raises(ValueError, match="signature cache size must be atleast 'one'"):
+        BestResolver([], False, lambda entry: entry, 0)
@@ -3,8 +3,8 @@ The `transformer` module is an abstraction layer for converting a single log ite
 `.log` file to a `Log` object for further processing.
 """
 
-from gla.plugins.transformer.transformer import Transformer
 from gla.plugins.transformer.custom_transformer import CustomTransformer
+from gla.plugins.transformer.transformer import Transformer
 
 __all__ = [
     "Transformer",
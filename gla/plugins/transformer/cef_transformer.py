@@ -1,23 +1,92 @@
 """
 The 'cef_transformer' module defines the `CefTransformer` class,
 which is responsible for transforming common event log (CEF) messages into structured
-`Log` objects.
+`Log` objects, and the `CefLog` class, which parses their extensions on first access.
 """
 import re
-from typing import Match, Optional, Union
+from typing import Dict, Match, Optional, Tuple, Union
+
+from pydantic import PrivateAttr
 
 from gla.models.log import Log
 from gla.plugins.resolver.resolver import Resolver
-from gla.plugins.transformer.transformer import BaseTransformerValidator
+from gla.plugins.transformer.transformer import BaseRegexTransformer
 from gla.utilities.strategy import RegexStrategy
 
+# An extension key, starting after a space and ending at an unescaped equals sign
+_KEY = re.compile(r"(?:^| )([\w.\-\[\]]+)=")
+
+# An escape sequence of an extension value, any other backslash being taken literally
+_ESCAPE = re.compile(r"\\([\\|=nr])")
+_ESCAPES = {"n": "\n", "r": "\r"}
+
+
+def _unescape(match: Match) -> str:
+    """Replaces an escaped extension value character, such as `\\n`, with the one it stands for"""
+    char = match.group(1)
+    return _ESCAPES.get(char, char)
+
+
+def parse_extensions(text: str) -> Dict[str, str]:
+    """Parses a CEF extension block into its key value pairs
 
-class CefTransformer(BaseTransformerValidator, Resolver):
+    NOTE: values run until the next key, so they may contain unescaped spaces, while
+    `\\=`, `\\|`, `\\\\`, `\\n` and `\\r` are unescaped and any other backslash is kept
+
+    Args:
+        text (str): the extension block, such as `src=10.0.0.1 act=blocked`
+    """
+    # Splitting on the keys alternates them with their values, after any leading text
+    pieces = _KEY.split(text)
+    extensions = dict(zip(pieces[1::2], map(str.rstrip, pieces[2::2])))
+    if "\\" in text:
+        for key, value in extensions.items():
+            if "\\" in value:
+                extensions[key] = _ESCAPE.sub(_unescape, value)
+    return extensions
+
+
+class CefLog(Log):
+    """
+    The `CefLog` class is a `Log` that keeps the raw extension block of a CEF
+    message and parses it only when its extensions are accessed
+    """
+
+    _raw: Optional[str] = PrivateAttr(default=None)
+    _extensions: Optional[Dict[str, str]] = PrivateAttr(default=None)
+
+    @property
+    def extensions(self) -> Dict[str, str]:
+        """The extension fields, such as `src`, `dst`, `suser` or `act`"""
+        extensions = self._extensions
+        if extensions is None:
+            extensions = parse_extensions(self._raw) if self._raw else {}
+            object.__setattr__(self, "_extensions", extensions)
+        return extensions
+
+
+class CefTransformer(BaseRegexTransformer, Resolver):
     """
     The `CefTransformer` class is responsible for handling transformation
     of common event  log messages
     """
 
+    STRATEGIES: Tuple[RegexStrategy, ...] = (
+        # CEF, whose header fields may hold escaped pipes and backslashes
+        RegexStrategy(
+            re.compile(
+                r"^CEF:(?P<cef>\d+)\|"
+                r"(?P<ven>(?:[^|\\]|\\.)+)\|"
+                r"(?P<prod>(?:[^|\\]|\\.)+)\|"
+                r"(?P<ver>(?:[^|\\]|\\.)+)\|"
+                r"(?P<sig>(?:[^|\\]|\\.)+)\|"
+                r"(?P<msg>(?:[^|\\]|\\.)+)\|"
+                r"(?P<lvl>(?:[^|\\]|\\.)+)\|"
+                r"(?P<ext>.+)"
+            )
+        ),
+    )
+
     def _to_lvl(self, lvl: int) -> Union[str, None]:
         """Converts event integer severity levels to respective severity levels"""
         if lvl > 0 and lvl <= 3:
@@ -37,49 +106,35 @@ class CefTransformer(BaseTransformerValidator, Resolver):
         future log entries seen by this instance
         """
         super().__init__(
-            [
-                # CEF
-                RegexStrategy(
-                    re.compile(
-                        r"^CEF:(?P<cef>\d+)\|"
-                        r"(?P<ven>.+?)\|"
-                        r"(?P<prod>.+?)\|"
-                        r"(?P<ver>.+?)\|"
-                        r"(?P<sig>.+?)\|"
-                        r"(?P<msg>.+?)\|"
-                        r"(?P<lvl>.+?)\|"
-                        r"(?P<ext>.+)"
-                    )
-                ),
-            ],
+            self.STRATEGIES,
             cache,
         )
 
-    def transform(self, entry: str) -> Optional[Log]:
+    def to_log(self, res: Dict[str, Optional[str]]) -> Log:
+        # Some messages may have more metadata than others
+        msg = res.get("msg") or ""
+        ext = res.get("ext")
+        if ext:
+            msg += f" - Extensions: {ext}"
 
-        match: Optional[Match[str]] = self.resolve(entry)
+        lvl = res.get("lvl")
+        lvl_str = None
+        if lvl is not None:
+            lvl_str = self._to_lvl(int(lvl))
 
-        if match:
-            res = match.groupdict()
-
-            # Some messages may have more metadata than others
-            msg = res.get("msg", "")
-            ext = res.get("ext")
-            if ext:
-                msg += f" - Extensions: {ext}"
-
-            lvl = res.get("lvl")
-            lvl_str = None
-            if lvl is not None:
-                lvl_str = self._to_lvl(int(lvl))
+        log = CefLog.trusted(
+            source=f"{res.get('ven')} {res.get('prod')} {res.get('ver')}",
+            module=f"Signature ID: {res.get('sig')}",
+            level=lvl_str,
+            message=msg,
+        )
+        # Extensions are parsed on first access, so header only consumers pay nothing
+        object.__setattr__(log, "_raw", ext)
+        object.__setattr__(log, "_extensions", None)
+        return log
 
-            return Log(
-                source=f"{res.get('ven')} {res.get('prod')} {res.get('ver')}",
-                module=f"Signature ID: {res.get('sig')}",
-                level=lvl_str,
-                message=msg,
-            )
-        return None
+    def starts_record(self, line: str) -> bool:
+        return line.startswith("CEF:")
 
     def validate(self, data: str) -> bool:
         if data == "cef":
@@ -4,13 +4,13 @@ for transforming JSON log messages into structured `Log` objects based on predef
 template supplied from user.
 """
 
-from typing import List, Optional
+import csv
+from operator import itemgetter
+from typing import Iterator, List, Optional, Tuple
 
-import dateparser
-
-from gla.constants import LANGUAGES_SUPPORTED
 from gla.models.log import Log
-from gla.plugins.transformer.transformer import BaseTransformer
+from gla.plugins.transformer.transformer import BUFFER_SIZE, BaseTransformer, TransformBatch
+from gla.utilities.timestamp import TimestampMemo, TimestampParser
 
 # Only allowed template keys
 LOG_HEADERS = {
@@ -22,19 +22,37 @@ LOG_HEADERS = {
     "src",
 }
 
+# Headers holding a single value, in the order of the plan slots
+_SINGLE = ("time", "lvl", "src", "mod")
+
+
+def _pick(pieces: List[str], slots: Tuple[int, ...]) -> Optional[str]:
+    """Gets the last non empty piece among the slots of a repeated header"""
+    for slot in slots:
+        if pieces[slot]:
+            return pieces[slot]
+    return None
+
+
 class CustomTransformer(BaseTransformer):
     """
     The `CustomTransformer` class is responsible for handling transformation
     of user templated log messages
     """
 
-    def __init__(self, template: List[str]):
+    def __init__(
+        self,
+        template: List[str],
+        memo: Optional[TimestampMemo] = None,
+        rest_to_last: bool = False,
+        quoted: bool = False,
+    ):
         """
         A transformer for parsing structured log entries based on a user-defined template.
 
-        The first element in the template is always the delimiter used to split log entries.  
+        The first element in the template is always the delimiter used to split log entries.
         The remaining elements define the expected structure of the log message.
-        
+
         Template Keys:
         - `msg`  : The main content of the entry.
         - `lvl`  : A categorical label representing severity or type.
@@ -49,8 +67,17 @@ class CustomTransformer(BaseTransformer):
         log_entry = "2024-05-09;WARNING;dump.py;mod;System failure detected"
         log = transformer.transform(log_entry)
         ```
+        NOTE: a memo will be consulted before parsing any timestamp. rest_to_last set to
+        `True` will split an entry only as many times as the template needs, so the
+        trailing field, typically `msg`, keeps any further delimiters. quoted set to
+        `True` will split entries as CSV/TSV records with the `csv` module, so a
+        field quoted with `"` may hold the delimiter, quotes doubled as `""` or even
+        line breaks when transformed with `transform_file`. The template is compiled
+        once into the slots each header reads its piece from
+
         Raises:
-            ValueError: If the template is invalid or the log entry does not match the expected format.
+            ValueError: If the template is invalid or the log entry does not match
+                the expected format.
         """
         # Validate template fits standard
         if len(template) <= 1:
@@ -61,9 +88,35 @@ class CustomTransformer(BaseTransformer):
                     continue
                 if item not in LOG_HEADERS:
                     raise ValueError(f"'{item}' is not a valid gla log header")
+        if quoted and len(template[0]) != 1:
+            raise ValueError("quoted templates need a 'single' character delimiter")
         self.delim = template[0]
-        self.template = template[1:len(template)]
-        
+        self._quoted = quoted
+        self.template = template[1 : len(template)]
+        self._timestamps = TimestampParser(memo=memo)
+        self._compile(rest_to_last)
+
+    def _compile(self, rest_to_last: bool):
+        """Compiles the template into the slots each header reads its piece from"""
+        width = len(self.template)
+        self._width = width
+        self._maxsplit = width - 1 if rest_to_last else -1
+        # Quoted records are split fully and their trailing pieces joined back
+        self._rejoin = width - 1 if rest_to_last and self._quoted else None
+
+        # Later pieces of a repeated header win, so slots are kept last first
+        slots = [
+            tuple(i for i in reversed(range(width)) if self.template[i] == header)
+            for header in _SINGLE
+        ]
+        self._repeated = any(len(header) > 1 for header in slots)
+        self._slots: List[Tuple[int, ...]] = slots
+        # A header missing from the template reads the empty piece appended past the end
+        self._single = itemgetter(*(header[0] if header else width for header in slots))
+        message = [i for i, header in enumerate(self.template) if header in ("msg", "ext")]
+        self._message: Optional[int] = message[0] if len(message) == 1 else None
+        # Gets the pieces of a message spread over many slots, always as a tuple
+        self._messages = itemgetter(*message, width) if len(message) > 1 else None
 
     def transform(self, entry: str) -> Optional[Log]:
         """Transforms a log entry into a `Log` object
@@ -74,34 +127,74 @@ class CustomTransformer(BaseTransformer):
         Raises:
             ValueError: If the log entry does not match the expected template.
         """
-        pieces = entry.split(self.delim)
-        if len(self.template) is not len(pieces):
-            raise ValueError(f"{self.template} template does not align with the log message: {entry}")
-        
-        msg = None
-        lvl = None
-        time = None
-        mod = None
-        src = None
-        for i, piece in enumerate(pieces):
-            if self.template[i] == "time" and piece:
-                time = piece
-            elif self.template[i] == "lvl" and piece:
-                lvl = piece
-            elif self.template[i] == "src" and piece:
-                src = piece
-            elif self.template[i] == "mod" and piece:
-                mod = piece
-            elif piece:
-                if msg:
-                    msg += f" {piece}"
-                else:
-                    msg = piece
-
-        return Log(
-            level=lvl,
-            module=mod,
-            message=msg,
-            timestamp=dateparser.parse(time, languages=LANGUAGES_SUPPORTED),
-            source=src
-        )
\ No newline at end of file
+        if self._quoted:
+            return self.transform_record(next(self._reader((entry,)), []))
+        pieces = entry.split(self.delim, self._maxsplit)
+        if len(pieces) != self._width:
+            raise ValueError(
+                f"{self.template} template does not align with the log message: {entry}"
+            )
+        return self._to_log(pieces)
+
+    def transform_record(self, record: List[str]) -> Optional[Log]:
+        """Transforms the fields of a CSV/TSV record into a `Log` object
+
+        Args:
+            record (List[str]): the fields of a record, as read by a `csv` reader
+
+        Raises:
+            ValueError: If the record does not match the expected template.
+        """
+        if self._rejoin is not None and len(record) > self._width:
+            record = record[: self._rejoin] + [self.delim.join(record[self._rejoin :])]
+        if len(record) != self._width:
+            raise ValueError(
+                f"{self.template} template does not align with the log message: "
+                f"{self.delim.join(record)}"
+            )
+        return self._to_log(list(record))
+
+    def transform_file(self, path: str, encoding: str = "utf-8") -> TransformBatch:
+        """Lazily transforms every line of a log file into `Log` objects
+
+        NOTE: quoted templates stream the file through a single `csv` reader instead,
+        so quoted fields may span lines
+
+        Args:
+            path (str): the log file to transform
+            encoding (str): the encoding of the log file
+        """
+        if not self._quoted:
+            return super().transform_file(path, encoding)
+        return TransformBatch(self.transform_record, self._read_records(path, encoding))
+
+    def _reader(self, lines) -> Iterator[List[str]]:
+        return csv.reader(lines, delimiter=self.delim, quotechar='"', doublequote=True)
+
+    def _read_records(self, path: str, encoding: str) -> Iterator[List[str]]:
+        with open(path, "r", encoding=encoding, newline="", buffering=BUFFER_SIZE) as file:
+            yield from self._reader(file)
+
+    def _to_log(self, pieces: List[str]) -> Log:
+        """Builds a `Log` from the pieces of an entry through the compiled slots"""
+        pieces.append("")
+        if self._repeated:
+            time, lvl, src, mod = [_pick(pieces, slots) for slots in self._slots]
+        else:
+            time, lvl, src, mod = self._single(pieces)
+
+        msg: Optional[str]
+        if self._message is not None:
+            msg = pieces[self._message]
+        elif self._messages is not None:
+            msg = " ".join(filter(None, self._messages(pieces)))
+        else:
+            msg = None
+
+        return Log.trusted(
+            level=lvl or None,
+            module=mod or None,
+            message=msg or None,
+            timestamp=self._timestamps.parse(time) if time else None,
+            source=src or None,
+        )
@@ -5,15 +5,54 @@ schema mappings.
 """
 
 from json import JSONDecodeError, loads
-from typing import Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-import dateparser
-
-from gla.constants import LANGUAGES_SUPPORTED
 from gla.models.log import Log
 from gla.plugins.resolver.resolver import BestResolver
 from gla.plugins.transformer.transformer import BaseTransformerValidator
 from gla.utilities.strategy import ScoringStrategy
+from gla.utilities.timestamp import TimestampMemo, TimestampParser
+
+# The `Log` fields a schema mapping can map
+FIELDS = ("level", "module", "source", "timestamp", "message")
+
+# Marks a field missing from a record, as opposed to one set to `null`
+_MISSING = object()
+
+
+def _lookup(node: Any, parts: List[str]) -> Any:
+    """Looks a dotted path up in nested objects, trying the longest flat key first"""
+    if not isinstance(node, dict):
+        return _MISSING
+    for end in range(len(parts), 0, -1):
+        value = node.get(".".join(parts[:end]), _MISSING)
+        if value is _MISSING:
+            continue
+        if end == len(parts):
+            return value
+        value = _lookup(value, parts[end:])
+        if value is not _MISSING:
+            return value
+    return _MISSING
+
+
+def _accessor(path: str) -> Callable[[dict], Any]:
+    """Compiles a field path into a callable getting it out of a record
+
+    NOTE: a dotted path like `log.level` matches a flat `log.level` key as well as
+    a `level` key nested in a `log` object, or any mix of both
+    """
+    if "." not in path:
+        return lambda record: record.get(path, _MISSING)
+    parts = path.split(".")
+
+    def access(record: dict) -> Any:
+        value = record.get(path, _MISSING)
+        if value is _MISSING:
+            return _lookup(record, parts)
+        return value
+
+    return access
 
 
 class JsonStrategy(ScoringStrategy):
@@ -22,14 +61,51 @@ class JsonStrategy(ScoringStrategy):
     """
 
     def __init__(self, mapping: dict):
+        """Create a new `JsonStrategy`
+
+        NOTE: each mapped path is compiled once into an accessor
+
+        Raises:
+            ValueError: if the mapping maps something other than a `Log` field
+        """
+        for field in mapping:
+            if field not in FIELDS:
+                raise ValueError(f"mapping field '{field}' is not a 'Log' field")
         self._mapping = mapping
+        self._accessors: List[Tuple[str, Callable[[dict], Any]]] = [
+            (field, _accessor(path)) for field, path in mapping.items()
+        ]
+
+    @property
+    def mapping(self) -> dict:
+        """The `Log` fields mapped to the paths they are read from"""
+        return self._mapping
 
-    def score(self, entry: dict) -> Tuple[int, dict]:
+    def score(self, entry: dict) -> Tuple[int, "JsonStrategy"]:
         return (
-            sum(1 for field in self._mapping.values() if field in entry),
-            self._mapping,
+            sum(1 for _, access in self._accessors if access(entry) is not _MISSING),
+            self,
         )
 
+    def apply(self, entry: dict) -> Dict[str, Any]:
+        """Gets every mapped `Log` field out of a record, `None` when missing"""
+        fields = {}
+        for field, access in self._accessors:
+            value = access(entry)
+            fields[field] = None if value is _MISSING else value
+        return fields
+
+
+def _signature(entry: Any) -> Optional[frozenset]:
+    """Reduces a record to its nested key sets, which are all a `JsonStrategy` scores"""
+    if not isinstance(entry, dict):
+        return None
+    if dict not in set(map(type, entry.values())):
+        return frozenset(entry)
+    return frozenset(
+        (key, _signature(value)) if isinstance(value, dict) else key for key, value in entry.items()
+    )
+
 
 class JsonTransformer(BaseTransformerValidator, BestResolver):
     """
@@ -37,11 +113,19 @@ class JsonTransformer(BaseTransformerValidator, BestResolver):
     of `json` log messages
     """
 
-    def __init__(self, cache: bool = False):
+    def __init__(
+        self,
+        cache: bool = False,
+        memo: Optional[TimestampMemo] = None,
+        mappings: Optional[List[dict]] = None,
+    ):
         """Create a new `JsonTransformer`
 
         NOTE: cache set to `True` will enable the use of the same strategy for
-        future log entries seen by this instance
+        future log entries seen by this instance, and a memo will be consulted
+        before parsing any timestamp. Without it the schema chosen for a key set
+        is remembered, so mixed schemas are still resolved correctly. `mappings`
+        are registered as with `register`
         """
         super().__init__(
             [
@@ -77,28 +161,60 @@ class JsonTransformer(BaseTransformerValidator, BestResolver):
                 ),
             ],
             cache,
+            _signature,
         )
+        self._timestamps = TimestampParser(memo=memo)
+        for mapping in mappings or ():
+            self.register(mapping)
+
+    def register(self, mapping: dict):
+        """Registers a schema mapping of `Log` fields to the paths they are read from
+
+        NOTE: registered mappings win ties against the built-in ones, the latest first.
+        Paths may be dotted to reach into nested objects
+
+        ```
+        transformer.register({"level": "lvl", "message": "event.text"})
+        ```
+
+        Args:
+            mapping (dict): the `Log` fields mapped to their paths
+
+        Raises:
+            ValueError: if the mapping maps something other than a `Log` field
+        """
+        self._strategies.insert(0, JsonStrategy(mapping))
+        # Schemas chosen so far may no longer be the best
+        self._results.clear()
+        self._cache_value = None
 
     def transform(self, entry: str) -> Optional[Log]:
         try:
-            res: dict = loads(entry.strip())
-            mapping: Optional[dict] = self.resolve(res)
-            if mapping:
-                time = res.get(mapping.get("timestamp"))
-                if time is not None:
-                    time = dateparser.parse(time, languages=LANGUAGES_SUPPORTED)
-                return Log(
-                    level=res.get(mapping.get("level")),
-                    module=res.get(mapping.get("module")),
-                    source=res.get(mapping.get("source")),
-                    timestamp=time,
-                    message=res.get(
-                        mapping.get("message"),
-                    ),
-                )
-            return None
+            res = loads(entry.strip())
         except JSONDecodeError:
             return None
+        if not isinstance(res, dict):
+            return None
+
+        strategy: Optional[JsonStrategy] = self.resolve(res)
+        if strategy is None:
+            return None
+        fields = strategy.apply(res)
+        time = fields.get("timestamp")
+        if time is not None:
+            fields["timestamp"] = self._timestamps.parse(time)
+        return Log(**fields)
+
+    def score(self, sample: List[str]) -> float:
+        if not sample:
+            return 0.0
+        objects = 0
+        for line in sample:
+            try:
+                objects += isinstance(loads(line), dict)
+            except JSONDecodeError:
+                continue
+        return objects / len(sample)
 
     def validate(self, data: str) -> bool:
         if data == "json":
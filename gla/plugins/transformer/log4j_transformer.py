@@ -4,317 +4,583 @@ which is tasked with converting Log4j log messages into structured `Log` objects
 """
 
 import re
-from typing import Match, Optional
+from typing import Callable, Dict, Hashable, List, Match, Optional, Pattern, Sequence, Set, Tuple
 
-import dateparser
-
-from gla.constants import LANGUAGES_SUPPORTED
 from gla.models.log import Log
-from gla.plugins.resolver.resolver import Resolver
-from gla.plugins.transformer.transformer import BaseTransformerValidator
-from gla.utilities.strategy import RegexStrategy
+from gla.plugins.resolver.resolver import DispatchResolver
+from gla.plugins.transformer.transformer import BaseRegexTransformer
+from gla.utilities.strategy import RegexStrategy, Strategy
+from gla.utilities.timestamp import TimestampMemo, TimestampParser
+
+_LEVELS = frozenset(("ERROR", "WARN", "INFO", "DEBUG", "TRACE"))
+_TOKEN = re.compile(r"\S+")
+_TIME = re.compile(r"\d{2,4}-\d{2,4}-\d{2,4}")
+_MOD = re.compile(r"[\w.]+")
+
+# Consecutive lines the learned layout misses but a regex matches before it is learned again
+RELEARN = 16
+
+# Each kind of token a field can be, in the order they are told apart
+_KINDS = (
+    ("thread", r"\[\S*"),
+    ("time", r"\d{2,4}-\d{2,4}-\d{2,4}(?!\S)"),
+    ("lvl", r"(?:ERROR|WARN|INFO|DEBUG|TRACE)(?!\S)"),
+    ("mod", r"[\w.]+(?!\S)"),
+    ("dash", r"-(?!\S)"),
+)
+
+# The kinds of token each field of a layout can be, the message being any of them.
+# A level keyword is also a valid module name
+_FITS = {
+    "thread": ("thread",),
+    "time": ("time",),
+    "lvl": ("lvl",),
+    "mod": ("mod", "lvl"),
+    "-": ("dash",),
+}
+
+# A field in the source of a layout, opening the optional thread group or not, or the
+# dash before a message
+_FIELD = re.compile(r"(\(\?:\\\[)?\(\?P<(\w+)>|-\\s\+")
+
+
+def _thread(token: str) -> bool:
+    """Whether a token is a bracketed thread name, such as `[main]`"""
+    return len(token) > 2 and token[0] == "[" and token[-1] == "]"
+
+
+# The check of each token a layout is made of, the message aside
+_CHECKS: Dict[str, Callable[[str], object]] = {
+    "time": _TIME.fullmatch,
+    "lvl": _LEVELS.__contains__,
+    "mod": _MOD.fullmatch,
+    "thread": _thread,
+    "-": "-".__eq__,
+}
+
+
+def _learn(entry: str, match: Match) -> Optional[Tuple[str, ...]]:
+    """Learns the order of the whitespace separated fields of a matched line
+
+    NOTE: the message is a single field, however many tokens it spans
+    """
+    spans = {name: match.span(name) for name, value in match.groupdict().items() if value}
+    start, end = spans.pop("msg")
+    if "thread" in spans:
+        thread = spans.pop("thread")
+        spans["thread"] = (thread[0] - 1, thread[1] + 1)
+    fields = {span: name for name, span in spans.items()}
+
+    layout: List[str] = []
+    for token in _TOKEN.finditer(entry):
+        if token.start() >= start and token.end() <= end:
+            if not layout or layout[-1] != "msg":
+                layout.append("msg")
+            continue
+        field = fields.get(token.span())
+        if field is None and token.group() == "-":
+            field = "-"
+        if field is None:
+            return None
+        layout.append(field)
+    return tuple(layout) if layout.count("msg") == 1 else None
+
+
+def _compile(layout: Tuple[str, ...]) -> Callable[[str], Optional[Dict[str, Optional[str]]]]:
+    """Compiles a learned layout into a parser splitting a line at fixed token positions
+
+    NOTE: the tokens before the message are split from the left and the ones after it
+    from the right, each then checked at its position
+    """
+    at = layout.index("msg")
+    before = at
+    after = len(layout) - at - 1
+    checks = [
+        (position, field, _CHECKS[field]) for position, field in enumerate(layout) if field != "msg"
+    ]
+    separators = [(position, check) for position, field, check in checks if field == "-"]
+    checks = [check for check in checks if check[1] != "-"]
+
+    def parse(entry: str) -> Optional[Dict[str, Optional[str]]]:
+        parts = entry.split(None, before)
+        if len(parts) <= before:
+            return None
+        if after:
+            rest = parts.pop().rsplit(None, after)
+            if len(rest) <= after:
+                return None
+            parts += rest
+        for position, check in separators:
+            if not check(parts[position]):
+                return None
+        res: Dict[str, Optional[str]] = {"thread": None, "msg": parts[at]}
+        for position, field, check in checks:
+            token = parts[position]
+            if not check(token):
+                return None
+            # A thread is checked with its brackets, which are not part of its name
+            res[field] = token[1:-1] if field == "thread" else token
+        return res
+
+    return parse
+
+
+def _leading() -> Tuple[str, Dict[str, Tuple[str, Optional[str]]]]:
+    """Builds the pattern classifying the first two tokens of a line, along with the
+    kinds each of its groups stands for
+
+    NOTE: the group matched last names the kinds of both tokens, so a line is classified
+    by a single match. A second token of no kind, or none at all, is `None`
+    """
+    branches = []
+    kinds: Dict[str, Tuple[str, Optional[str]]] = {}
+    for first, token in _KINDS:
+        seconds = []
+        for second, following in _KINDS:
+            seconds.append(f"(?P<{first}_{second}>{following})")
+            kinds[f"{first}_{second}"] = (first, second)
+        branches.append(f"(?P<{first}>{token})(?:\\s+(?:{'|'.join(seconds)}))?")
+        kinds[first] = (first, None)
+    return f"(?:{'|'.join(branches)})", kinds
+
+
+_LEADING, _LEADING_KINDS = _leading()
+_LEAD = re.compile(_LEADING)
+_LEAD_BINARY = re.compile(_LEADING.encode("ascii"))
+
+
+def _classify(entry: str) -> Optional[Tuple[str, Optional[str]]]:
+    """Classifies the first two tokens of a log4j line into the kinds of field they could be"""
+    lead = _LEAD.match(entry)
+    # Every branch opens with a named group, so a match always has a last one
+    return _LEADING_KINDS[lead.lastgroup] if lead is not None else None  # type: ignore[index]
+
+
+def _classify_binary(entry: bytes) -> Optional[Tuple[str, Optional[str]]]:
+    """Classifies the first two tokens of an ASCII byte log4j line, as `_classify` does"""
+    lead = _LEAD_BINARY.match(entry)
+    # Group names are text, even for a byte pattern
+    return _LEADING_KINDS[lead.lastgroup] if lead is not None else None  # type: ignore[index]
+
+
+def _starts(line: str) -> bool:
+    """Whether a log4j line starts a record, judging by its leading fields only
+
+    NOTE: a module alone is not enough as any word could be one, such as the `at`
+    of a stack frame, so it must be followed by another field
+    """
+    kinds = _classify(line)
+    if kinds is None:
+        return False
+    first, second = kinds
+    return first != "mod" or second not in (None, "mod")
+
+
+def _fields(pattern: Pattern) -> List[Tuple[str, bool]]:
+    """Gets the fields of a layout in order, each with whether it is an optional thread
+
+    NOTE: the dash before a message counts as a field, named `-`
+    """
+    return [(name or "-", bool(optional)) for optional, name in _FIELD.findall(pattern.pattern)]
+
+
+def _leads(strategy: RegexStrategy) -> Set[Tuple[str, ...]]:
+    """Gets the pairs of fields the first two tokens of a layout's lines can be
+
+    NOTE: an optional thread may be left out or repeated, so the field after it can
+    lead as well as another thread
+    """
+    leads: Set[Tuple[str, ...]] = {()}
+    for field, optional in _fields(strategy.pattern):
+        grown = set()
+        for lead in leads:
+            if len(lead) == 2:
+                grown.add(lead)
+                continue
+            if optional:
+                grown.add(lead)
+                grown.add((lead + (field, field))[:2])
+            grown.add(lead + (field,))
+        leads = grown
+    return {lead for lead in leads if len(lead) == 2}
+
+
+def _fits(field: str, kind: Optional[str]) -> bool:
+    """Whether a token of a kind can be a field of a layout"""
+    return field == "msg" or kind in _FITS[field]
 
 
-class Log4jTransformer(BaseTransformerValidator, Resolver):
+def _route(strategies: Sequence[RegexStrategy]) -> Dict[Hashable, Sequence[Strategy]]:
+    """Routes the kinds of the first two tokens to the layouts whose lines could start
+    with them, in order, leaving out the kinds no layout starts with
+    """
+    leads = [_leads(strategy) for strategy in strategies]
+    routes: Dict[Hashable, Sequence[Strategy]] = {}
+    for first, _ in _KINDS:
+        for second in (None, *(kind for kind, _ in _KINDS)):
+            route = [
+                strategy
+                for strategy, lead in zip(strategies, leads)
+                if any(_fits(one, first) and _fits(two, second) for one, two in lead)
+            ]
+            if route:
+                routes[(first, second)] = route
+    return routes
+
+
+class Log4jTransformer(BaseRegexTransformer, DispatchResolver):
     """
     The `Log4jTransformer` class is responsible for handling transformation
     of `log4j` log messages
     """
 
-    def __init__(self, cache: bool = False):
+    STRATEGIES: Tuple[RegexStrategy, ...] = (
+        RegexStrategy(
+            re.compile(
+                r"^(?P<time>\d{4}-\d{2}-\d{2})\s+"
+                r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
+                r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
+                r"(?P<mod>[\w.]+)\s+-\s+"
+                r"(?P<msg>.+)"
+            )
+        ),
+        RegexStrategy(
+            re.compile(
+                r"^(?P<time>\d{2}-\d{4}-\d{2})\s+"
+                r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
+                r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
+                r"(?P<mod>[\w.]+)\s+-\s+"
+                r"(?P<msg>.+)"
+            )
+        ),
+        RegexStrategy(
+            re.compile(
+                r"^(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
+                r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
+                r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
+                r"(?P<mod>[\w.]+)\s+-\s+"
+                r"(?P<msg>.+)"
+            )
+        ),
+        RegexStrategy(
+            re.compile(
+                r"^(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
+                r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
+                r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
+                r"(?P<mod>[\w.]+)\s+-\s+"
+                r"(?P<msg>.+)"
+            )
+        ),
+        RegexStrategy(
+            re.compile(
+                r"^(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
+                r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
+                r"(?P<mod>[\w.]+)\s+-\s+"
+                r"(?P<msg>.*\S)\s+"
+                r"\[(?P<thread>[^\s]+)\]"
+            )
+        ),
+        RegexStrategy(
+            re.compile(
+                r"^(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
+                r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
+                r"(?P<mod>[\w.]+)\s+"
+                r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
+                r"-\s+(?P<msg>.+)"
+            )
+        ),
+        RegexStrategy(
+            re.compile(
+                r"^(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
+                r"(?P<mod>[\w.]+)\s+"
+                r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
+                r"-\s+(?P<msg>.*\S)\s+"
+                r"\[(?P<thread>[^\s]+)\]"
+            )
+        ),
+        RegexStrategy(
+            re.compile(
+                r"^(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
+                r"(?P<mod>[\w.]+)\s+-\s+"
+                r"(?P<msg>.*\S)\s+"
+                r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
+                r"\[(?P<thread>[^\s]+)\]"
+            )
+        ),
+        RegexStrategy(
+            re.compile(
+                r"^(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
+                r"(?P<mod>[\w.]+)\s+-\s+"
+                r"(?P<msg>.*\S)\s+"
+                r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
+                r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)"
+            )
+        ),
+        RegexStrategy(
+            re.compile(
+                r"^(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
+                r"-\s+(?P<msg>.*\S)\s+"
+                r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
+                r"(?P<mod>[\w.]+)\s+"
+                r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)"
+            )
+        ),
+        RegexStrategy(
+            re.compile(
+                r"^(?:\[(?P<thread>[^\s]+)\]\s+)*"
+                r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
+                r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
+                r"(?P<mod>[\w.]+)\s+-\s+"
+                r"(?P<msg>.+)"
+            )
+        ),
+        RegexStrategy(
+            re.compile(
+                r"^(?:\[(?P<thread>[^\s]+)\]\s+)*"
+                r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
+                r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
+                r"(?P<mod>[\w.]+)\s+-\s+"
+                r"(?P<msg>.+)"
+            )
+        ),
+        RegexStrategy(
+            re.compile(
+                r"^(?:\[(?P<thread>[^\s]+)\]\s+)*"
+                r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
+                r"(?P<mod>[\w.]+)\s+-\s+"
+                r"(?P<msg>.*\S)\s+"
+                r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})"
+            )
+        ),
+        RegexStrategy(
+            re.compile(
+                r"^(?:\[(?P<thread>[^\s]+)\]\s+)*"
+                r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
+                r"(?P<mod>[\w.]+)\s+"
+                r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
+                r"-\s+(?P<msg>.+)"
+            )
+        ),
+        RegexStrategy(
+            re.compile(
+                r"^(?:\[(?P<thread>[^\s]+)\]\s+)*"
+                r"(?P<mod>[\w.]+)\s+"
+                r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
+                r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
+                r"-\s+(?P<msg>.+)"
+            )
+        ),
+        RegexStrategy(
+            re.compile(
+                r"^(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
+                r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
+                r"(?P<mod>[\w.]+)\s+-\s+"
+                r"(?P<msg>.*\S)\s+"
+                r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})"
+            )
+        ),
+        RegexStrategy(
+            re.compile(
+                r"^(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
+                r"(?P<mod>[\w.]+)\s+"
+                r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
+                r"(?P<msg>.*\S)\s+"
+                r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})"
+            )
+        ),
+        RegexStrategy(
+            re.compile(
+                r"^(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
+                r"(?P<mod>[\w.]+)\s+-\s+"
+                r"(?P<msg>.*\S)\s+"
+                r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
+                r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})"
+            )
+        ),
+        RegexStrategy(
+            re.compile(
+                r"^(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
+                r"(?P<mod>[\w.]+)\s+-\s+"
+                r"(?P<msg>.*\S)\s+"
+                r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
+                r"\[(?P<thread>[^\s]+)\]"
+            )
+        ),
+        RegexStrategy(
+            re.compile(
+                r"^(?P<mod>[\w.]+)\s+"
+                r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
+                r"-\s+(?P<msg>.*\S)\s+"
+                r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
+                r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)"
+            )
+        ),
+        RegexStrategy(
+            re.compile(
+                r"^(?P<mod>[\w.]+)\s+"
+                r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
+                r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
+                r"(?P<msg>.*\S)\s+"
+                r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)"
+            )
+        ),
+        RegexStrategy(
+            re.compile(
+                r"^(?P<mod>[\w.]+)\s+"
+                r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
+                r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
+                r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
+                r"-\s+(?P<msg>.+)"
+            )
+        ),
+        RegexStrategy(
+            re.compile(
+                r"^(?P<mod>[\w.]+)\s+"
+                r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
+                r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
+                r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
+                r"-\s+(?P<msg>.+)"
+            )
+        ),
+        RegexStrategy(
+            re.compile(
+                r"^(?P<mod>[\w.]+)\s+"
+                r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
+                r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
+                r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
+                r"-\s+(?P<msg>.+)"
+            )
+        ),
+        RegexStrategy(
+            re.compile(
+                r"^(?P<mod>[\w.]+)\s+"
+                r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
+                r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
+                r"-\s+(?P<msg>.*\S)\s+"
+                r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})"
+            )
+        ),
+        RegexStrategy(
+            re.compile(
+                r"^(?P<mod>[\w.]+)\s+"
+                r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
+                r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
+                r"(?P<msg>.*\S)\s+"
+                r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})"
+            )
+        ),
+        RegexStrategy(
+            re.compile(
+                r"^(?P<mod>[\w.]+)\s+"
+                r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
+                r"-\s+(?P<msg>.*\S)\s+"
+                r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
+                r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})"
+            )
+        ),
+        RegexStrategy(
+            re.compile(
+                r"^(?P<mod>[\w.]+)\s+"
+                r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
+                r"-\s+(?P<msg>.*\S)\s+"
+                r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
+                r"\[(?P<thread>[^\s]+)\]"
+            )
+        ),
+        RegexStrategy(
+            re.compile(
+                r"^(?P<mod>[\w.]+)\s+"
+                r"-\s+(?P<msg>.*\S)\s+"
+                r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
+                r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
+                r"\[(?P<thread>[^\s]+)\]"
+            )
+        ),
+        RegexStrategy(
+            re.compile(
+                r"^(?P<mod>[\w.]+)\s+"
+                r"-\s+(?P<msg>.*\S)\s+"
+                r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
+                r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
+                r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)"
+            )
+        ),
+    )
+    ROUTES = _route(STRATEGIES)
+
+    def __init__(
+        self,
+        cache: bool = False,
+        memo: Optional[TimestampMemo] = None,
+        adaptive: bool = False,
+        learn: bool = False,
+    ):
         """Create a new `Log4jTransformer`
 
         NOTE: cache set to `True` will enable the use of the same strategy for
-        future log entries seen by this instance
+        future log entries seen by this instance, adaptive set to `True` will try
+        the layouts most often matched first, and a memo will be consulted before
+        parsing any timestamp. Learn set to `True` will learn the field order of the
+        first matched line and parse the following lines by their token positions,
+        the layouts only being tried on the lines it does not fit, and learned again
+        once `RELEARN` of those in a row matched
         """
-        super().__init__(
-            [
-                RegexStrategy(
-                    re.compile(
-                        r"^(?P<time>\d{4}-\d{2}-\d{2})\s+"
-                        r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
-                        r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
-                        r"(?P<mod>[\w.]+)\s+-\s+"
-                        r"(?P<msg>.+)"
-                    )
-                ),
-                RegexStrategy(
-                    re.compile(
-                        r"^(?P<time>\d{2}-\d{4}-\d{2})\s+"
-                        r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
-                        r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
-                        r"(?P<mod>[\w.]+)\s+-\s+"
-                        r"(?P<msg>.+)"
-                    )
-                ),
-                RegexStrategy(
-                    re.compile(
-                        r"^(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
-                        r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
-                        r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
-                        r"(?P<mod>[\w.]+)\s+-\s+"
-                        r"(?P<msg>.+)"
-                    )
-                ),
-                RegexStrategy(
-                    re.compile(
-                        r"^(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
-                        r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
-                        r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
-                        r"(?P<mod>[\w.]+)\s+-\s+"
-                        r"(?P<msg>.+)"
-                    )
-                ),
-                RegexStrategy(
-                    re.compile(
-                        r"^(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
-                        r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
-                        r"(?P<mod>[\w.]+)\s+-\s+"
-                        r"(?P<msg>.+)\s+"
-                        r"\[(?P<thread>[^\s]+)\]"
-                    )
-                ),
-                RegexStrategy(
-                    re.compile(
-                        r"^(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
-                        r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
-                        r"(?P<mod>[\w.]+)\s+"
-                        r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
-                        r"-\s+(?P<msg>.+)"
-                    )
-                ),
-                RegexStrategy(
-                    re.compile(
-                        r"^(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
-                        r"(?P<mod>[\w.]+)\s+"
-                        r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
-                        r"-\s+(?P<msg>.+)\s+"
-                        r"\[(?P<thread>[^\s]+)\]"
-                    )
-                ),
-                RegexStrategy(
-                    re.compile(
-                        r"^(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
-                        r"(?P<mod>[\w.]+)\s+-\s+"
-                        r"(?P<msg>.+)\s+"
-                        r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
-                        r"\[(?P<thread>[^\s]+)\]"
-                    )
-                ),
-                RegexStrategy(
-                    re.compile(
-                        r"^(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
-                        r"(?P<mod>[\w.]+)\s+-\s+"
-                        r"(?P<msg>.+)\s+"
-                        r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
-                        r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)"
-                    )
-                ),
-                RegexStrategy(
-                    re.compile(
-                        r"^(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
-                        r"-\s+(?P<msg>.+)\s+"
-                        r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
-                        r"(?P<mod>[\w.]+)\s+"
-                        r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)"
-                    )
-                ),
-                RegexStrategy(
-                    re.compile(
-                        r"^(?:\[(?P<thread>[^\s]+)\]\s+)*"
-                        r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
-                        r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
-                        r"(?P<mod>[\w.]+)\s+-\s+"
-                        r"(?P<msg>.+)"
-                    )
-                ),
-                RegexStrategy(
-                    re.compile(
-                        r"^(?:\[(?P<thread>[^\s]+)\]\s+)*"
-                        r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
-                        r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
-                        r"(?P<mod>[\w.]+)\s+-\s+"
-                        r"(?P<msg>.+)"
-                    )
-                ),
-                RegexStrategy(
-                    re.compile(
-                        r"^(?:\[(?P<thread>[^\s]+)\]\s+)*"
-                        r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
-                        r"(?P<mod>[\w.]+)\s+-\s+"
-                        r"(?P<msg>.+)\s+"
-                        r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})"
-                    )
-                ),
-                RegexStrategy(
-                    re.compile(
-                        r"^(?:\[(?P<thread>[^\s]+)\]\s+)*"
-                        r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
-                        r"(?P<mod>[\w.]+)\s+"
-                        r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
-                        r"-\s+(?P<msg>.+)"
-                    )
-                ),
-                RegexStrategy(
-                    re.compile(
-                        r"^(?:\[(?P<thread>[^\s]+)\]\s+)*"
-                        r"(?P<mod>[\w.]+)\s+"
-                        r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
-                        r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
-                        r"-\s+(?P<msg>.+)"
-                    )
-                ),
-                RegexStrategy(
-                    re.compile(
-                        r"^(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
-                        r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
-                        r"(?P<mod>[\w.]+)\s+-\s+"
-                        r"(?P<msg>.+)\s+"
-                        r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})"
-                    )
-                ),
-                RegexStrategy(
-                    re.compile(
-                        r"^(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
-                        r"(?P<mod>[\w.]+)\s+"
-                        r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
-                        r"(?P<msg>.+)\s+"
-                        r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})"
-                    )
-                ),
-                RegexStrategy(
-                    re.compile(
-                        r"^(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
-                        r"(?P<mod>[\w.]+)\s+-\s+"
-                        r"(?P<msg>.+)\s+"
-                        r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
-                        r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})"
-                    )
-                ),
-                RegexStrategy(
-                    re.compile(
-                        r"^(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
-                        r"(?P<mod>[\w.]+)\s+-\s+"
-                        r"(?P<msg>.+)\s+"
-                        r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
-                        r"\[(?P<thread>[^\s]+)\]"
-                    )
-                ),
-                RegexStrategy(
-                    re.compile(
-                        r"^(?P<mod>[\w.]+)\s+"
-                        r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
-                        r"-\s+(?P<msg>.+)\s+"
-                        r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
-                        r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)"
-                    )
-                ),
-                RegexStrategy(
-                    re.compile(
-                        r"^(?P<mod>[\w.]+)\s+"
-                        r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
-                        r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
-                        r"(?P<msg>.+)\s+"
-                        r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)"
-                    )
-                ),
-                RegexStrategy(
-                    re.compile(
-                        r"^(?P<mod>[\w.]+)\s+"
-                        r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
-                        r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
-                        r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
-                        r"-\s+(?P<msg>.+)"
-                    )
-                ),
-                RegexStrategy(
-                    re.compile(
-                        r"^(?P<mod>[\w.]+)\s+"
-                        r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
-                        r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
-                        r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
-                        r"-\s+(?P<msg>.+)"
-                    )
-                ),
-                RegexStrategy(
-                    re.compile(
-                        r"^(?P<mod>[\w.]+)\s+"
-                        r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
-                        r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
-                        r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
-                        r"-\s+(?P<msg>.+)"
-                    )
-                ),
-                RegexStrategy(
-                    re.compile(
-                        r"^(?P<mod>[\w.]+)\s+"
-                        r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
-                        r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
-                        r"-\s+(?P<msg>.+)\s+"
-                        r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})"
-                    )
-                ),
-                RegexStrategy(
-                    re.compile(
-                        r"^(?P<mod>[\w.]+)\s+"
-                        r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
-                        r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
-                        r"(?P<msg>.+)\s+"
-                        r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})"
-                    )
-                ),
-                RegexStrategy(
-                    re.compile(
-                        r"^(?P<mod>[\w.]+)\s+"
-                        r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
-                        r"-\s+(?P<msg>.+)\s+"
-                        r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
-                        r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})"
-                    )
-                ),
-                RegexStrategy(
-                    re.compile(
-                        r"^(?P<mod>[\w.]+)\s+"
-                        r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
-                        r"-\s+(?P<msg>.+)\s+"
-                        r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
-                        r"\[(?P<thread>[^\s]+)\]"
-                    )
-                ),
-                RegexStrategy(
-                    re.compile(
-                        r"^(?P<mod>[\w.]+)\s+"
-                        r"-\s+(?P<msg>.+)\s+"
-                        r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
-                        r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)\s+"
-                        r"\[(?P<thread>[^\s]+)\]"
-                    )
-                ),
-                RegexStrategy(
-                    re.compile(
-                        r"^(?P<mod>[\w.]+)\s+"
-                        r"-\s+(?P<msg>.+)\s+"
-                        r"(?P<time>\d{2,4}-\d{2,4}-\d{2,4})\s+"
-                        r"(?:\[(?P<thread>[^\s]+)\]\s+)*"
-                        r"(?P<lvl>ERROR|WARN|INFO|DEBUG|TRACE)"
-                    )
-                ),
-            ],
-            cache,
-        )
+        super().__init__(self.STRATEGIES, cache, _classify, self.ROUTES, _classify_binary, adaptive)
+        self._timestamps = TimestampParser(memo=memo)
+        self._learning = learn
+        self._learned = False
+        self._layout: Optional[Callable[[str], Optional[Dict[str, Optional[str]]]]] = None
+        self._misses = 0
 
     def transform(self, entry: str) -> Optional[Log]:
-        match: Optional[Match[str]] = self.resolve(entry)
-        if match:
-            res = match.groupdict()
-            return Log(
-                level=res.get("lvl"),
-                module=res.get("mod"),
-                source=res.get("thread"),
-                timestamp=(dateparser.parse(res["time"], languages=LANGUAGES_SUPPORTED)),
-                message=res.get("msg"),
-            )
-        return None
+        if self._layout is not None:
+            res = self._layout(entry)
+            if res is not None:
+                self._misses = 0
+                return self.to_log(res)
+
+        match = self.resolve(entry)
+        if not match:
+            return None
+        if self._learning:
+            self._observe(entry, match)
+        return self.to_log(match.groupdict())
+
+    def ascii_transform(self) -> Callable[[bytes], Optional[Log]]:
+        if not self._learning:
+            return super().ascii_transform()
+        # Layouts are learned from, and applied to, decoded lines
+        transform = self.transform
+        return lambda entry: transform(entry.decode("ascii"))
+
+    def _observe(self, entry: str, match: Match):
+        """Learns the layout of a matched line, unless one was learned a few lines ago
+
+        NOTE: a line whose layout cannot be learned, such as one with text after its
+        last field, keeps the previously learned layout
+        """
+        self._misses += 1
+        if self._learned and self._misses < RELEARN:
+            return
+        self._learned = True
+        self._misses = 0
+        layout = _learn(entry, match)
+        if layout is not None:
+            self._layout = _compile(layout)
+
+    def to_log(self, res: Dict[str, Optional[str]]) -> Log:
+        time = res["time"]
+        return Log.trusted(
+            level=res.get("lvl"),
+            module=res.get("mod"),
+            source=res.get("thread"),
+            timestamp=self._timestamps.parse(time) if time else None,
+            message=res.get("msg"),
+        )
+
+    def starts_record(self, line: str) -> bool:
+        # Stack frames are told apart by their fields, so indentation does not matter
+        return _starts(line.lstrip())
 
     def validate(self, data: str) -> bool:
         if data == "log4j":
@@ -4,89 +4,224 @@ NCSA log entries into structured `Log` objects. It supports both the NCSA Combin
 Log Format (CLF) and the standard NCSA CLF
 """
 import re
-from datetime import datetime
-from typing import Match, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Optional, Tuple
 
 from gla.models.log import Log
 from gla.plugins.resolver.resolver import Resolver
-from gla.plugins.transformer.transformer import BaseTransformerValidator
+from gla.plugins.transformer.transformer import BaseRegexTransformer
 from gla.utilities.strategy import RegexStrategy
+from gla.utilities.timestamp import TimestampMemo
 
+_MONTHS = {
+    month: number
+    for number, month in enumerate(
+        ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"), 1
+    )
+}
 
-class NcsaTransformer(BaseTransformerValidator, Resolver):
+# Time zones already built, by their `+hhmm` offset
+_ZONES: Dict[str, timezone] = {}
+
+# The host a line starts with, as the NCSA patterns accept it
+_HOST = re.compile(r"[\w.:\]\[]+")
+
+
+def _zone(offset: str) -> timezone:
+    """Gets the time zone of a `+hhmm` offset, building it on first use"""
+    zone = _ZONES.get(offset)
+    if zone is None:
+        delta = timedelta(hours=int(offset[1:3]), minutes=int(offset[3:5]))
+        zone = timezone(-delta if offset[0] == "-" else delta)
+        _ZONES[offset] = zone
+    return zone
+
+
+def _to_datetime(time: str) -> datetime:
+    """Parses a `10/Mar/2024:12:34:56 +0000` timestamp by position
+
+    NOTE: anything else, numbers that are not exactly as wide as their field
+    included, falls back to `strptime`
+    """
+    month = _MONTHS.get(time[3:6])
+    if (
+        month is None
+        or len(time) != 26
+        or time[2] != "/"
+        or time[6] != "/"
+        or time[11] != ":"
+        or time[20] != " "
+        or time[21] not in "+-"
+        or not (
+            time[0:2] + time[7:11] + time[12:14] + time[15:17] + time[18:20] + time[22:26]
+        ).isdigit()
+    ):
+        return datetime.strptime(time, "%d/%b/%Y:%H:%M:%S %z")
+    try:
+        return datetime(
+            int(time[7:11]),
+            month,
+            int(time[0:2]),
+            int(time[12:14]),
+            int(time[15:17]),
+            int(time[18:20]),
+            tzinfo=_zone(time[21:26]),
+        )
+    except ValueError:
+        return datetime.strptime(time, "%d/%b/%Y:%H:%M:%S %z")
+
+
+def _field(value: str) -> Optional[str]:
+    """Gets the value of a field, `None` when it is left out as `-`"""
+    return None if value == "-" else value
+
+
+def _tokenize(entry: str) -> Optional[Dict[str, Optional[str]]]:
+    """Splits a CLF or combined line by walking its fixed structure once
+
+    NOTE: gives `None` for any line that cannot be split unambiguously, such as
+    one with quotes in its request, which is then left to the regular expressions
+    """
+    try:
+        host, ident, user, rest = entry.split(" ", 3)
+    except ValueError:
+        return None
+    if _HOST.fullmatch(host) is None:
+        return None
+    if (ident != "-" and "-" in ident) or (user != "-" and "-" in user):
+        return None
+
+    close = rest.find('] "')
+    if not rest.startswith("[") or close < 2 or rest.find('] "', close + 3) != -1:
+        return None
+    start = close + 3
+    end = rest.find('" ', start)
+    if end <= start or rest[end - 1] == "\\":
+        return None
+
+    tail = rest[end + 2 :].split(" ", 2)
+    if len(tail) < 2 or not tail[0].isdecimal() or not tail[1].isdecimal():
+        return None
+    res = {
+        "host": host,
+        "ident": _field(ident),
+        "user": _field(user),
+        "time": rest[1:close],
+        "req": rest[start:end],
+        "status": tail[0],
+        "size": tail[1],
+        "ref": None,
+        "agent": None,
+        "cook": None,
+    }
+    if len(tail) == 3:
+        quoted = tail[2]
+        if len(quoted) < 2 or quoted[0] != '"' or quoted[-1] != '"':
+            return None
+        fields = quoted[1:-1].split('" "')
+        if len(fields) > 3 or not all(fields):
+            return None
+        # The referrer, user agent and cookie, in that order, as many as the line has
+        for name, value in zip(("ref", "agent", "cook"), fields):
+            res[name] = _field(value)
+    return res
+
+
+class NcsaTransformer(BaseRegexTransformer, Resolver):
     """
     The `NcsaTransformer` class is responsible for handling transformation
     of common web servers `ncsa` log messages
     """
 
-    def __init__(self, cache: bool = False):
+    STRATEGIES: Tuple[RegexStrategy, ...] = (
+        # NCSA COMBINED CLF, with a referrer and optionally a user agent and a cookie
+        RegexStrategy(
+            re.compile(
+                r"(?P<host>[\w.:\]\[]+) "
+                r"(?:-|(?P<ident>[^\s-]+)) "
+                r"(?:-|(?P<user>[^\s-]+)) "
+                r"\[(?P<time>[^\]]+)\] "
+                r'"(?P<req>(?:[^"]|"(?! \d+ \d+))+)" '
+                r"(?P<status>\d+) "
+                r"(?P<size>\d+) "
+                r'"(?:-|(?P<ref>(?:[^"]|"(?! "))+))"'
+                r'(?: "(?:-|(?P<agent>(?:[^"]|"(?! "))+))"'
+                r'(?: "(?:-|(?P<cook>.+))")?)?'
+            )
+        ),
+        # NCSA CLF
+        RegexStrategy(
+            re.compile(
+                r"(?P<host>[\w.:\]\[]+) "
+                r"(?:-|(?P<ident>[^\s-]+)) "
+                r"(?:-|(?P<user>[^\s-]+)) "
+                r"\[(?P<time>[^\]]+)\] "
+                r'"(?P<req>(?:[^"]|"(?! \d+ \d+))+)" '
+                r"(?P<status>\d+) "
+                r"(?P<size>\d+)"
+            )
+        ),
+    )
+
+    def __init__(self, cache: bool = False, memo: Optional[TimestampMemo] = None):
         """Create a new `NcsaTransformer`
 
         NOTE: cache set to `True` will enable the use of the same strategy for
-        future log entries seen by this instance
+        future log entries seen by this instance, and a memo will be consulted
+        before parsing any timestamp
         """
         super().__init__(
-            [
-                # NCSA COMBINED CLF
-                RegexStrategy(
-                    re.compile(
-                        r"(?P<host>[\w.:\]\[]+) "
-                        r"(?:-|(?P<ident>[^\s-]+)) "
-                        r"(?:-|(?P<user>[^\s-]+)) "
-                        r"\[(?P<time>.+)\] "
-                        r'"(?P<req>.+)" '
-                        r"(?P<status>\d+) "
-                        r"(?P<size>\d+) "
-                        r'"(?:-|(?P<ref>.+))" '
-                        r'"(?:-|(?P<agent>.+))" '
-                        r'"(?:-|(?P<cook>.+))"'
-                    )
-                ),
-                # NCSA CLF
-                RegexStrategy(
-                    re.compile(
-                        r"(?P<host>[\w.:\]\[]+) "
-                        r"(?:-|(?P<ident>[^\s-]+)) "
-                        r"(?:-|(?P<user>[^\s-]+)) "
-                        r"\[(?P<time>.+)\] "
-                        r'"(?P<req>.+)" '
-                        r"(?P<status>\d+) "
-                        r"(?P<size>\d+)"
-                    )
-                ),
-            ],
+            self.STRATEGIES,
             cache,
         )
+        self._memo = memo
+        # The last timestamp parsed, as consecutive lines mostly share it
+        self._last: Tuple[Optional[str], Optional[datetime]] = (None, None)
 
     def transform(self, entry: str) -> Optional[Log]:
-        match: Optional[Match[str]] = self.resolve(entry)
-        if match:
-            res = match.groupdict()
+        """Transforms a log entry into a `Log` object
 
-            # Building a custom message to better promote readability
-            msg = (
-                f"Request: {res.get('req')} - Status: {res.get('status')} - Size: {res.get('size')}"
-            )
-            ref = res.get("ref")
-            if ref is not None:
-                msg += f" - Referrer: {ref}"
-            agent = res.get("agent")
-            if agent is not None:
-                msg += f" - User-Agent: {agent}"
-            cookie = res.get("cook")
-            if cookie is not None:
-                msg += f" - Cookie: {cookie}"
-
-            time = res.get("time")
-            timedate = None
-            if time is not None:
-                timedate = datetime.strptime(time, "%d/%b/%Y:%H:%M:%S %z")
-            return Log(
-                source=res.get("host"),
-                timestamp=timedate,
-                message=msg,
-            )
-        return None
+        NOTE: lines are split by walking the fixed CLF structure, the regular
+        expressions only resolve lines that cannot be split that way
+        """
+        res = _tokenize(entry)
+        if res is None:
+            return super().transform(entry)
+        return self.to_log(res)
+
+    def ascii_transform(self) -> Callable[[bytes], Optional[Log]]:
+        # Walking the structure of a decoded line beats matching it in place
+        transform = self.transform
+        return lambda entry: transform(entry.decode("ascii"))
+
+    def to_log(self, res: Dict[str, Optional[str]]) -> Log:
+        # Building a custom message to better promote readability
+        msg = f"Request: {res.get('req')} - Status: {res.get('status')} - Size: {res.get('size')}"
+        ref = res.get("ref")
+        if ref is not None:
+            msg += f" - Referrer: {ref}"
+        agent = res.get("agent")
+        if agent is not None:
+            msg += f" - User-Agent: {agent}"
+        cookie = res.get("cook")
+        if cookie is not None:
+            msg += f" - Cookie: {cookie}"
+
+        time = res.get("time")
+        timedate = None
+        if time is not None:
+            if self._memo is not None:
+                timedate = self._memo.get(time, _to_datetime)
+            elif self._last[0] == time:
+                timedate = self._last[1]
+            else:
+                timedate = _to_datetime(time)
+                self._last = (time, timedate)
+        return Log.trusted(
+            source=res.get("host"),
+            timestamp=timedate,
+            message=msg,
+        )
 
     def validate(self, data: str) -> bool:
         if data == "ncsa":
@@ -0,0 +1,189 @@
+"""
+The `parallel` module is responsible for transforming a single large log file on
+multiple cores. The file is split into newline aligned byte ranges which are transformed
+in a process pool by any line oriented transformer, then yielded back in their original order.
+"""
+import io
+import os
+from collections import deque
+from multiprocessing import Pool
+from multiprocessing.pool import AsyncResult
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+from gla.models.log import Log
+from gla.plugins.transformer.transformer import BaseTransformer
+
+# Byte size of the ranges handed to workers
+CHUNK_SIZE = 1 << 20
+
+# Ranges in flight per worker, bounding the results held in memory at once
+IN_FLIGHT = 2
+
+# The transformer of a worker process, created once by `_init`
+_transformer: Optional[BaseTransformer] = None
+
+
+def _init(factory: Callable[[], BaseTransformer]):
+    global _transformer
+    _transformer = factory()
+
+
+def _transform_range(task: Tuple[str, str, int, int]) -> Tuple[int, int, int, List[tuple]]:
+    """Transforms the lines of a byte range into compact field tuples
+
+    NOTE: `Log` objects are flattened to plain tuples to keep pickling cheap, along
+    with their type and the private attributes of those having any
+
+    Raises:
+        ValueError: if the worker was not initialized by `_init`
+    """
+    if _transformer is None:
+        raise ValueError("workers must be initialized by `_init`")
+    path, encoding, start, end = task
+    with open(path, "rb") as file:
+        file.seek(start)
+        data = file.read(end - start)
+    # Splits lines on universal newlines, as `transform_file` does
+    lines = io.TextIOWrapper(io.BytesIO(data), encoding=encoding).readlines()
+
+    transform = _transformer.transform
+    records: List[tuple] = []
+    skipped = 0
+    failed = 0
+    for seq, line in enumerate(lines):
+        line = line.strip()
+        if not line:
+            skipped += 1
+            continue
+        try:
+            log = transform(line)
+        except (ValueError, TypeError):
+            log = None
+        if log is None:
+            failed += 1
+            continue
+        kind = type(log)
+        private = (
+            log.__getstate__()["__private_attribute_values__"]
+            if kind.__private_attributes__
+            else None
+        )
+        records.append(
+            (seq, kind, log.level, log.module, log.message, log.timestamp, log.source, private)
+        )
+    return len(lines), skipped, failed, records
+
+
+def _restore(log: Log, private: Dict[str, Any]):
+    """Sets back the private attributes of a `Log` subclass, as unpickling it would"""
+    for name, value in private.items():
+        object.__setattr__(log, name, value)
+
+
+def split_ranges(path: str, chunk_size: int = CHUNK_SIZE) -> List[Tuple[int, int]]:
+    """Splits a file into byte ranges that start and end on line boundaries
+
+    Args:
+        path (str): the file to split
+        chunk_size (int): the approximate byte size of each range
+    """
+    ranges = []
+    with open(path, "rb") as file:
+        file.seek(0, 2)
+        size = file.tell()
+        start = 0
+        while start < size:
+            file.seek(min(start + chunk_size, size))
+            file.readline()
+            end = file.tell()
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+class ParallelBatch:
+    """
+    The `ParallelBatch` class is responsible for streaming `Log` objects, with the
+    line number they came from, out of a log file transformed on multiple cores
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], BaseTransformer],
+        path: str,
+        workers: Optional[int],
+        chunk_size: int,
+        encoding: str,
+    ):
+        if "\n".encode(encoding) != b"\n":
+            raise ValueError(f"encoding '{encoding}' must be ASCII compatible")
+        self._factory = factory
+        self._path = path
+        self._workers = workers
+        self._chunk_size = chunk_size
+        self._encoding = encoding
+        self.parsed = 0
+        """The number of lines transformed into a `Log`"""
+        self.skipped = 0
+        """The number of blank lines"""
+        self.failed = 0
+        """The number of lines that could not be transformed"""
+
+    def __iter__(self) -> Iterator[Tuple[int, Log]]:
+        workers = self._workers or os.cpu_count() or 1
+        tasks = (
+            (self._path, self._encoding, start, end)
+            for start, end in split_ranges(self._path, self._chunk_size)
+        )
+        with Pool(workers, initializer=_init, initargs=(self._factory,)) as pool:
+            # Ranges are submitted as results are consumed, rather than all at once
+            pending: Deque[AsyncResult] = deque(
+                pool.apply_async(_transform_range, (task,))
+                for _, task in zip(range(IN_FLIGHT * workers), tasks)
+            )
+            offset = 0
+            while pending:
+                count, skipped, failed, records = pending.popleft().get()
+                task = next(tasks, None)
+                if task is not None:
+                    pending.append(pool.apply_async(_transform_range, (task,)))
+                self.parsed += len(records)
+                self.skipped += skipped
+                self.failed += failed
+                for seq, kind, level, module, message, timestamp, source, private in records:
+                    log = kind.trusted(level, module, message, timestamp, source)
+                    if private is not None:
+                        _restore(log, private)
+                    yield offset + seq, log
+                offset += count
+
+
+def transform_parallel(
+    factory: Callable[[], BaseTransformer],
+    path: str,
+    workers: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+    encoding: str = "utf-8",
+) -> ParallelBatch:
+    """Lazily transforms every line of a log file on multiple cores
+
+    NOTE: each worker creates its own transformer so `factory` must be picklable,
+    such as a transformer class or a `functools.partial` of one. The file is split on
+    newline bytes, so encodings such as `utf-16` must be transformed serially
+
+    ```
+    for seq, log in transform_parallel(Log4jTransformer, "app.log", workers=4):
+        ...
+    ```
+
+    Args:
+        factory (Callable[[], BaseTransformer]): creates the line oriented transformer to use
+        path (str): the log file to transform
+        workers (Optional[int]): the number of worker processes, defaults to the cpu count
+        chunk_size (int): the approximate byte size of the ranges handed to workers
+        encoding (str): the encoding of the log file
+
+    Raises:
+        ValueError: if the encoding is not ASCII compatible
+    """
+    return ParallelBatch(factory, path, workers, chunk_size, encoding)
@@ -2,103 +2,190 @@
 The `syslog_transformer` module is responsible for transforming `syslog` log
 messages into structured `Log` objects based on the Syslog format standards.
 It supports parsing both the older BFG RFC 3164 format and the more modern
-IETF RFC 5424 format.
+IETF RFC 5424 format, whose structured data the `SyslogLog` class parses on first access.
 """
 import re
-from typing import Match, Optional, Union
+from typing import Dict, List, Optional, Tuple
 
-import dateparser
+from pydantic import PrivateAttr
 
-from gla.constants import LANGUAGES_SUPPORTED
 from gla.models.log import Log
 from gla.plugins.resolver.resolver import Resolver
-from gla.plugins.transformer.transformer import BaseTransformerValidator
+from gla.plugins.transformer.transformer import BaseRegexTransformer
 from gla.utilities.strategy import RegexStrategy
+from gla.utilities.timestamp import TimestampMemo, TimestampParser
 
+SEVERITIES = ("EMERGENCY", "ALERT", "CRITICAL", "ERROR", "WARN", "NOTICE", "INFO", "DEBUG")
 
-class SyslogTransformer(BaseTransformerValidator, Resolver):
+FACILITIES = (
+    "kern",
+    "user",
+    "mail",
+    "daemon",
+    "auth",
+    "syslog",
+    "lpr",
+    "news",
+    "uucp",
+    "cron",
+    "authpriv",
+    "ftp",
+    "ntp",
+    "audit",
+    "alert",
+    "clock",
+) + tuple(f"local{index}" for index in range(8))
+
+# The facility and severity of every valid PRI value, indexed by the value
+PRIORITIES: List[Tuple[str, str]] = [
+    (FACILITIES[pri >> 3], SEVERITIES[pri & 7]) for pri in range(len(FACILITIES) * 8)
+]
+
+# The same table keyed by the PRI text, so decoding needs no `int` conversion
+_PRIORITIES: Dict[str, Tuple[Optional[str], str]] = {
+    str(pri): priority for pri, priority in enumerate(PRIORITIES)
+}
+
+# An SD-ELEMENT, whose quoted values may hold escaped characters and closing brackets
+_SD_ELEMENT = re.compile(r'\[([^\s\]="]+)((?:[^\]"\\]|\\.|"(?:[^"\\]|\\.)*")*)\]')
+_SD_PARAM = re.compile(r'([^\s\]="]+)="((?:[^"\\]|\\.)*)"')
+_SD_ESCAPE = re.compile(r'\\(["\\\]])')
+
+
+def decode_priority(pri: str) -> Tuple[Optional[str], str]:
+    """Decodes a PRI value into its facility and severity
+
+    NOTE: values above 191 have no facility, their severity is still taken from
+    their lowest three bits
+
+    Args:
+        pri (str): the digits between the angle brackets, such as `165`
+    """
+    try:
+        return _PRIORITIES[pri]
+    except KeyError:
+        return None, SEVERITIES[int(pri) & 7]
+
+
+def parse_structured_data(text: str) -> Dict[str, Dict[str, str]]:
+    """Parses RFC 5424 structured data into its SD-PARAMs keyed by SD-ID
+
+    NOTE: parameters that are not `name="value"` pairs are ignored, and `\\"`,
+    `\\\\` and `\\]` are unescaped in values
+
+    Args:
+        text (str): the SD-ELEMENTs, such as `[origin ip="192.0.2.1"][meta seq="7"]`
+    """
+    elements: Dict[str, Dict[str, str]] = {}
+    for element in _SD_ELEMENT.finditer(text):
+        params = elements.setdefault(element.group(1), {})
+        for param in _SD_PARAM.finditer(element.group(2)):
+            value = param.group(2)
+            if "\\" in value:
+                value = _SD_ESCAPE.sub(r"\1", value)
+            params[param.group(1)] = value
+    return elements
+
+
+class SyslogLog(Log):
+    """
+    The `SyslogLog` class is a `Log` that carries the facility of a syslog message
+    and parses its RFC 5424 structured data only when it is accessed
+    """
+
+    _facility: Optional[str] = PrivateAttr(default=None)
+    _raw: Optional[str] = PrivateAttr(default=None)
+    _structured_data: Optional[Dict[str, Dict[str, str]]] = PrivateAttr(default=None)
+
+    @property
+    def facility(self) -> Optional[str]:
+        """The facility decoded from the PRI value, such as `auth` or `local4`"""
+        return self._facility
+
+    @property
+    def structured_data(self) -> Dict[str, Dict[str, str]]:
+        """The SD-PARAMs of each SD-ELEMENT keyed by SD-ID, empty for RFC 3164 messages"""
+        elements = self._structured_data
+        if elements is None:
+            elements = parse_structured_data(self._raw) if self._raw else {}
+            object.__setattr__(self, "_structured_data", elements)
+        return elements
+
+
+class SyslogTransformer(BaseRegexTransformer, Resolver):
     """
     The `SyslogTransformer` class is responsible for handling transformation
     of `syslog` log messages
     """
 
-    def __init__(self, cache: bool = False):
+    STRATEGIES: Tuple[RegexStrategy, ...] = (
+        # BFG RFC 3164 (older)
+        RegexStrategy(
+            re.compile(
+                r"^<(?P<pri>\d{1,3})>"
+                r"(?P<time>[A-Z][a-z]{2}\s+\d{1,2} \d{2}:\d{2}:\d{2}) "
+                r"(?P<host>[^\s]+) "
+                r"(?P<proc>\w+)"
+                r"(?:\[(?P<pid>\d+)\])*:* "
+                r"(?P<msg>.+)"
+            )
+        ),
+        # IETF RFC 5424
+        RegexStrategy(
+            re.compile(
+                r"^<(?P<pri>\d{1,3})>(?P<ver>\d{1,2}) "
+                r"(?P<time>\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}"
+                r"(?:\.*\d{0,6}(?:Z|[-+]\d{2}:\d{2}))*) "
+                r"(?:(?P<host>[\w+.]+)|-) (?:(?P<proc>\w+)|-) "
+                r"(?:(?P<pid>\d+)|-) (?:(?P<msgid>\w+)|-) "
+                r"(?:(?P<struct>(?:\[(?:[^\]\"\\]|\\.|\"(?:[^\"\\]|\\.)*\")*\])+)|-) "
+                r"(?:BOM)*(?P<msg>.+)"
+            )
+        ),
+    )
+
+    def __init__(
+        self, cache: bool = False, memo: Optional[TimestampMemo] = None, adaptive: bool = False
+    ):
         """Create a new `SyslogTransformer`
 
         NOTE: cache set to `True` will enable the use of the same strategy for
-        future log entries seen by this instance
+        future log entries seen by this instance, adaptive set to `True` will try
+        the layouts most often matched first, and a memo will be consulted before
+        parsing any timestamp
         """
         super().__init__(
-            [
-                # BFG RFC 3164 (older)
-                RegexStrategy(
-                    re.compile(
-                        r"^<(?P<pri>\d{1,3})>"
-                        r"(?P<time>[A-Z][a-z]{2}\s+\d{1,2} \d{2}:\d{2}:\d{2}) "
-                        r"(?P<host>[^\s]+) "
-                        r"(?P<proc>\w+)"
-                        r"(?:\[(?P<pid>\d+)\])*:* "
-                        r"(?P<msg>.+)"
-                    )
-                ),
-                # IETF RFC 5424
-                RegexStrategy(
-                    re.compile(
-                        r"^<(?P<pri>\d{1,3})>(?P<ver>\d{1,2}) "
-                        r"(?P<time>\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}"
-                        r"(?:\.*\d{0,6}(?:Z|[-+]\d{2}:\d{2}))*) "
-                        r"(?:(?P<host>[\w+.]+)|-) (?:(?P<proc>\w+)|-) "
-                        r"(?:(?P<pid>\d+)|-) (?:(?P<msgid>\w+)|-) "
-                        r"(?:\[(?P<struct>.+)\]|-)+ (?:BOM)*(?P<msg>.+)"
-                    )
-                ),
-            ],
+            self.STRATEGIES,
             cache,
+            adaptive,
         )
+        self._timestamps = TimestampParser(memo=memo)
 
-    def transform(self, entry: str) -> Optional[Log]:
-        match: Optional[Match[str]] = self.resolve(entry)
-        if match:
-            res = match.groupdict()
-
-            pri = res.get("pri")
-            level = None
-            if pri is not None:
-                level = self._priority_to_lvl(pri)
-            time = res.get("time")
-            timedate = None
-            if time is not None:
-                timedate = dateparser.parse(time, languages=LANGUAGES_SUPPORTED)
-
-            return Log(
-                level=level,
-                module=res.get("proc"),
-                source=res.get("host"),
-                timestamp=timedate,
-                message=res.get("msg"),
-            )
-        return None
-
-    def _priority_to_lvl(self, lvl: str) -> Union[str, None]:
-        """Converts syslog priority levels to respective log severity levels"""
-        res = int(lvl) % 8
-        if res == 0:
-            return "EMERGENCY"
-        elif res == 1:
-            return "ALERT"
-        elif res == 2:
-            return "CRITICAL"
-        elif res == 3:
-            return "ERROR"
-        elif res == 4:
-            return "WARN"
-        elif res == 5:
-            return "NOTICE"
-        elif res == 6:
-            return "INFO"
-        elif res == 7:
-            return "DEBUG"
-        return None
+    def to_log(self, res: Dict[str, Optional[str]]) -> Log:
+        pri = res.get("pri")
+        facility = level = None
+        if pri is not None:
+            facility, level = decode_priority(pri)
+        time = res.get("time")
+        timedate = None
+        if time is not None:
+            timedate = self._timestamps.parse(time)
+
+        log = SyslogLog.trusted(
+            level=level,
+            module=res.get("proc"),
+            source=res.get("host"),
+            timestamp=timedate,
+            message=res.get("msg"),
+        )
+        # Structured data is parsed on first access, so most consumers pay nothing
+        object.__setattr__(log, "_facility", facility)
+        object.__setattr__(log, "_raw", res.get("struct"))
+        object.__setattr__(log, "_structured_data", None)
+        return log
+
+    def starts_record(self, line: str) -> bool:
+        return line.startswith("<")
 
     def validate(self, data: str) -> bool:
         if data == "sys":
@@ -32,10 +32,7 @@ def test_cef_transformer():
             "expected": "MEDIUM [Network Monitor 1.5] Signature ID: 500 - High CPU Usage - "
             "Extensions: device=router1 cpu=95%",
         },
-        {
-            "input": "CEF:1|Network|Monitor1 cpu=95%",
-            "expected": None
-        },
+        {"input": "CEF:1|Network|Monitor1 cpu=95%", "expected": None},
     ]
 
     for case in test_cases:
@@ -51,3 +48,43 @@ def test_cef_transformer():
             assert (
                 result is None
             ), f"Failed for input: {input_log}, Expected: None, Got: {str(result)}"
+
+
+def test_cef_extensions():
+    cef = CefTransformer()
+
+    test_cases = [
+        {
+            "input": "CEF:0|Vendor|Product|1.0|100|Test event|3|src=192.168.1.1 dst=10.0.0.2",
+            "expected": {"src": "192.168.1.1", "dst": "10.0.0.2"},
+        },
+        {
+            "input": "CEF:0|Acme|Firewall|2.5|200|Blocked|5|"
+            "suser=John Doe act=blocked msg=Blocked external access",
+            "expected": {"suser": "John Doe", "act": "blocked", "msg": "Blocked external access"},
+        },
+        {
+            "input": r"CEF:0|Acme|Firewall|2.5|200|Blocked|5|"
+            r"request=/q?a\=1 filePath=C:\\temp\\x msg=first\nsecond cs1Label=rule",
+            "expected": {
+                "request": "/q?a=1",
+                "filePath": "C:\\temp\\x",
+                "msg": "first\nsecond",
+                "cs1Label": "rule",
+            },
+        },
+        {
+            "input": r"CEF:0|Acme|Firewall|2.5|200|Blocked|5|filePath=C:\temp\x cs1=a\|b\r\tc",
+            "expected": {"filePath": "C:\\temp\\x", "cs1": "a|b\r\\tc"},
+        },
+    ]
+
+    for case in test_cases:
+        input_log = case["input"]
+        expected_result = case["expected"]
+        result = cef.transform(input_log)
+
+        assert result._extensions is None, f"Parsed eagerly for input: {input_log}"
+        assert (
+            result.extensions == expected_result
+        ), f"Failed for input: {input_log}, Expected: {expected_result}, Got: {result.extensions}"
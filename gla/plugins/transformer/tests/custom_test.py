@@ -1,6 +1,6 @@
-
 import dateparser
 from pytest import raises
+
 from gla.constants import LANGUAGES_SUPPORTED
 from gla.plugins.transformer.custom_transformer import CustomTransformer
 
@@ -34,7 +34,7 @@ def test_mismatched_entry_and_template():
     log_entry = "2024-05-09;WARNING;hello world;extra_field"
 
     transformer = CustomTransformer(template)
-    
+
     with raises(ValueError, match="template does not align with the log message"):
         transformer.transform(log_entry)
 
@@ -74,7 +74,7 @@ def test_empty_log_entry():
     log_entry = ""
 
     transformer = CustomTransformer(template)
-    
+
     with raises(ValueError, match="template does not align with the log message"):
         transformer.transform(log_entry)
 
@@ -84,8 +84,11 @@ def test_null_values_in_log():
     log_entry = ";;;;;"
 
     transformer = CustomTransformer(template)
-    
-    with raises(ValueError, match="\['time', 'lvl', 'src', 'mod', 'msg'\] template does not align with the log message: ;;;;;"):
+
+    with raises(
+        ValueError,
+        match="\['time', 'lvl', 'src', 'mod', 'msg'\] template does not align with the log message: ;;;;;",
+    ):
         transformer.transform(log_entry)
 
 
@@ -97,3 +100,73 @@ def test_multiple_extensions():
     log = transformer.transform(log_entry)
 
     assert log.message == "hello extra1 extra2"
+
+
+def test_rest_to_last_keeps_delimiters_in_message():
+    template = [";", "time", "lvl", "msg"]
+    log_entry = "2024-05-09;WARNING;hello;world"
+
+    transformer = CustomTransformer(template, rest_to_last=True)
+    log = transformer.transform(log_entry)
+
+    assert log.level == "WARNING"
+    assert log.message == "hello;world"
+    with raises(ValueError, match="template does not align with the log message"):
+        transformer.transform("2024-05-09;WARNING")
+
+
+def test_repeated_headers():
+    template = [";", "lvl", "msg", "lvl", "ext"]
+
+    transformer = CustomTransformer(template)
+
+    assert transformer.transform("INFO;hello;ERROR;extra").level == "ERROR"
+    log = transformer.transform("INFO;hello;;")
+    assert log.level == "INFO"
+    assert log.message == "hello"
+
+
+def test_template_without_time():
+    transformer = CustomTransformer(["|", "lvl", "msg"])
+    log = transformer.transform("INFO|hello")
+
+    assert log.timestamp is None
+    assert log.message == "hello"
+
+
+def test_quoted_fields():
+    template = [",", "time", "lvl", "src", "msg"]
+    log_entry = '2024-05-09,WARNING,"dump, py","said ""hello, world"""'
+
+    transformer = CustomTransformer(template, quoted=True)
+    log = transformer.transform(log_entry)
+
+    assert log.source == "dump, py"
+    assert log.message == 'said "hello, world"'
+    with raises(ValueError, match="template does not align with the log message"):
+        transformer.transform("2024-05-09,WARNING,dump.py,hello,world")
+    with raises(ValueError, match="quoted templates need a 'single' character delimiter"):
+        CustomTransformer(["::", "time", "msg"], quoted=True)
+
+
+def test_quoted_rest_to_last():
+    transformer = CustomTransformer(["\t", "lvl", "msg"], rest_to_last=True, quoted=True)
+
+    assert transformer.transform('INFO\t"quoted"\tand\tmore').message == "quoted\tand\tmore"
+
+
+def test_quoted_transform_file(tmp_path):
+    path = tmp_path / "app.csv"
+    path.write_text(
+        '2024-05-09,WARNING,"first, with a comma"\n'
+        "\n"
+        '2024-05-10,ERROR,"second spans\n'
+        'two lines"\n'
+        "2024-05-11,INFO\n"
+    )
+
+    batch = CustomTransformer([",", "time", "lvl", "msg"], quoted=True).transform_file(str(path))
+    logs = list(batch)
+
+    assert [log.message for log in logs] == ["first, with a comma", "second spans\ntwo lines"]
+    assert (batch.parsed, batch.skipped, batch.failed) == (2, 1, 1)
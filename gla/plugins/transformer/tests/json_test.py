@@ -1,3 +1,5 @@
+from pytest import raises
+
 from gla.plugins.transformer.json_transformer import JsonTransformer
 
 
@@ -47,3 +49,59 @@ def test_json_transformer():
         assert (
             str(result) == case["expected"] if case["expected"] is not None else result is None
         ), f"Test failed for input: {case['input']}"
+
+
+def test_json_transformer_mixed_schemas():
+    json = JsonTransformer()
+
+    entries = [
+        '{"@timestamp":"2019-08-06T14:08:40Z","log.level":"DEBUG","message":"ecs"}',
+        '{"timestamp":"2019-08-06T14:08:40Z","level":"INFO","loggerName":"auth","message":"a"}',
+        '{"timestamp":"2019-08-06T14:08:40","severity":"WARN","host":"db","msg":"syslog"}',
+        '{"@timestamp":"2019-08-06T14:08:41Z","log.level":"INFO","message":"ecs again"}',
+        '{"level":"INFO","loggerName":"auth","message":"b","timestamp":"2019-08-06T14:08:41Z"}',
+    ]
+    expected = [
+        "2019-08-06T14:08:40+00:00 DEBUG - ecs",
+        "2019-08-06T14:08:40+00:00 INFO auth - a",
+        "2019-08-06T14:08:40 WARN [db] - syslog",
+        "2019-08-06T14:08:41+00:00 INFO - ecs again",
+        "2019-08-06T14:08:41+00:00 INFO auth - b",
+    ]
+    for entry, result in zip(entries, expected):
+        assert str(json.transform(entry)) == result, f"Failed for input: {entry}"
+
+
+def test_json_transformer_nested_paths():
+    json = JsonTransformer()
+
+    test_cases = [
+        # Nested ECS document
+        {
+            "input": """{"@timestamp":"2019-08-06T14:08:40Z", "log":{"level":"ERROR",
+            "logger":"app.db"}, "service":{"name":"petclinic"}, "message":"nested"}""",
+            "expected": "2019-08-06T14:08:40+00:00 ERROR [petclinic] app.db - nested",
+        },
+        # Flat and nested names mixed
+        {
+            "input": """{"@timestamp":"2019-08-06T14:08:40Z", "log.level":"WARN",
+            "log":{"logger":"app.web"}, "message":"mixed"}""",
+            "expected": "2019-08-06T14:08:40+00:00 WARN app.web - mixed",
+        },
+    ]
+    for case in test_cases:
+        result = json.transform(case["input"])
+        assert str(result) == case["expected"], f"Failed for input: {case['input']}"
+
+
+def test_json_transformer_register():
+    json = JsonTransformer(mappings=[{"level": "lvl", "message": "event.text"}])
+
+    result = json.transform('{"lvl":"INFO","event":{"text":"registered"}}')
+    assert str(result) == "INFO - registered", "Should resolve with the registered mapping"
+    # Built-in mappings still resolve their own records
+    result = json.transform('{"severity":"WARN","host":"db","msg":"syslog"}')
+    assert str(result) == "WARN [db] - syslog", "Should resolve with the syslog mapping"
+
+    with raises(ValueError, match="mapping field 'lvl' is not a 'Log' field"):
+        json.register({"lvl": "level"})
@@ -1,3 +1,4 @@
+from gla.plugins.resolver.resolver import Resolver
 from gla.plugins.transformer.log4j_transformer import Log4jTransformer
 
 
@@ -115,3 +116,112 @@ def test_log4j_transformation():
             assert (
                 result is None
             ), f"Failed for input: {input_log}, Expected: None, Got: {str(result)}"
+
+
+ENTRIES = [
+    "2020-02-01 [worker-thread] WARN database.connection - Failed to connect",
+    "[main-thread] 2020-01-02 ERROR db.connect - Failed to connect to database",
+    "[logging-thread] WARN logger.service 2022-12-05 - Missing log file",
+    "ERROR [network-thread] api.request - Timeout error 2021-09-10",
+    "ERROR api.request - Timeout error 2021-09-10 [main]",
+    "api.request 2021-09-10 - Timeout error [main] ERROR",
+    "api.request - Timeout error 2021-09-10 ERROR [main]",
+    "class.example Error message goes here 02-01-2020 ERROR [main]",
+    "[main] [worker] 2020-01-02 ERROR db.connect - Two threads",
+    "2020-01-02\tERROR\tdb.connect\t-\tTab separated",
+    "INFO ERROR - A module named like a level 2021-09-10",
+    "api.request [main] 2021-09-10 ERROR - Thread before the time",
+    "2021-09-10 - Time before the message [main] api.request WARN",
+    "2021-09-10",
+    "- not a log4j line",
+    " 2020-02-01 ERROR api.auth - leading whitespace",
+    "",
+]
+
+
+def test_log4j_dispatch_matches_full_scan():
+    log4j = Log4jTransformer()
+    full = Resolver(log4j._strategies, False)
+
+    for entry in ENTRIES:
+        expected = full.resolve(entry)
+        result = log4j.resolve(entry)
+        if expected is None:
+            assert result is None, f"Failed for input: {entry}"
+        else:
+            assert result.groupdict() == expected.groupdict(), f"Failed for input: {entry}"
+
+    binary = log4j.binary()
+    for entry in ENTRIES:
+        expected = full.resolve(entry)
+        result = binary.resolve(entry.encode("ascii"))
+        if expected is None:
+            assert result is None, f"Failed for input: {entry}"
+        else:
+            assert {
+                name: value.decode("ascii") if value is not None else None
+                for name, value in result.groupdict().items()
+            } == expected.groupdict(), f"Failed for input: {entry}"
+
+
+def test_log4j_adaptive_matches_full_scan():
+    log4j = Log4jTransformer(adaptive=True)
+    full = Log4jTransformer()
+
+    # Twice, so the second pass runs on the adapted order
+    for entry in ENTRIES + ENTRIES:
+        expected = full.transform(entry)
+        result = log4j.transform(entry)
+        assert str(result) == str(expected), f"Failed for input: {entry}"
+
+
+def test_log4j_adaptive_ambiguous_line():
+    log4j = Log4jTransformer(adaptive=True)
+    full = Log4jTransformer()
+
+    # A module named like a level lets this line fit two layouts of the same route
+    entry = "ERROR 2020-02-01 api.x - Timeout INFO"
+    expected = "2020-02-01T00:00:00 ERROR api.x - Timeout INFO"
+    assert str(log4j.transform(entry)) == expected
+    assert str(full.transform(entry)) == expected
+
+    # Only the second layout fits this line, so it ends up matched most often
+    for _ in range(2):
+        log4j.transform("WARN 2020-02-01 Disk almost full INFO")
+
+    assert str(log4j.transform(entry)) == "2020-02-01T00:00:00 INFO ERROR - api.x - Timeout"
+    assert str(full.transform(entry)) == expected
+
+
+def test_log4j_learned_layout_matches_full_scan():
+    log4j = Log4jTransformer(learn=True)
+    full = Log4jTransformer()
+
+    # Twice, so the second pass runs with layouts learned from the first
+    for entry in ENTRIES + ENTRIES:
+        expected = full.transform(entry)
+        result = log4j.transform(entry)
+        assert str(result) == str(expected), f"Failed for input: {entry}"
+
+
+def test_log4j_learned_layout_skips_regex():
+    log4j = Log4jTransformer(learn=True)
+    resolved = []
+    resolve = log4j.resolve
+    log4j.resolve = lambda entry: resolved.append(entry) or resolve(entry)
+
+    entries = [
+        f"[worker-{line}] 2020-01-02 ERROR db.connect - Failed  to connect {line} - retrying"
+        for line in range(10)
+    ]
+    logs = [log4j.transform(entry) for entry in entries]
+
+    assert resolved == entries[:1], "Should only resolve the line the layout is learned from"
+    assert [str(log) for log in logs] == [
+        str(Log4jTransformer().transform(entry)) for entry in entries
+    ]
+
+    # A line the layout does not fit falls back to the regular expressions
+    entry = "2020-02-01 [worker-thread] WARN database.connection - Failed to connect"
+    assert str(log4j.transform(entry)) == str(Log4jTransformer().transform(entry))
+    assert resolved[-1] == entry
@@ -1,4 +1,9 @@
+from datetime import datetime
+
+from pytest import raises
+
 from gla.plugins.transformer.ncsa_transformer import NcsaTransformer
+from gla.utilities.timestamp import TimestampMemo
 
 
 def test_ncsa_transformation():
@@ -46,10 +51,17 @@ def test_ncsa_transformation():
             "expected": "2024-03-10T12:34:56+00:00 [[2001:db8::2]] - "
             "Request: DELETE /account HTTP/1.1 - Status: 204 - Size: 0 - User-Agent: curl/7.68.0",
         },
+        {
+            "input": "198.51.100.7 - - [10/Mar/2024:12:34:56 +0000] "
+            '"GET /search HTTP/1.1" 200 2326 "https://example.com/" "Mozilla/5.0 (X11; Linux)"',
+            "expected": "2024-03-10T12:34:56+00:00 [198.51.100.7] - "
+            "Request: GET /search HTTP/1.1 - Status: 200 - Size: 2326 - "
+            "Referrer: https://example.com/ - User-Agent: Mozilla/5.0 (X11; Linux)",
+        },
         {
             "input": "[2001:db8::2] - - [10/Mar/2024:12:34:56 +0000] "
             '"DELETE /accounHTTP/1.1" 0 "curl/7.68.0" "-"',
-            "expected": None
+            "expected": None,
         },
     ]
 
@@ -66,3 +78,71 @@ def test_ncsa_transformation():
             assert (
                 result is None
             ), f"Failed for input: {input_log}, Expected: None, Got: {str(result)}"
+
+
+def test_ncsa_memo():
+    memo = TimestampMemo()
+    ncsa = NcsaTransformer(memo=memo)
+
+    first = ncsa.transform(
+        '192.168.1.1 - - [10/Mar/2024:12:34:56 +0000] "GET /index.html HTTP/1.1" 200 1234'
+    )
+    second = ncsa.transform(
+        '192.168.1.2 - - [10/Mar/2024:12:34:56 +0000] "GET /about HTTP/1.1" 200 567'
+    )
+
+    assert first.timestamp == second.timestamp
+    assert memo.hits == 1
+    assert memo.misses == 1
+
+
+def test_ncsa_tokenizer_matches_patterns():
+    ncsa = NcsaTransformer()
+
+    entries = [
+        '192.168.1.1 - - [10/Mar/2024:12:34:56 +0000] "GET /index.html HTTP/1.1" 200 1234',
+        '10.0.0.1 user123 frank [10/Mar/2024:12:34:56 -0530] "PUT /a HTTP/1.1" 201 890',
+        '203.0.113.5 - admin [29/Feb/2024:23:59:59 +1345] "POST /login HTTP/1.1" 401 456 '
+        '"https://example.com/?q=a b" "Mozilla/5.0 (Windows NT 10.0) [en]" "session=abc123"',
+        '[2001:db8::2] - - [10/Mar/2024:12:34:56 +0000] "GET / HTTP/1.1" 204 0 "-" "curl" "-"',
+        '192.168.1.1 - - [10/Mar/2024:12:34:56 +0000] "GET / HTTP/1.1" 200 1 "-" "Mozilla/5.0 (X11)"',
+        '192.168.1.1 - - [10/Mar/2024:12:34:56 +0000] "GET / HTTP/1.1" 200 1 "https://example.com"',
+        # Left to the patterns
+        '192.168.1.1 - - [10/Mar/2024:12:34:56 +0000] "GET /a\\" b HTTP/1.1" 200 1234',
+        '192.168.1.1 - - [10/Mar/2024:12:34:56 +0000] "GET / HTTP/1.1" 200 1234 trailing',
+        '192.168.1.1 - - [10/Mar/2024:12:34:56 +0000] "GET / HTTP/1.1" 200 12ab',
+        '192.168.1.1 - - [10/Mar/2024:12:34:56 +0000] "GET / HTTP/1.1" 200 1 "a" "b" "c" "d"',
+        '192.168.1.1 - - [10/Mar/2024:12:34:56 +0000] "GET / HTTP/1.1" 200 1 "" "b" "c"',
+        '192.168.1.1 - - [10/mar/2024:12:34:56 +0000] "GET / HTTP/1.1" 200 1',
+        'my-host - - [10/Mar/2024:12:34:56 +0000] "GET / HTTP/1.1" 200 1',
+        '192.168.1.1 a-b - [10/Mar/2024:12:34:56 +0000] "GET / HTTP/1.1" 200 1',
+        "not an ncsa line",
+    ]
+    for entry in entries:
+        match = ncsa.resolve(entry)
+        expected = None if match is None else ncsa.to_log(match.groupdict())
+        assert str(ncsa.transform(entry)) == str(expected), f"Failed for input: {entry}"
+        if expected is not None:
+            assert ncsa.transform(entry).timestamp.utcoffset() == expected.timestamp.utcoffset()
+
+
+def test_ncsa_timestamp_fixed_width_numbers():
+    ncsa = NcsaTransformer()
+
+    times = [
+        "10/Mar/2024:12:34:56 +0130",
+        # Rejected by `strptime`, so not parsed by position either
+        "10/Mar/2024:12:34:56 +1 30",
+        "10/Mar/2024:12:34:56 + 130",
+        "10/Mar/2024:+2:34:56 +0130",
+        " 1/Mar/2024:12:34:56 +0130",
+    ]
+    for time in times:
+        entry = f'192.168.1.1 - - [{time}] "GET / HTTP/1.1" 200 1'
+        try:
+            expected = datetime.strptime(time, "%d/%b/%Y:%H:%M:%S %z")
+        except ValueError:
+            with raises(ValueError):
+                ncsa.transform(entry)
+            continue
+        assert ncsa.transform(entry).timestamp == expected, f"Failed for input: {time}"
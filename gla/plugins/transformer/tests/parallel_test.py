@@ -0,0 +1,111 @@
+import os
+from functools import partial
+
+from pytest import raises
+
+from gla.plugins.transformer import CustomTransformer
+from gla.plugins.transformer.cef_transformer import CefLog, CefTransformer
+from gla.plugins.transformer.ncsa_transformer import NcsaTransformer
+from gla.plugins.transformer.parallel import _transform_range, split_ranges, transform_parallel
+from gla.plugins.transformer.syslog_transformer import SyslogLog, SyslogTransformer
+
+
+def test_split_ranges_align_on_lines():
+    path = os.path.join(os.path.dirname(__file__), "logs", "test-ncsa.log")
+    ranges = split_ranges(path, 100)
+
+    with open(path, "rb") as file:
+        data = file.read()
+    assert len(ranges) > 1
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == len(data)
+    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+        assert end == start
+        assert data[end - 1 : end] == b"\n"
+
+
+def test_transform_parallel_keeps_order():
+    path = os.path.join(os.path.dirname(__file__), "logs", "test-ncsa.log")
+    expected = list(NcsaTransformer().transform_file(path))
+
+    batch = transform_parallel(NcsaTransformer, path, workers=2, chunk_size=100)
+    result = list(batch)
+
+    assert [seq for seq, _ in result] == list(range(len(expected)))
+    assert [str(log) for _, log in result] == [str(log) for log in expected]
+    assert batch.parsed == len(expected)
+    assert batch.failed == 0
+
+
+def test_transform_parallel_keeps_log_types(tmp_path):
+    path = os.path.join(os.path.dirname(__file__), "logs", "test-cef.log")
+    expected = list(CefTransformer().transform_file(path))
+
+    result = [log for _, log in transform_parallel(CefTransformer, path, workers=2)]
+
+    assert all(isinstance(log, CefLog) for log in result)
+    assert [log.extensions for log in result] == [log.extensions for log in expected]
+
+    path = tmp_path / "syslog.log"
+    path.write_text(
+        '<165>1 2003-10-11T22:14:15.003Z host.example.com app 1234 ID47 [exampleSDID@32473 iut="3"] hi\n'
+    )
+    result = [log for _, log in transform_parallel(SyslogTransformer, str(path), workers=2)]
+
+    assert all(isinstance(log, SyslogLog) for log in result)
+    assert [(log.facility, log.structured_data) for log in result] == [
+        ("local4", {"exampleSDID@32473": {"iut": "3"}})
+    ]
+
+
+def test_transform_range_requires_initialized_worker():
+    path = os.path.join(os.path.dirname(__file__), "logs", "test-ncsa.log")
+
+    with raises(ValueError, match="workers must be initialized"):
+        _transform_range((path, "utf-8", 0, 100))
+
+
+def test_transform_parallel_counts(tmp_path):
+    path = tmp_path / "custom.log"
+    path.write_text(
+        "2024-05-09;WARNING;hello\n\n2024-05-09;WARNING;hello;world\n2024-05-10;INFO;bye"
+    )
+
+    factory = partial(CustomTransformer, [";", "time", "lvl", "msg"])
+    batch = transform_parallel(factory, str(path), workers=2)
+    result = list(batch)
+
+    assert [(seq, log.message) for seq, log in result] == [(0, "hello"), (3, "bye")]
+    assert batch.parsed == 2
+    assert batch.skipped == 1
+    assert batch.failed == 1
+
+
+def test_transform_parallel_universal_newlines(tmp_path):
+    path = tmp_path / "custom.log"
+    path.write_bytes(
+        b"2024-05-09;WARNING;hello\r2024-05-09;INFO;cr\r\n\r2024-05-10;INFO;bye\n"
+        b"2024-05-11;INFO;again\x0cstill\n"
+    )
+
+    factory = partial(CustomTransformer, [";", "time", "lvl", "msg"])
+    expected = factory().transform_file(str(path))
+    expected_logs = [str(log) for log in expected]
+    batch = transform_parallel(factory, str(path), workers=2, chunk_size=8)
+    result = list(batch)
+
+    assert [str(log) for _, log in result] == expected_logs
+    assert [seq for seq, _ in result] == [0, 1, 3, 4]
+    assert (batch.parsed, batch.skipped, batch.failed) == (
+        expected.parsed,
+        expected.skipped,
+        expected.failed,
+    )
+
+
+def test_transform_parallel_rejects_wide_encodings(tmp_path):
+    path = tmp_path / "custom.log"
+    path.write_text("2024-05-09;WARNING;hello\n", encoding="utf-16")
+
+    with raises(ValueError, match="encoding 'utf-16' must be ASCII compatible"):
+        transform_parallel(CustomTransformer, str(path), encoding="utf-16")
@@ -1,3 +1,5 @@
+from datetime import datetime, timedelta, timezone
+
 from gla.plugins.transformer.sip_transformer import SipTransformer
 
 
@@ -9,7 +11,7 @@ def test_sip_transformation():
             "input": "172 1275930743.699 R s REGISTER-1 sip:example.com 198.51.100.10:5060:udp "
             "198.51.100.1:5060:udp sip:example.com sip:alice@example.com;tag=76yhh "
             "f81-d4-f6@example.com - - c-tr-1",
-            "expected": "2010-06-07T17:12:23 [198.51.100.1:5060:udp] - "
+            "expected": "2010-06-07T17:12:23.699000+00:00 [198.51.100.1:5060:udp] - "
             "Session: f81-d4-f6@example.com - Sent a REGISTER-1 request from "
             "sip:alice@example.com;tag=76yhh (198.51.100.1:5060:udp) to sip:example.com "
             "(198.51.100.10:5060:udp)",
@@ -18,7 +20,7 @@ def test_sip_transformation():
             "input": "173 1275930744.100 r r REGISTER-1 - 198.51.100.1:5060:udp "
             "198.51.100.10:5060:udp sip:example.com;tag=reg-1xtr sip:alice@example.com;tag=76yhh "
             "f81-d4-f6@example.com 200 - c-tr-1",
-            "expected": "2010-06-07T17:12:24 [198.51.100.10:5060:udp] - "
+            "expected": "2010-06-07T17:12:24.100000+00:00 [198.51.100.10:5060:udp] - "
             "Session: f81-d4-f6@example.com - Received a REGISTER-1 200 response from "
             "sip:alice@example.com;tag=76yhh (198.51.100.10:5060:udp) to "
             "sip:example.com;tag=reg-1xtr (198.51.100.1:5060:udp)",
@@ -27,8 +29,8 @@ def test_sip_transformation():
             "input": "175 1275930743.699 R r INVITE-43 sip:bob@example.net 203.0.113.200:5060:udp "
             "198.51.100.1:5060:udp sip:bob@example.net sip:alice@example.com;tag=a1-1 "
             "tr-88h@example.com - s-1-tr -",
-            "expected": "2010-06-07T17:12:23 [198.51.100.1:5060:udp] - Session: tr-88h@example.com"
-            " - Received a INVITE-43 request from "
+            "expected": "2010-06-07T17:12:23.699000+00:00 [198.51.100.1:5060:udp] - "
+            "Session: tr-88h@example.com - Received a INVITE-43 request from "
             "sip:alice@example.com;tag=a1-1 (198.51.100.1:5060:udp) "
             "to sip:bob@example.net (203.0.113.200:5060:udp)",
         },
@@ -36,15 +38,16 @@ def test_sip_transformation():
             "input": "175 1275930743.699 R r INVITE-43 sip:bob@example.net 203.0.113.200:5060:udp "
             "198.51.100.1:5060:udp sip:bob@example.net sip:alice@example.com;tag=a1-1 "
             'tr-88h@example.com - s-1-tr - Subject,13,"Call me ASAP!"',
-            "expected": "2010-06-07T17:12:23 [198.51.100.1:5060:udp] - Session: tr-88h@example.com"
-            " - Received a INVITE-43 request from sip:alice@example.com;tag=a1-1 "
+            "expected": "2010-06-07T17:12:23.699000+00:00 [198.51.100.1:5060:udp] - "
+            "Session: tr-88h@example.com - Received a INVITE-43 request from "
+            "sip:alice@example.com;tag=a1-1 "
             "(198.51.100.1:5060:udp) to sip:bob@example.net (203.0.113.200:5060:udp)",
         },
         {
             "input": "159 1275930744.001 r s INVITE-43 - 198.51.100.1:5060:udp "
             "203.0.113.200:5060:udp sip:bob@example.net sip:alice@example.com;tag=a1-1 "
             "tr-88h@example.com 100 s-1-tr -",
-            "expected": "2010-06-07T17:12:24 [203.0.113.200:5060:udp] - "
+            "expected": "2010-06-07T17:12:24.001000+00:00 [203.0.113.200:5060:udp] - "
             "Session: tr-88h@example.com - Sent a INVITE-43 100 response from "
             "sip:alice@example.com;tag=a1-1 (203.0.113.200:5060:udp) to "
             "sip:bob@example.net (198.51.100.1:5060:udp)",
@@ -53,7 +56,7 @@ def test_sip_transformation():
             "input": "184 1275930744.998 R s INVITE-43 sip:bob@bob1.example.net "
             "203.0.113.1:5060:udp 203.0.113.200:5060:udp sip:bob@example.net "
             "sip:alice@example.com;tag=a1-1 tr-88h@example.com - s-1-tr c-1-tr",
-            "expected": "2010-06-07T17:12:24 [203.0.113.200:5060:udp] - "
+            "expected": "2010-06-07T17:12:24.998000+00:00 [203.0.113.200:5060:udp] - "
             "Session: tr-88h@example.com - Sent a INVITE-43 request from "
             "sip:alice@example.com;tag=a1-1 (203.0.113.200:5060:udp) to sip:bob@bob1.example.net "
             "(203.0.113.1:5060:udp)",
@@ -62,7 +65,7 @@ def test_sip_transformation():
             "input": "186 1275930745.500 R s INVITE-43 sip:bob@bob2.example.net "
             "[2001:db8::9]:5060:udp 203.0.113.200:5060:udp sip:bob@example.net "
             "sip:alice@example.com;tag=a1-1 tr-88h@example.com - s-1-tr c-2-tr",
-            "expected": "2010-06-07T17:12:25 [203.0.113.200:5060:udp] - "
+            "expected": "2010-06-07T17:12:25.500000+00:00 [203.0.113.200:5060:udp] - "
             "Session: tr-88h@example.com - Sent a INVITE-43 request from "
             "sip:alice@example.com;tag=a1-1 (203.0.113.200:5060:udp) to sip:bob@bob2.example.net "
             "([2001:db8::9]:5060:udp)",
@@ -71,7 +74,7 @@ def test_sip_transformation():
             "input": "172 1275930745.800 r r INVITE-43 - 203.0.113.200:5060:udp "
             "203.0.113.1:5060:udp sip:bob@example.net;tag=b1-1 sip:alice@example.com;tag=a1-1 "
             "tr-88h@example.com 100 s-1-tr c-1-tr",
-            "expected": "2010-06-07T17:12:25 [203.0.113.1:5060:udp] - "
+            "expected": "2010-06-07T17:12:25.800000+00:00 [203.0.113.1:5060:udp] - "
             "Session: tr-88h@example.com - Received a INVITE-43 100 response "
             "from sip:alice@example.com;tag=a1-1 (203.0.113.1:5060:udp) to "
             "sip:bob@example.net;tag=b1-1 (203.0.113.200:5060:udp)",
@@ -80,7 +83,7 @@ def test_sip_transformation():
             "input": "174 1275930746.100 r r INVITE-43 - 203.0.113.200:5060:udp "
             "[2001:db8::9]:5060:udp sip:bob@example.net;tag=b2-2 sip:alice@example.com;tag=a1-1 "
             "tr-88h@example.com 100 s-1-tr c-2-tr",
-            "expected": "2010-06-07T17:12:26 [[2001:db8::9]:5060:udp] - "
+            "expected": "2010-06-07T17:12:26.100000+00:00 [[2001:db8::9]:5060:udp] - "
             "Session: tr-88h@example.com - Received a INVITE-43 100 response "
             "from sip:alice@example.com;tag=a1-1 ([2001:db8::9]:5060:udp) to "
             "sip:bob@example.net;tag=b2-2 (203.0.113.200:5060:udp)",
@@ -89,7 +92,7 @@ def test_sip_transformation():
             "input": "170 1275930746.990 r s INVITE-43 - 198.51.100.1:5060:udp "
             "203.0.113.200:5060:udp sip:bob@example.net;b2-2 sip:alice@example.com;tag=a1-1 "
             "tr-88h@example.com 180 s-1-tr c-2-tr",
-            "expected": "2010-06-07T17:12:26 [203.0.113.200:5060:udp] - "
+            "expected": "2010-06-07T17:12:26.990000+00:00 [203.0.113.200:5060:udp] - "
             "Session: tr-88h@example.com - Sent a INVITE-43 180 response "
             "from sip:alice@example.com;tag=a1-1 (203.0.113.200:5060:udp) to "
             "sip:bob@example.net;b2-2 (198.51.100.1:5060:udp)",
@@ -98,7 +101,7 @@ def test_sip_transformation():
             "input": "170 1275930747.100 r r INVITE-43 - 203.0.113.200:5060:udp "
             "203.0.113.1:5060:udp sip:bob@example.net;tag=b1-1 sip:alice@example.com;tag=a1-1 "
             "tr-88h@example.com 180 s-1-tr c-1-tr",
-            "expected": "2010-06-07T17:12:27 [203.0.113.1:5060:udp] - "
+            "expected": "2010-06-07T17:12:27.100000+00:00 [203.0.113.1:5060:udp] - "
             "Session: tr-88h@example.com - Received a INVITE-43 180 response "
             "from sip:alice@example.com;tag=a1-1 (203.0.113.1:5060:udp) "
             "to sip:bob@example.net;tag=b1-1 (203.0.113.200:5060:udp)",
@@ -107,7 +110,7 @@ def test_sip_transformation():
             "input": "173 1275930747.300 r s INVITE-43 - 198.51.100.1:5060:udp "
             "203.0.113.200:5060:udp sip:bob@example.net;tag=b1-1 sip:alice@example.com;tag=a1-1 "
             "tr-88h@example.com 180 s-1-tr c-1-tr",
-            "expected": "2010-06-07T17:12:27 [203.0.113.200:5060:udp] - "
+            "expected": "2010-06-07T17:12:27.300000+00:00 [203.0.113.200:5060:udp] - "
             "Session: tr-88h@example.com - Sent a INVITE-43 180 response "
             "from sip:alice@example.com;tag=a1-1 (203.0.113.200:5060:udp) "
             "to sip:bob@example.net;tag=b1-1 (198.51.100.1:5060:udp)",
@@ -116,7 +119,7 @@ def test_sip_transformation():
             "input": "172 1275930747.800 r r INVITE-43 - 203.0.113.200:5060:udp "
             "203.0.113.1:5060:udp sip:bob@example.net;tag=b1-1 sip:alice@example.com;tag=a1-1 "
             "tr-88h@example.com 200 s-1-tr c-1-tr",
-            "expected": "2010-06-07T17:12:27 [203.0.113.1:5060:udp] - "
+            "expected": "2010-06-07T17:12:27.800000+00:00 [203.0.113.1:5060:udp] - "
             "Session: tr-88h@example.com - Received a INVITE-43 200 response "
             "from sip:alice@example.com;tag=a1-1 (203.0.113.1:5060:udp) "
             "to sip:bob@example.net;tag=b1-1 (203.0.113.200:5060:udp)",
@@ -125,7 +128,7 @@ def test_sip_transformation():
             "input": "173 1275930748.000 r s INVITE-43 - 198.51.100.1:5060:udp "
             "203.0.113.200:5060:udp sip:bob@example.net;tag=b1-1 sip:alice@example.com;tag=a1-1 "
             "tr-88h@example.com 200 s-1-tr c-1-tr",
-            "expected": "2010-06-07T17:12:28 [203.0.113.200:5060:udp] - "
+            "expected": "2010-06-07T17:12:28+00:00 [203.0.113.200:5060:udp] - "
             "Session: tr-88h@example.com - Sent a INVITE-43 200 response "
             "from sip:alice@example.com;tag=a1-1 (203.0.113.200:5060:udp) "
             "to sip:bob@example.net;tag=b1-1 (198.51.100.1:5060:udp)",
@@ -134,7 +137,7 @@ def test_sip_transformation():
             "input": "191 1275930748.201 R s CANCEL-43 sip:bob@bob2.example.net "
             "[2001:db8::9]:5060:udp 203.0.113.200:5060:udp sip:bob@example.net;b2-2 "
             "sip:alice@example.com;tag=a1-1 tr-88h@example.com - s-1-tr c-2-tr",
-            "expected": "2010-06-07T17:12:28 [203.0.113.200:5060:udp] - "
+            "expected": "2010-06-07T17:12:28.201000+00:00 [203.0.113.200:5060:udp] - "
             "Session: tr-88h@example.com - Sent a CANCEL-43 request "
             "from sip:alice@example.com;tag=a1-1 (203.0.113.200:5060:udp) "
             "to sip:bob@bob2.example.net ([2001:db8::9]:5060:udp)",
@@ -143,7 +146,7 @@ def test_sip_transformation():
             "input": "170 1275930748.991 r r INVITE-43 - 203.0.113.200:5060:udp "
             "[2001:db8::9]:5060:udp sip:bob@example.net;b2-2 sip:alice@example.com;tag=a1-1 "
             "tr-88h@example.com 487 s-1-tr c-2-tr",
-            "expected": "2010-06-07T17:12:28 [[2001:db8::9]:5060:udp] - "
+            "expected": "2010-06-07T17:12:28.991000+00:00 [[2001:db8::9]:5060:udp] - "
             "Session: tr-88h@example.com - Received a INVITE-43 487 response "
             "from sip:alice@example.com;tag=a1-1 ([2001:db8::9]:5060:udp) "
             "to sip:bob@example.net;b2-2 (203.0.113.200:5060:udp)",
@@ -152,7 +155,7 @@ def test_sip_transformation():
             "input": "188 1275930749.455 R s ACK-43 sip:bob@bob2.example.net "
             "[2001:db8::9]:5060:udp 203.0.113.200:5060:udp sip:bob@example.net;b2-2 "
             "sip:alice@example.com;tag=a1-1 tr-88h@example.com - s-1-tr c-2-tr",
-            "expected": "2010-06-07T17:12:29 [203.0.113.200:5060:udp] - "
+            "expected": "2010-06-07T17:12:29.455000+00:00 [203.0.113.200:5060:udp] - "
             "Session: tr-88h@example.com - Sent a ACK-43 request from "
             "sip:alice@example.com;tag=a1-1 (203.0.113.200:5060:udp) to sip:bob@bob2.example.net "
             "([2001:db8::9]:5060:udp)",
@@ -161,7 +164,7 @@ def test_sip_transformation():
             "input": "170 1275930750.001 r r CANCEL-43 - 203.0.113.200:5060:udp "
             "[2001:db8::9]:5060:udp sip:bob@example.net;b2-2 sip:alice@example.com;tag=a1-1 "
             "tr-88h@example.com 200 s-1-tr c-2-tr",
-            "expected": "2010-06-07T17:12:30 [[2001:db8::9]:5060:udp] - "
+            "expected": "2010-06-07T17:12:30.001000+00:00 [[2001:db8::9]:5060:udp] - "
             "Session: tr-88h@example.com - Received a CANCEL-43 200 response "
             "from sip:alice@example.com;tag=a1-1 ([2001:db8::9]:5060:udp) "
             "to sip:bob@example.net;b2-2 (203.0.113.200:5060:udp)",
@@ -170,7 +173,7 @@ def test_sip_transformation():
             "input": "170 1275930750.001 r r CANCEL-43 - 203.0.113.200:5060:udp "
             "[2001:db8::9]:5060:udp sip:bob@example.net;b2-2 sip:alice@example.com;tag=a1-1 "
             "tr-88h@example",
-            "expected": None
+            "expected": None,
         },
     ]
 
@@ -187,3 +190,27 @@ def test_sip_transformation():
             assert (
                 result is None
             ), f"Failed for input: {input_log}, Expected: None, Got: {str(result)}"
+
+
+def test_sip_timestamp_precision():
+    sip = SipTransformer()
+    line = (
+        "172 {} R s REGISTER-1 sip:example.com 198.51.100.10:5060:udp 198.51.100.1:5060:udp "
+        "sip:example.com sip:alice@example.com;tag=76yhh f81-d4-f6@example.com - - c-tr-1"
+    )
+    epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+    # Consecutive epochs within and across whole seconds
+    test_cases = [
+        {"input": "1275930743.699", "expected": (1275930743, 699000)},
+        {"input": "1275930743.1234567", "expected": (1275930743, 123456)},
+        {"input": "1275930743.", "expected": (1275930743, 0)},
+        {"input": "1275930744.5", "expected": (1275930744, 500000)},
+        {"input": "1275930743.001", "expected": (1275930743, 1000)},
+    ]
+    for case in test_cases:
+        seconds, microseconds = case["expected"]
+        expected = epoch + timedelta(seconds=seconds, microseconds=microseconds)
+        timestamp = sip.transform(line.format(case["input"])).timestamp
+        assert timestamp == expected, f"Failed for epoch: {case['input']}, Got: {timestamp}"
+        assert timestamp.utcoffset() == timedelta(0), f"Not UTC, Got: {timestamp}"
@@ -1,4 +1,8 @@
-from gla.plugins.transformer.syslog_transformer import SyslogTransformer
+from gla.plugins.transformer.syslog_transformer import (
+    PRIORITIES,
+    SyslogTransformer,
+    decode_priority,
+)
 
 
 def test_syslog_transformation():
@@ -109,3 +113,70 @@ def test_syslog_transformation():
             assert (
                 result is None
             ), f"Failed for input: {input_log}, Expected: None, Got: {str(result)}"
+
+
+def test_syslog_priority_table():
+    assert len(PRIORITIES) == 192, f"Expected 192 entries, Got: {len(PRIORITIES)}"
+    for pri, (facility, severity) in (
+        ("0", ("kern", "EMERGENCY")),
+        ("34", ("auth", "CRITICAL")),
+        ("165", ("local4", "NOTICE")),
+        ("191", ("local7", "DEBUG")),
+        ("300", (None, "WARN")),
+    ):
+        result = decode_priority(pri)
+        assert result == (facility, severity), f"Failed for PRI: {pri}, Got: {result}"
+
+
+def test_syslog_structured_data():
+    syslog = SyslogTransformer()
+
+    test_cases = [
+        {
+            "input": "<34>1 2003-10-11T22:14:15.000003+04:00 192.18.0.9 su 67 ID47 "
+            '[exampleSDID@32473 iut="3" eventSource="Application" eventID="1011"][poooo] '
+            "'su root' failed for lonvick on /dev/pts/8",
+            "facility": "auth",
+            "message": "'su root' failed for lonvick on /dev/pts/8",
+            "expected": {
+                "exampleSDID@32473": {"iut": "3", "eventSource": "Application", "eventID": "1011"},
+                "poooo": {},
+            },
+        },
+        {
+            "input": "<165>1 2003-10-11T22:14:15.003Z mymachine evntslog 12 ID47 "
+            r'[origin ip="192.0.2.1" note="a \"quoted\\ [x\] value"][meta seq="7"] '
+            "An application event [not structured data]",
+            "facility": "local4",
+            "message": "An application event [not structured data]",
+            "expected": {
+                "origin": {"ip": "192.0.2.1", "note": 'a "quoted\\ [x] value'},
+                "meta": {"seq": "7"},
+            },
+        },
+        {
+            "input": "<165>1 2003-10-11T22:14:15.003Z mymachine evntslog 12 ID47 - No data",
+            "facility": "local4",
+            "message": "No data",
+            "expected": {},
+        },
+        {
+            "input": "<165>Jul 20 17:41:00 example.com example: This is a test message",
+            "facility": "local4",
+            "message": "This is a test message",
+            "expected": {},
+        },
+    ]
+
+    for case in test_cases:
+        input_log = case["input"]
+        expected_result = case["expected"]
+        result = syslog.transform(input_log)
+
+        assert result.facility == case["facility"], f"Failed for input: {input_log}"
+        assert result._structured_data is None, f"Parsed eagerly for input: {input_log}"
+        assert result.message == case["message"], f"Failed for input: {input_log}"
+        data = result.structured_data
+        assert (
+            data == expected_result
+        ), f"Failed for input: {input_log}, Expected: {expected_result}, Got: {data}"
@@ -1,8 +1,11 @@
+import asyncio
+import json
 import os
+from functools import partial
 
 from pytest import raises
 
-from gla.plugins.transformer import Transformer
+from gla.plugins.transformer import CustomTransformer, Transformer
 from gla.plugins.transformer.cef_transformer import CefTransformer
 from gla.plugins.transformer.json_transformer import JsonTransformer
 from gla.plugins.transformer.log4j_transformer import Log4jTransformer
@@ -61,6 +64,57 @@ def test_transformer_factory_undetermined():
         trans.get_transformer(os.path.join(os.path.dirname(__file__), "logs", "test-unk.log"))
 
 
+def test_transformer_sniff(tmp_path):
+    trans = Transformer(
+        [
+            JsonTransformer(),
+            SyslogTransformer(),
+            Log4jTransformer(),
+            NcsaTransformer(),
+            SipTransformer(),
+            CefTransformer(),
+            XMLTransformer(),
+        ]
+    )
+    result, confidence = trans.sniff(
+        os.path.join(os.path.dirname(__file__), "logs", "test-ncsa.log")
+    )
+    assert isinstance(result, NcsaTransformer), "Should resolve as ncsa transformer"
+    assert confidence == 1.0, "Every sampled line should be recognized"
+
+    # A first line no transformer recognizes no longer hides the format
+    path = tmp_path / "mixed.log"
+    path.write_text(
+        "=== service restarted ===\n"
+        "\n"
+        "2020-02-01 [main] ERROR api.service - Failed\n"
+        "2020-02-01 [main] INFO api.service - Retrying\n"
+        "2020-02-02 [main] INFO api.service - Recovered\n"
+    )
+    result, confidence = trans.sniff(str(path))
+    assert isinstance(result, Log4jTransformer), "Should resolve as log4j transformer"
+    assert confidence == 0.75, "Blank lines should not be sampled"
+    assert trans.get_transformer(str(path)) is result, "Should resolve as the sniffed transformer"
+
+    result, confidence = trans.sniff(
+        os.path.join(os.path.dirname(__file__), "logs", "test-unk.log")
+    )
+    assert result is None and confidence == 0.0, "Should not resolve any transformer"
+
+
+def test_transformer_sniff_leaves_no_resolver_state(tmp_path):
+    path = tmp_path / "syslog.log"
+    path.write_text("<34>1 2003-10-11T22:14:15.003Z mymachine su 67 ID47 - 'su root' failed\n")
+    syslog = SyslogTransformer(cache=True)
+
+    result, _ = Transformer([syslog]).sniff(str(path))
+
+    assert result is syslog
+    assert (
+        result.transform("<165>Jul 20 17:41:00 example.com example: a message") is not None
+    ), "Should not keep the strategy cached while sniffing"
+
+
 def test_transformer_by_name():
     trans = Transformer(
         [
@@ -87,3 +141,220 @@ def test_transformer_by_name():
     assert isinstance(result, SipTransformer), "Should resolve as sip transformer"
     result = trans.get_transformer("log4j")
     assert isinstance(result, Log4jTransformer), "Should resolve as log4j transformer"
+
+
+def test_transform_file():
+    batch = NcsaTransformer().transform_file(
+        os.path.join(os.path.dirname(__file__), "logs", "test-ncsa.log")
+    )
+    logs = list(batch)
+
+    assert len(logs) == 12
+    assert batch.parsed == 12
+    assert batch.skipped == 0
+    assert batch.failed == 0
+
+
+def test_transform_many():
+    batch = Log4jTransformer().transform_many(
+        [
+            "2020-02-01 [main] ERROR class.example - Error message goes here\n",
+            "   \n",
+            "not a log4j line",
+            "2020-02-02 [main] INFO class.example - Recovered",
+        ]
+    )
+    logs = list(batch)
+
+    assert [log.message for log in logs] == ["Error message goes here", "Recovered"]
+    assert batch.parsed == 2
+    assert batch.skipped == 1
+    assert batch.failed == 1
+
+
+def test_transform_many_counts_errors():
+    batch = CustomTransformer([";", "time", "lvl", "msg"]).transform_many(
+        ["2024-05-09;WARNING;hello world", "2024-05-09;WARNING;hello;world"]
+    )
+
+    assert len(list(batch)) == 1
+    assert batch.parsed == 1
+    assert batch.failed == 1
+
+
+def test_transform_records():
+    lines = [
+        "\tat com.example.Orphan.run(Orphan.java:1)\n",
+        "2020-02-01 [main] ERROR api.service - Request failed\n",
+        "java.lang.IllegalStateException: boom\n",
+        "\tat com.example.Api.handle(Api.java:42)\n",
+        "   \n",
+        "Caused by: java.io.IOException: closed\n",
+        "\t... 12 more\n",
+        "  2020-02-02 [main] INFO api.service - Recovered\n",
+    ]
+    batch = Log4jTransformer().transform_records(lines)
+    logs = list(batch)
+
+    assert [log.message for log in logs] == [
+        "Request failed\n"
+        "java.lang.IllegalStateException: boom\n"
+        "\tat com.example.Api.handle(Api.java:42)\n"
+        "Caused by: java.io.IOException: closed\n"
+        "\t... 12 more",
+        "Recovered",
+    ]
+    assert (batch.parsed, batch.skipped, batch.failed) == (2, 1, 1)
+    assert (batch.continued, batch.truncated) == (4, 0)
+
+    # Continuation lines past the cap are dropped, the next record is unaffected
+    batch = Log4jTransformer().transform_records(lines, max_pending=50)
+    logs = list(batch)
+
+    assert logs[0].message == "Request failed\njava.lang.IllegalStateException: boom"
+    assert logs[1].message == "Recovered"
+    assert (batch.continued, batch.truncated) == (1, 3)
+
+    with raises(ValueError, match="pending record cap must be atleast 'one'"):
+        Log4jTransformer().transform_records(lines, max_pending=0)
+
+
+def test_transform_file_records(tmp_path):
+    path = tmp_path / "syslog.log"
+    path.write_text(
+        "<165>Jul 20 17:41:00 example.com example: Traceback (most recent call last):\n"
+        '  File "app.py", line 1, in <module>\n'
+        "ValueError: boom\n"
+        "<165>Jul 20 17:41:01 example.com example: Recovered\n"
+    )
+    batch = SyslogTransformer().transform_file_records(str(path))
+
+    assert [log.message for log in batch] == [
+        'Traceback (most recent call last):\n  File "app.py", line 1, in <module>\n'
+        "ValueError: boom",
+        "Recovered",
+    ]
+    assert (batch.parsed, batch.continued, batch.failed) == (2, 2, 0)
+
+
+def test_transform_mapped():
+    cases = [
+        (Log4jTransformer, "test-log4j.log"),
+        (partial(Log4jTransformer, learn=True), "test-log4j.log"),
+        (SyslogTransformer, "test-syslog.log"),
+        (NcsaTransformer, "test-ncsa.log"),
+        (SipTransformer, "test-sip.log"),
+        (CefTransformer, "test-cef.log"),
+    ]
+
+    for transformer, log in cases:
+        path = os.path.join(os.path.dirname(__file__), "logs", log)
+        expected = transformer().transform_file(path)
+        result = transformer().transform_mapped(path)
+        assert [str(log) for log in result] == [str(log) for log in expected], log
+        assert (result.parsed, result.skipped, result.failed) == (
+            expected.parsed,
+            expected.skipped,
+            expected.failed,
+        ), log
+
+
+def test_transform_mapped_crlf(tmp_path):
+    path = tmp_path / "log4j.log"
+    lines = (
+        "2020-02-01 [main] ERROR {module}.service - Failed\r\n"
+        "\r\n"
+        "  2020-02-02 [main] INFO api.service - Recovered  \r\n"
+    )
+
+    # Non-ASCII files are decoded line by line instead of matched in place
+    for module in ("cafe", "café"):
+        path.write_bytes(lines.format(module=module).encode("utf-8"))
+        expected = Log4jTransformer().transform_file(str(path))
+        result = Log4jTransformer().transform_mapped(str(path))
+        assert [str(log) for log in result] == [str(log) for log in expected]
+        assert (result.parsed, result.skipped, result.failed) == (2, 1, 0)
+
+
+def test_transformer_shared_strategies():
+    for transformer in (
+        Log4jTransformer,
+        SyslogTransformer,
+        NcsaTransformer,
+        SipTransformer,
+        CefTransformer,
+    ):
+        first, second = transformer(), transformer()
+        assert first._strategies is second._strategies, transformer.__name__
+        assert first.binary()._strategies == second.binary()._strategies, transformer.__name__
+
+    # Only the resolver state is per instance
+    rfc5424 = "<34>1 2003-10-11T22:14:15.003Z mymachine su 67 ID47 - 'su root' failed"
+    rfc3164 = "<165>Jul 20 17:41:00 example.com example: This is a test message"
+    first = SyslogTransformer(cache=True)
+    second = SyslogTransformer(cache=True)
+    assert first.transform(rfc5424) is not None
+    assert first.transform(rfc3164) is None, "Should keep the cached RFC 5424 strategy"
+    assert second.transform(rfc3164) is not None, "Should not share the cached strategy"
+
+
+def test_follow(tmp_path):
+    path = tmp_path / "log4j.log"
+    path.write_text("2020-02-01 [main] INFO old.service - Already there\n")
+    messages = []
+
+    async def follow():
+        logs = Log4jTransformer().follow(str(path))
+        try:
+            async for log in logs:
+                messages.append(log.message)
+                if len(messages) == 2:
+                    break
+        finally:
+            await logs.aclose()
+
+    async def write():
+        await asyncio.sleep(0.1)
+        with path.open("a", encoding="utf-8") as file:
+            file.write(
+                "2020-02-01 [main] ERROR api.service - Failed\n"
+                "not a log4j line\n"
+                "2020-02-02 [main] INFO api.service - Recovered\n"
+            )
+
+    async def main():
+        await asyncio.gather(asyncio.wait_for(follow(), 10), write())
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(main())
+    finally:
+        loop.close()
+
+    assert messages == ["Failed", "Recovered"]
+
+
+def test_follow_persists_state_on_close(tmp_path):
+    path = tmp_path / "log4j.log"
+    state = tmp_path / "log4j.log.offset"
+    first = "2020-02-01 [main] ERROR api.service - Failed\n"
+    path.write_text(first + "2020-02-02 [main] INFO api.service - Recovered\n")
+
+    async def follow():
+        logs = Log4jTransformer().follow(str(path), str(state), from_start=True)
+        try:
+            async for log in logs:
+                assert log.message == "Failed"
+                break
+        finally:
+            await logs.aclose()
+        # Persisted by the time closing returns, not once the loop gets around to it
+        return json.loads(state.read_text())
+
+    loop = asyncio.new_event_loop()
+    try:
+        saved = loop.run_until_complete(asyncio.wait_for(follow(), 10))
+    finally:
+        loop.close()
+
+    assert saved["offset"] == len(first), "Should persist the offset of the lines handed out"
@@ -1,5 +1,6 @@
 import os
 import xml.etree.ElementTree as ET
+from io import BytesIO
 from xml.etree.ElementTree import iterparse
 
 from gla.plugins.transformer.xml_transformer import XMLTransformer
@@ -30,3 +31,58 @@ def test_xml():
         res = xml.transform(elem)
         if res:
             assert res.message != ""
+
+
+def test_xml_transform_file():
+    batch = XMLTransformer().transform_file(
+        os.path.join(os.path.dirname(__file__), "logs", "test.xml")
+    )
+    logs = list(batch)
+
+    assert len(logs) == 100, "Every event of the UTF-16-LE export should be transformed"
+    assert (batch.parsed, batch.failed) == (100, 0)
+    assert logs[0].source == "WIN-8DB3AVTF2VF"
+
+
+def test_xml_transform_stream_encodings():
+    events = (
+        "<Event xmlns='http://schemas.microsoft.com/win/2004/08/events/event'><System>"
+        "<Provider Name='Service'/><EventID>{id}</EventID><Level>2</Level>"
+        "<TimeCreated SystemTime='2024-08-18T00:03:27.788541Z'/><Computer>host-é</Computer>"
+        "</System></Event>\n"
+    )
+    document = "".join(events.format(id=number) for number in range(3))
+    declared = f'<?xml version="1.0" encoding="latin-1"?>\n<Events>{document}</Events>'
+
+    for encoding, data in (
+        ("utf-8", document.encode("utf-8")),
+        ("utf-8-sig", document.encode("utf-8-sig")),
+        ("utf-16-le", document.encode("utf-16-le")),
+        ("utf-16-be", document.encode("utf-16-be")),
+        ("utf-16", document.encode("utf-16")),
+        ("latin-1", declared.encode("latin-1")),
+    ):
+        logs = list(XMLTransformer().transform_stream(BytesIO(data)))
+        assert [log.message for log in logs] == [
+            "EventID: 0",
+            "EventID: 1",
+            "EventID: 2",
+        ], f"Failed for encoding: {encoding}"
+        assert logs[0].source == "host-é", f"Failed for encoding: {encoding}"
+
+
+def test_xml_jlu_record():
+    xml = XMLTransformer()
+
+    record = ET.fromstring(
+        "<record><date>2015-02-27T09:35:44.885562Z</date><logger>kgh.test.fred</logger>"
+        "<level>SEVERE</level><thread>10</thread><message>Failed</message>"
+        "<exception><message>java.lang.NullPointerException</message></exception></record>"
+    )
+    result = xml.transform(record)
+    # Only the record's own children are read, not the exception's message
+    assert str(result) == "2015-02-27T09:35:44.885562+00:00 SEVERE [10] kgh.test.fred - Failed"
+    assert xml.transform(ET.fromstring("<log><record/></log>")) is None, "Should route by tag"
+
+    batch = xml.transform_file(os.path.join(os.path.dirname(__file__), "logs", "test-jlu.log"))
+    assert [log.message for log in batch] == ["Hello world!"] * 7
@@ -3,11 +3,37 @@ The `transformer` module is an abstract class designed to allow extensibility fo
 log transformation. It serves as the base class for creating log transformers
 that convert log entries into structured `Log` objects and validate log files.
 """
+import os
 from abc import abstractmethod
-from typing import Any, List, Optional
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from gla.models.log import Log
+from gla.plugins.resolver.resolver import Resolver
 from gla.plugins.validator.validator import Validator
+from gla.utilities.follow import FileFollower
+from gla.utilities.lines import MappedLines
+from gla.utilities.strategy import RegexStrategy
+
+# Read buffer size when streaming log files
+BUFFER_SIZE = 1 << 16
+
+# Number of lines, and the byte size they are read from, sampled to detect a log format
+SAMPLE_LINES = 64
+SAMPLE_SIZE = 1 << 16
+
+# Characters of continuation lines kept per multi-line record
+MAX_PENDING = 1 << 16
 
 
 class BaseTransformer:
@@ -24,8 +50,344 @@ class BaseTransformer:
             entry (Any): a log entry to transform
         """
 
+    def transform_many(self, entries: Iterable[Any]) -> "TransformBatch":
+        """Lazily transforms many log entries into `Log` objects
+
+        Args:
+            entries (Iterable[Any]): the log entries to transform
+        """
+        return TransformBatch(self.transform, entries)
+
+    def transform_file(self, path: str, encoding: str = "utf-8") -> "TransformBatch":
+        """Lazily transforms every line of a log file into `Log` objects
+
+        NOTE: the file is read line by line so memory stays constant regardless of its size
+
+        Args:
+            path (str): the log file to transform
+            encoding (str): the encoding of the log file
+        """
+        return TransformBatch(self.transform, _read_lines(path, encoding))
+
+    async def follow(
+        self, path: str, state: Optional[str] = None, from_start: bool = False
+    ) -> AsyncGenerator[Log, None]:
+        """Transforms the lines appended to a live log file into `Log` objects as they are written
+
+        NOTE: see `FileFollower` for how truncation, rotation and resuming from `state` work.
+        Closing the returned generator persists the offset of the lines handed out so far
+
+        ```
+        async for log in transformer.follow("app.log", state="app.log.offset"):
+            ...
+        ```
+
+        Args:
+            path (str): the log file to follow
+            state (Optional[str]): a file to persist the read offset to
+            from_start (bool): whether to start from the beginning of the file instead of its end
+        """
+        transform = self.transform
+        lines = FileFollower(path, state, from_start).lines()
+        try:
+            async for line in lines:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    log = transform(line)
+                except (ValueError, TypeError):
+                    continue
+                if log is not None:
+                    yield log
+        finally:
+            # Closing the lines persists their offset, which garbage collection would not
+            await lines.aclose()
+
+
+class TransformBatch:
+    """
+    The `TransformBatch` class is responsible for streaming `Log` objects out of
+    many log entries while counting how each entry went
+    """
+
+    def __init__(self, transform: Callable[[Any], Optional[Log]], entries: Iterable[Any]):
+        self._transform = transform
+        self._entries = entries
+        self.parsed = 0
+        """The number of entries transformed into a `Log`"""
+        self.skipped = 0
+        """The number of blank entries"""
+        self.failed = 0
+        """The number of entries that could not be transformed"""
+
+    def __iter__(self) -> Iterator[Log]:
+        transform = self._transform
+        for entry in self._entries:
+            if isinstance(entry, str):
+                entry = entry.strip()
+                if not entry:
+                    self.skipped += 1
+                    continue
+            elif isinstance(entry, (bytes, list)) and not entry:
+                # Empty byte lines and records are blank lines
+                self.skipped += 1
+                continue
+            try:
+                log = transform(entry)
+            except (ValueError, TypeError):
+                log = None
+            if log is None:
+                self.failed += 1
+                continue
+            self.parsed += 1
+            yield log
+
+
+class RecordBatch:
+    """
+    The `RecordBatch` class is responsible for streaming `Log` objects out of
+    lines where a record may span several of them, such as a stack trace
+    following the line that logged it
+    """
+
+    def __init__(self, transformer: "BaseRegexTransformer", lines: Iterable[str], max_pending: int):
+        if max_pending < 1:
+            raise ValueError("pending record cap must be atleast 'one'")
+        self._transformer = transformer
+        self._lines = lines
+        self._max_pending = max_pending
+        self.parsed = 0
+        """The number of records transformed into a `Log`"""
+        self.skipped = 0
+        """The number of blank lines"""
+        self.failed = 0
+        """The number of lines that could not be transformed nor attached to a record"""
+        self.continued = 0
+        """The number of continuation lines attached to a record"""
+        self.truncated = 0
+        """The number of continuation lines dropped once a record reached the cap"""
+
+    def __iter__(self) -> Iterator[Log]:
+        starts = self._transformer.starts_record
+        resolve = self._transformer.resolve
+        to_log = self._transformer.to_log
+        max_pending = self._max_pending
+        log: Optional[Log] = None
+        pending: List[str] = []
+        size = 0
+        for line in self._lines:
+            line = line.rstrip()
+            if not line:
+                self.skipped += 1
+                continue
+
+            match = resolve(line.lstrip()) if starts(line) else None
+            if match is None:
+                if log is None:
+                    self.failed += 1
+                elif size + len(line) > max_pending:
+                    # Once a line is dropped, so are the rest, keeping the record contiguous
+                    self.truncated += 1
+                    size = max_pending
+                else:
+                    self.continued += 1
+                    pending.append(line)
+                    size += len(line) + 1
+                continue
+
+            if log is not None:
+                yield self._complete(log, pending)
+            pending = []
+            size = 0
+            try:
+                log = to_log(match.groupdict())
+                self.parsed += 1
+            except (ValueError, TypeError):
+                log = None
+                self.failed += 1
+
+        if log is not None:
+            yield self._complete(log, pending)
+
+    @staticmethod
+    def _complete(log: Log, pending: List[str]) -> Log:
+        """Appends the continuation lines of a record to its message"""
+        if pending:
+            pending.insert(0, log.message or "")
+            log.message = "\n".join(pending)
+        return log
+
+
+def _read_lines(path: str, encoding: str) -> Iterator[str]:
+    with open(path, "r", encoding=encoding, buffering=BUFFER_SIZE) as file:
+        yield from file
+
+
+def read_sample(path: str, lines: int = SAMPLE_LINES, size: int = SAMPLE_SIZE) -> List[str]:
+    """Reads the first non blank lines of a log file with a single bounded read
+
+    NOTE: a file that is not valid `utf-8` yields an empty sample
+
+    Args:
+        path (str): the log file to sample
+        lines (int): the most lines to sample
+        size (int): the most bytes to read
+    """
+    with open(path, "rb") as file:
+        data = file.read(size)
+    if len(data) == size and b"\n" in data:
+        # Drops the last line, which may be cut short
+        data = data[: data.rindex(b"\n")]
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        return []
+    return [line for line in (line.strip() for line in text.splitlines()) if line][:lines]
+
+
 class BaseTransformerValidator(BaseTransformer, Validator):
-    ...
+    """
+    The `BaseTransformerValidator` is an abstract class for transformers
+    which can be detected from their input
+    """
+
+    def score(self, sample: List[str]) -> float:  # pylint: disable=unused-argument
+        """Scores how well a sample of log lines fits this transformer
+
+        NOTE: transformers that cannot recognize single lines score `0.0`
+        and are only resolved by name
+
+        Args:
+            sample (List[str]): non blank lines of a log file
+        """
+        return 0.0
+
+
+class BaseRegexTransformer(BaseTransformerValidator, Resolver):
+    """
+    The `BaseRegexTransformer` is an abstract class for transformers resolving
+    log entries with `RegexStrategy` strategies
+
+    NOTE: the strategies are compiled once per class into `STRATEGIES` and shared
+    by every instance, which only holds its own resolver state. Subclasses may
+    also derive from a more specific `Resolver`, such as a `DispatchResolver`
+    """
+
+    STRATEGIES: Tuple[RegexStrategy, ...] = ()
+
+    def transform(self, entry: str) -> Optional[Log]:
+        match = self.resolve(entry)
+        if match:
+            return self.to_log(match.groupdict())
+        return None
+
+    def score(self, sample: List[str]) -> float:
+        if not sample:
+            return 0.0
+        # A throwaway resolver, so the sample leaves no cached strategy nor hit counts behind
+        resolve = Resolver(self.STRATEGIES, False).resolve
+        return sum(1 for line in sample if resolve(line) is not None) / len(sample)
+
+    @abstractmethod
+    def to_log(self, res: Dict[str, Optional[str]]) -> Log:
+        """Converts the named groups of a matched log entry into a `Log` object
+
+        Args:
+            res (Dict[str, Optional[str]]): the named groups of the match
+        """
+
+    def transform_mapped(self, path: str, encoding: str = "utf-8") -> TransformBatch:
+        """Lazily transforms every line of a memory-mapped log file into `Log` objects
+
+        NOTE: the file is read in bounded blocks, the lines of a block holding only
+        ASCII bytes go through `ascii_transform` so only the groups of a match need
+        decoding, those of any other block are decoded and handed to `transform`
+
+        Args:
+            path (str): the log file to transform
+            encoding (str): the encoding of the log file
+        """
+        transform_ascii = self.ascii_transform()
+        transform = self.transform
+
+        def transform_line(line: Union[bytes, str]) -> Optional[Log]:
+            if isinstance(line, bytes):
+                return transform_ascii(line)
+            return transform(line)
+
+        return TransformBatch(transform_line, MappedLines(path).lines(encoding))
+
+    def ascii_transform(self) -> Callable[[bytes], Optional[Log]]:
+        """Creates the function transforming ASCII byte log entries, which matches them
+        in place so only the groups of a match get decoded
+
+        NOTE: transformers splitting a `str` entry faster than their regular expressions
+        match it should decode the entries and `transform` them instead
+        """
+        resolve = self.binary().resolve
+        to_log = self.to_log
+
+        def transform(entry: bytes) -> Optional[Log]:
+            match = resolve(entry)
+            if match:
+                return to_log(
+                    {
+                        name: None if value is None else value.decode("ascii")
+                        for name, value in match.groupdict().items()
+                    }
+                )
+            return None
+
+        return transform
+
+    def starts_record(self, line: str) -> bool:
+        """Whether a line can start a record rather than continue the previous one
+
+        NOTE: only lines starting a record are resolved when assembling multi-line
+        records, an indented line continues the previous record by default
+
+        Args:
+            line (str): a line without its line ending
+        """
+        return not line[:1].isspace()
+
+    def transform_records(
+        self, entries: Iterable[str], max_pending: int = MAX_PENDING
+    ) -> RecordBatch:
+        """Lazily transforms lines into `Log` objects, attaching continuation lines,
+        such as a stack trace, to the message of the record they follow
+
+        NOTE: once the continuation lines of a record hold `max_pending` characters,
+        any further ones are dropped and counted as truncated
+
+        Args:
+            entries (Iterable[str]): the lines to transform
+            max_pending (int): the most characters of continuation lines kept per record
+
+        Raises:
+            ValueError: if `max_pending` is less than one
+        """
+        return RecordBatch(self, entries, max_pending)
+
+    def transform_file_records(
+        self, path: str, encoding: str = "utf-8", max_pending: int = MAX_PENDING
+    ) -> RecordBatch:
+        """Lazily transforms a log file with multi-line records into `Log` objects
+
+        NOTE: see `transform_records`, the file is read line by line and at most one
+        record is pending at a time
+
+        Args:
+            path (str): the log file to transform
+            encoding (str): the encoding of the log file
+            max_pending (int): the most characters of continuation lines kept per record
+
+        Raises:
+            ValueError: if `max_pending` is less than one
+        """
+        return RecordBatch(self, _read_lines(path, encoding), max_pending)
+
 
 class Transformer:
     """
@@ -39,13 +401,46 @@ class Transformer:
     def get_transformer(self, data: str) -> BaseTransformer:
         """Get a transformer to process log messages
 
+        NOTE: a log file is detected with `sniff`, anything else is validated
+        against each transformer in turn
+
         Args:
             data (str): input data to validate against
 
         Raises:
             ValueError: if a transformer cannot be determined
         """
+        if os.path.isfile(data):
+            transformer, _ = self.sniff(data)
+            if transformer is not None:
+                return transformer
+            raise ValueError("transformer could not be determined")
+
         for transformer in self._transformers:
             if transformer.validate(data):
                 return transformer
         raise ValueError("transformer could not be determined")
+
+    def sniff(
+        self, path: str, lines: int = SAMPLE_LINES
+    ) -> Tuple[Optional[BaseTransformerValidator], float]:
+        """Detects the format of a log file by scoring every transformer against one sample
+
+        NOTE: the confidence is the fraction of sampled lines the best transformer
+        recognizes, ties go to the transformer registered first
+
+        Args:
+            path (str): the log file to detect
+            lines (int): the most lines to sample
+
+        Returns:
+            the best transformer and its confidence, or `None` and `0.0` when none fits
+        """
+        sample = read_sample(path, lines)
+        best: Optional[BaseTransformerValidator] = None
+        confidence = 0.0
+        for transformer in self._transformers:
+            score = transformer.score(sample)
+            if score > confidence:
+                best, confidence = transformer, score
+        return best, confidence
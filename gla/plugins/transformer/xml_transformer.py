@@ -3,16 +3,37 @@ The `xml_transformer` module is responsible for transforming XML-based log
 messages into structured `Log` objects. It supports various XML formats,
 including `Java Logging Util` (JLU) and `Windows Event Logs`
 """
-from typing import Optional, Union
-from xml.etree.ElementTree import Element
+import codecs
+import re
+from typing import BinaryIO, Dict, Iterator, List, Optional
+from xml.etree.ElementTree import Element, XMLPullParser
 
-import dateparser
-
-from gla.constants import LANGUAGES_SUPPORTED
 from gla.models.log import Log
-from gla.plugins.resolver.resolver import Resolver
-from gla.plugins.transformer.transformer import BaseTransformerValidator
+from gla.plugins.transformer.transformer import (
+    BUFFER_SIZE,
+    BaseTransformerValidator,
+    TransformBatch,
+)
 from gla.utilities.strategy import Strategy
+from gla.utilities.timestamp import TimestampMemo, TimestampParser
+
+# Byte order marks, longest first as the UTF-32-LE one starts like the UTF-16-LE one
+_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+# The encoding named by an XML declaration
+_DECLARED = re.compile(rb"""^\s*<\?xml[^>]*?encoding\s*=\s*["']([A-Za-z0-9._-]+)["']""")
+
+# Declarations, processing instructions, comments and doctypes preceding the first element
+_PROLOG = re.compile(r"\s*(?:<\?.*?\?>|<!--.*?-->|<!DOCTYPE[^\[>]*(?:\[.*?\])?\s*>)", re.DOTALL)
+
+# Wraps the input, so files of many top-level events parse as one document
+_WRAPPER = "gla-stream"
 
 
 class JLU(Strategy):
@@ -21,22 +42,25 @@ class JLU(Strategy):
     of `Java Logging Util` xml DTD schema
     """
 
+    # Child tags mapped to the fields they fill
+    FIELDS = {
+        "level": "level",
+        "message": "message",
+        "logger": "module",
+        "thread": "source",
+        "date": "timestamp",
+    }
+
     def match(self, entry: Element) -> Optional[dict]:
-        if entry.tag == "record":
-            res = {}
-            for child in entry.getiterator():
-                if child.tag == "level":
-                    res["level"] = child.text
-                if child.tag == "message":
-                    res["message"] = child.text
-                if child.tag == "logger":
-                    res["module"] = child.text
-                if child.tag == "thread":
-                    res["source"] = child.text
-                if child.tag == "date":
-                    res["timestamp"] = child.text
-            return res
-        return None
+        if entry.tag != "record":
+            return None
+        fields = self.FIELDS
+        res = {}
+        for child in entry:
+            field = fields.get(child.tag)
+            if field is not None:
+                res[field] = child.text
+        return res
 
 
 class WinEvent(Strategy):
@@ -46,22 +70,51 @@ class WinEvent(Strategy):
     """
 
     NS = "{http://schemas.microsoft.com/win/2004/08/events/event}"
+    EVENT = f"{NS}Event"
+    SYSTEM = f"{NS}System"
+    EVENT_DATA = f"{NS}EventData"
+    DATA = f"{NS}Data"
+
+    # `System` child tags mapped to the field they fill and the attribute holding it,
+    # `None` for their text
+    FIELDS = {
+        f"{NS}Provider": ("module", "Name"),
+        f"{NS}EventID": ("event_id", None),
+        f"{NS}Level": ("level", None),
+        f"{NS}TimeCreated": ("timestamp", "SystemTime"),
+        f"{NS}Computer": ("source", None),
+    }
+
+    LEVELS = {"1": "CRITICAL", "2": "ERROR", "3": "WARNING", "4": "INFO", "5": "DEBUG"}
 
     def match(self, entry: Element) -> Optional[dict]:
-        if entry.tag != f"{self.NS}Event":
+        if entry.tag != self.EVENT:
             return None
 
-        res = {
-            "module": self._get_attribute(entry, f"{self.NS}System/{self.NS}Provider", "Name"),
-            "level": self._to_lvl(self._get_text(entry, f"{self.NS}System/{self.NS}Level")),
-            "source": self._get_text(entry, f"{self.NS}System/{self.NS}Computer"),
-            "timestamp": self._get_attribute(
-                entry, f"{self.NS}System/{self.NS}TimeCreated", "SystemTime"
-            ),
+        fields = self.FIELDS
+        res: Dict[str, Optional[str]] = {
+            "module": None,
+            "level": None,
+            "source": None,
+            "timestamp": None,
         }
-
-        event_id = self._get_text(entry, f"{self.NS}System/{self.NS}EventID")
-        data_entries = entry.findall(f".//{self.NS}EventData/{self.NS}Data")
+        event_id = None
+        data_entries: List[Element] = []
+        for section in entry:
+            if section.tag == self.SYSTEM:
+                for child in section:
+                    target = fields.get(child.tag)
+                    if target is None:
+                        continue
+                    field, attribute = target
+                    value = child.text if attribute is None else child.get(attribute)
+                    if field == "event_id":
+                        event_id = value
+                    else:
+                        res[field] = value
+            elif section.tag == self.EVENT_DATA:
+                data_entries.extend(data for data in section if data.tag == self.DATA)
+        res["level"] = self.LEVELS.get(res["level"] or "")
 
         extra_data = {data.get("Name"): data.text for data in data_entries if data.get("Name")}
         data_pieces = [data.text for data in data_entries if not data.get("Name") and data.text]
@@ -75,46 +128,129 @@ class WinEvent(Strategy):
         res["message"] = " - ".join(message_parts)
         return res
 
-    def _to_lvl(self, level: Union[str, None]):
-        """Converts window events integer levels to respective log severity levels"""
-        if level == "1":
-            return "CRITICAL"
-        if level == "2":
-            return "ERROR"
-        if level == "3":
-            return "WARNING"
-        if level == "4":
-            return "INFO"
-        if level == "5":
-            return "DEBUG"
-        else:
-            return None
 
-    def _get_text(self, entry: Element, path: str) -> Optional[str]:
-        element = entry.find(f".//{path}")
-        return element.text if element is not None else None
+# Record tags mapped to the strategy transforming them
+_ROUTES: Dict[str, Strategy] = {"record": JLU(), WinEvent.EVENT: WinEvent()}
+
+# The elements transformed into a `Log` when streaming
+RECORDS = frozenset(_ROUTES)
+
+
+def detect_encoding(head: bytes) -> str:
+    """Detects the encoding of an XML document from its first bytes
+
+    NOTE: byte order marks come first, then the layout of a leading `<` in
+    UTF-16 or UTF-32, then the XML declaration, defaulting to `utf-8`
+
+    Args:
+        head (bytes): the first bytes of the document
+    """
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return encoding
+    if head[:4] == b"<\x00\x00\x00":
+        return "utf-32-le"
+    if head[:4] == b"\x00\x00\x00<":
+        return "utf-32-be"
+    if head[:2] == b"<\x00":
+        return "utf-16-le"
+    if head[:2] == b"\x00<":
+        return "utf-16-be"
+    declared = _DECLARED.match(head)
+    if declared is not None:
+        return declared.group(1).decode("ascii")
+    return "utf-8"
+
 
-    def _get_attribute(self, entry: Element, path: str, attr: str) -> Optional[str]:
-        element = entry.find(f"./{path}")
-        return element.get(attr) if element is not None else None
+def _chunks(stream: BinaryIO, encoding: Optional[str]) -> Iterator[str]:
+    """Decodes a binary stream chunk by chunk, wrapping its elements in `_WRAPPER`"""
+    head = stream.read(BUFFER_SIZE)
+    decoder = codecs.getincrementaldecoder(encoding or detect_encoding(head))()
+    text = decoder.decode(head, not head)
 
+    # The wrapper must open after the prolog, which has to stay first
+    end = 0
+    prolog = _PROLOG.match(text)
+    while prolog is not None and prolog.end() > end:
+        end = prolog.end()
+        prolog = _PROLOG.match(text, end)
+    yield f"{text[:end]}<{_WRAPPER}>{text[end:]}"
 
-class XMLTransformer(BaseTransformerValidator, Resolver):
+    data = head
+    while data:
+        data = stream.read(BUFFER_SIZE)
+        yield decoder.decode(data, not data)
+    yield f"</{_WRAPPER}>"
+
+
+def iter_records(stream: BinaryIO, encoding: Optional[str] = None) -> Iterator[Element]:
+    """Pulls each `record` and `Event` element out of an XML stream
+
+    NOTE: an element is cleared and detached once the next one is requested, so
+    memory stays flat however large the stream is. The stream may hold one document
+    or many top-level elements, as exported Windows Events do
+
+    Args:
+        stream (BinaryIO): the binary XML stream
+        encoding (Optional[str]): the encoding of the stream, detected when `None`
+
+    Raises:
+        ParseError: if the stream is not well-formed XML
+    """
+    parser = XMLPullParser(events=("start", "end"))
+    parents = []
+    inside = 0
+    for chunk in _chunks(stream, encoding):
+        # The chunks are already decoded, which the parser accepts though older stubs omit it
+        parser.feed(chunk)  # type: ignore[arg-type]
+        for event, element in parser.read_events():
+            if event == "start":
+                parents.append(element)
+                if element.tag in RECORDS:
+                    inside += 1
+                continue
+
+            parents.pop()
+            if element.tag not in RECORDS:
+                continue
+            inside -= 1
+            if inside:
+                # Nested in another record
+                continue
+            yield element
+            element.clear()
+            if parents:
+                parents[-1].remove(element)
+    parser.close()
+
+
+def _file_records(path: str, encoding: Optional[str]) -> Iterator[Element]:
+    with open(path, "rb") as stream:
+        yield from iter_records(stream, encoding)
+
+
+class XMLTransformer(BaseTransformerValidator):
     """
     The `XMLTransformer` class is responsible for handling transformation
     of `xml` log messages
     """
 
-    def __init__(self, cache: bool = False):
+    def __init__(self, cache: bool = False, memo: Optional[TimestampMemo] = None):
         """Create a new `XMLTransformer`
 
-        NOTE: cache set to `True` will enable the use of the same strategy for
-        future log entries seen by this instance
+        NOTE: elements are routed to their strategy by tag so cache has no effect,
+        it is kept for compatibility. A memo will be consulted before parsing any
+        timestamp
         """
-        super().__init__(
-            [JLU(), WinEvent()],
-            cache,
-        )
+        self._cache = cache
+        self._timestamps = TimestampParser(memo=memo)
+
+    def resolve(self, entry: Element) -> Optional[dict]:
+        """Resolves an element with the strategy routed for its tag"""
+        strategy = _ROUTES.get(entry.tag)
+        if strategy is None:
+            return None
+        return strategy.match(entry)
 
     def transform(self, entry: Element) -> Optional[Log]:
         mapping: Optional[dict] = self.resolve(entry)
@@ -122,8 +258,8 @@ class XMLTransformer(BaseTransformerValidator, Resolver):
             time = mapping.get("timestamp")
             timedate = None
             if time is not None:
-                timedate = dateparser.parse(time, languages=LANGUAGES_SUPPORTED)
-            return Log(
+                timedate = self._timestamps.parse(time)
+            return Log.trusted(
                 level=mapping.get("level"),
                 module=mapping.get("module"),
                 source=mapping.get("source"),
@@ -132,6 +268,26 @@ class XMLTransformer(BaseTransformerValidator, Resolver):
             )
         return None
 
+    def transform_file(self, path: str, encoding: Optional[str] = None) -> TransformBatch:
+        """Lazily transforms every `record` and `Event` element of an XML log file
+
+        NOTE: see `iter_records`, memory stays flat however large the file is
+
+        Args:
+            path (str): the XML log file to transform
+            encoding (Optional[str]): the encoding of the file, detected when `None`
+        """
+        return TransformBatch(self.transform, _file_records(path, encoding))
+
+    def transform_stream(self, stream: BinaryIO, encoding: Optional[str] = None) -> TransformBatch:
+        """Lazily transforms every `record` and `Event` element of a binary XML stream
+
+        Args:
+            stream (BinaryIO): the binary XML stream to transform
+            encoding (Optional[str]): the encoding of the stream, detected when `None`
+        """
+        return TransformBatch(self.transform, iter_records(stream, encoding))
+
     def validate(self, data: str) -> bool:
         if data == "xml":
             return True
@@ -0,0 +1,184 @@
+"""
+The `follow` module defines the `FileFollower` class, which follows a live log file
+like `tail -F`, surviving truncation and rename-based rotation, and can resume from
+a persisted byte offset after a restart.
+"""
+import asyncio
+import json
+import os
+from typing import AsyncGenerator, BinaryIO, Optional, Tuple
+
+# Byte size of each read of newly appended data
+READ_SIZE = 1 << 16
+
+
+class FileFollower:
+    """
+    The `FileFollower` class is responsible for yielding lines appended
+    to a file as they are written
+    """
+
+    def __init__(
+        self,
+        path: str,
+        state: Optional[str] = None,
+        from_start: bool = False,
+        poll_interval: float = 0.01,
+        max_poll_interval: float = 0.5,
+        encoding: str = "utf-8",
+    ):
+        """Create a new `FileFollower`
+
+        NOTE: without new data the file is polled less and less often, from
+        `poll_interval` up to `max_poll_interval` seconds, so an idle follower does
+        not keep a core busy. The offset of the next unread line is persisted to
+        `state` whenever the follower catches up, and restored when the followed file
+        is still the same one
+
+        Args:
+            path (str): the file to follow
+            state (Optional[str]): a file to persist the read offset to
+            from_start (bool): whether to start from the beginning of the file instead of its end
+            poll_interval (float): the shortest wait in seconds between polls
+            max_poll_interval (float): the longest wait in seconds between polls
+            encoding (str): the encoding of the file
+        """
+        self._path = path
+        self._state = state
+        self._from_start = from_start
+        self._poll_interval = poll_interval
+        self._max_poll_interval = max_poll_interval
+        self._encoding = encoding
+        self._file: Optional[BinaryIO] = None
+        self._identity: Optional[Tuple[int, int]] = None
+        self._offset = 0
+        self._persisted: Optional[Tuple[Optional[Tuple[int, int]], int]] = None
+
+    @property
+    def offset(self) -> int:
+        """The byte offset of the next unread line in the followed file"""
+        return self._offset
+
+    async def lines(self) -> AsyncGenerator[str, None]:
+        """Yields each line appended to the file, without its line ending"""
+        pending = b""
+        delay = self._poll_interval
+        try:
+            while True:
+                file = self._file or self._open()
+                if file is None:
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, self._max_poll_interval)
+                    continue
+
+                data = file.read(READ_SIZE)
+                if data:
+                    delay = self._poll_interval
+                    *lines, pending = (pending + data).split(b"\n")
+                    for line in lines:
+                        self._offset += len(line) + 1
+                        yield self._decode(line)
+                    # Once per chunk, as a file that keeps growing would never let other tasks run
+                    await asyncio.sleep(0)
+                    continue
+
+                if self._rotated():
+                    # The rest of a rotated file's last line will never be written
+                    if pending:
+                        yield self._decode(pending)
+                        pending = b""
+                    self._close()
+                    continue
+                if self._truncated(file):
+                    pending = b""
+                    self._seek(file, 0)
+                    continue
+
+                self._persist()
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self._max_poll_interval)
+        finally:
+            self._persist()
+            self._close()
+
+    def _decode(self, line: bytes) -> str:
+        """Decodes a line without its line ending, replacing any undecodable byte"""
+        return line.rstrip(b"\r").decode(self._encoding, errors="replace")
+
+    def _open(self) -> Optional[BinaryIO]:
+        """Opens the followed file at the offset to resume from
+
+        NOTE: a file other than the one followed before, or than the one the state
+        was persisted for, is read from the start
+        """
+        try:
+            file = open(self._path, "rb")
+        except FileNotFoundError:
+            return None
+        stat = os.fstat(file.fileno())
+        identity = (stat.st_dev, stat.st_ino)
+
+        if self._identity is not None:
+            # A new file after rotation is read from the start
+            offset = 0
+        else:
+            offset = 0 if self._from_start else stat.st_size
+            restored = self._restore()
+            if restored is not None:
+                # As is a file rotated or truncated since the state was persisted
+                same = restored[0] == identity and restored[1] <= stat.st_size
+                offset = restored[1] if same else 0
+
+        self._file = file
+        self._identity = identity
+        self._seek(file, offset)
+        return file
+
+    def _seek(self, file: BinaryIO, offset: int):
+        file.seek(offset)
+        self._offset = offset
+
+    def _close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _rotated(self) -> bool:
+        """Whether the path now names another file
+
+        NOTE: while nothing replaces a renamed file it is kept open, as its writer
+        may still be appending to it
+        """
+        try:
+            stat = os.stat(self._path)
+        except FileNotFoundError:
+            return False
+        return (stat.st_dev, stat.st_ino) != self._identity
+
+    def _truncated(self, file: BinaryIO) -> bool:
+        return os.fstat(file.fileno()).st_size < file.tell()
+
+    def _restore(self) -> Optional[Tuple[Tuple[int, int], int]]:
+        if self._state is None:
+            return None
+        try:
+            with open(self._state, "r", encoding="utf-8") as file:
+                state = json.load(file)
+            return (state["device"], state["inode"]), state["offset"]
+        except (FileNotFoundError, ValueError, KeyError, TypeError):
+            return None
+
+    def _persist(self):
+        """Persists the read offset, if it moved since last time"""
+        if self._state is None or self._identity is None:
+            return
+        if self._persisted == (self._identity, self._offset):
+            return
+        temporary = f"{self._state}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(
+                {"device": self._identity[0], "inode": self._identity[1], "offset": self._offset},
+                file,
+            )
+        os.replace(temporary, self._state)
+        self._persisted = (self._identity, self._offset)
@@ -0,0 +1,63 @@
+"""
+The `lines` module defines the `MappedLines` class, which reads the lines of a file
+through a memory map and hands out ASCII lines as bytes, so only the spans a match
+uses ever get decoded.
+"""
+import io
+import mmap
+import os
+from typing import Iterator, Union
+
+# Byte size of the newline aligned blocks copied out of the memory map
+BLOCK_SIZE = 1 << 14
+
+# Bytes that keep byte-level and `str` regular expression semantics the same,
+# which excludes non-ASCII bytes and the separators only `str` takes for whitespace
+_ASCII = bytes(byte for byte in range(0x80) if not 0x1C <= byte <= 0x1F)
+
+
+class MappedLines:
+    """
+    The `MappedLines` class is responsible for reading the lines of a file
+    through a memory map
+    """
+
+    def __init__(self, path: str, block_size: int = BLOCK_SIZE):
+        """Create a new `MappedLines`
+
+        NOTE: the file is only mapped once its lines are iterated, and unmapped
+        when they are exhausted or the iterator is closed
+        """
+        self._path = path
+        self._block_size = block_size
+
+    def blocks(self) -> Iterator[bytes]:
+        """Hands out the file in blocks ending on a line boundary"""
+        with open(self._path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if not size:
+                return
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            start = 0
+            while start < size:
+                end = buffer.find(b"\n", min(start + self._block_size, size) - 1) + 1 or size
+                yield buffer[start:end]
+                start = end
+        finally:
+            buffer.close()
+
+    def lines(self, encoding: str = "utf-8") -> Iterator[Union[bytes, str]]:
+        """Hands out each line without its surrounding whitespace
+
+        NOTE: lines are split on universal newlines, as `transform_file` does. Those
+        of a block holding only ASCII bytes are handed out as bytes, to be matched
+        with byte-level regular expressions, those of any other block decoded
+        """
+        for block in self.blocks():
+            if not block.translate(None, _ASCII):
+                for line in block.splitlines():
+                    yield line.strip()
+            else:
+                for text in io.StringIO(block.decode(encoding), newline=None):
+                    yield text.strip()
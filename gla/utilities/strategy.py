@@ -2,8 +2,95 @@
 The `strategy` module defines abstract and concrete strategy classes that implement
 various strategies, including matching and scoring.
 """
+import importlib
+import re
 from abc import ABC, abstractmethod
-from typing import Any, Match, Optional, Pattern, Tuple
+from typing import Any, List, Match, Optional, Pattern, Sequence, Tuple
+
+
+def _import_parser() -> Any:
+    """Imports the private parser of the `re` module, or `None` when it cannot be found"""
+    # Named `sre_parse` before Python 3.11, which deprecates that name
+    for name in ("re._parser", "sre_parse"):
+        try:
+            return importlib.import_module(name)
+        except ImportError:
+            continue
+    return None
+
+
+_sre = _import_parser()
+
+# Repeats whose body has to be matched at least `min` times
+_REPEATS = tuple(
+    getattr(_sre, name)
+    for name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT")
+    if hasattr(_sre, name)
+)
+
+
+def _walk(items, literals: List[str]):
+    """Collects the runs of literals every match must contain"""
+    run: List[str] = []
+    for op, av in items:
+        if op is _sre.LITERAL:
+            run.append(chr(av))
+            continue
+        if run:
+            literals.append("".join(run))
+            run = []
+        if op is _sre.SUBPATTERN:
+            # Literals of a case insensitive group may match in any case
+            if not (len(av) == 4 and av[1] & re.IGNORECASE):
+                _walk(av[-1], literals)
+        elif op in _REPEATS and av[0] >= 1:
+            _walk(av[2], literals)
+    if run:
+        literals.append("".join(run))
+
+
+def derive(pattern: Pattern) -> Tuple[str, Tuple[Tuple[str, ...], ...]]:
+    """Derives the prefix and the literals every match of a pattern must contain
+
+    NOTE: only runs of at least two characters outside of optional parts of the
+    pattern are derived, single characters and alternatives such as level keywords
+    being found in most log lines, and nothing is derived from byte or case
+    insensitive patterns
+
+    Args:
+        pattern (Pattern): the pre-compiled regular expression to derive from
+
+    Returns:
+        the prefix, and groups of literals of which every match contains at least one
+    """
+    if _sre is None or isinstance(pattern.pattern, bytes) or pattern.flags & re.IGNORECASE:
+        return "", ()
+    try:
+        return _derive(pattern)
+    except (AttributeError, IndexError, TypeError, ValueError):
+        # The parser is private, so a version that changed its output derives nothing
+        return "", ()
+
+
+def _derive(pattern: Pattern) -> Tuple[str, Tuple[Tuple[str, ...], ...]]:
+    """Derives the prefix and the literals of a pattern from its parsed form"""
+    items = list(_sre.parse(pattern.pattern, pattern.flags))
+
+    leading: List[str] = []
+    for op, av in items:
+        if op is _sre.AT and av is _sre.AT_BEGINNING:
+            continue
+        if op is not _sre.LITERAL:
+            break
+        leading.append(chr(av))
+    prefix = "".join(leading)
+
+    runs: List[str] = []
+    _walk(items, runs)
+    # A run inside the prefix or another run need not be looked for again
+    runs = [run for run in dict.fromkeys(runs) if len(run) > 1]
+    required = [prefix] + runs
+    return prefix, tuple((run,) for run in runs if sum(run in text for text in required) == 1)
 
 
 class Strategy(ABC):
@@ -17,6 +104,14 @@ class Strategy(ABC):
         """Match the entry against the strategy"""
         ...
 
+    def binary(self) -> "Strategy":
+        """Creates the same strategy for ASCII byte entries, such as memory-mapped lines
+
+        Raises:
+            NotImplementedError: if the strategy cannot match byte entries
+        """
+        raise NotImplementedError(f"{type(self).__name__} cannot match byte entries")
+
 
 class ScoringStrategy(ABC):
     """
@@ -36,8 +131,77 @@ class RegexStrategy(Strategy):
     based on pre-compiled regular expressions
     """
 
-    def __init__(self, pattern: Pattern):
+    def __init__(
+        self,
+        pattern: Pattern,
+        prefix: Optional[str] = None,
+        literals: Optional[Sequence[Tuple[str, ...]]] = None,
+    ):
+        """Create a new `RegexStrategy`
+
+        NOTE: an entry is only matched against the regular expression once it starts
+        with the prefix and contains a literal of each group, which are derived from
+        the pattern unless given. Nothing is derived where the private parser of the
+        `re` module is unavailable, so every entry is then matched directly
+
+        Args:
+            pattern (Pattern): the pre-compiled regular expression
+            prefix (Optional[str]): the text every match starts with
+            literals (Optional[Sequence[Tuple[str, ...]]]): groups of texts of which
+                every match contains at least one
+        """
         self._pattern = pattern
+        if prefix is None or literals is None:
+            derived_prefix, derived_literals = derive(pattern)
+            prefix = derived_prefix if prefix is None else prefix
+            literals = derived_literals if literals is None else literals
+        self._prefix = prefix
+        self._literals = tuple(tuple(group) for group in literals)
+        self._checked = bool(prefix or self._literals)
+        self._binary: Optional["RegexStrategy"] = None
+
+    @property
+    def pattern(self) -> Pattern:
+        """The pre-compiled regular expression of the strategy"""
+        return self._pattern
+
+    @property
+    def prefix(self) -> str:
+        """The text every match starts with"""
+        return self._prefix
+
+    @property
+    def literals(self) -> Tuple[Tuple[str, ...], ...]:
+        """Groups of texts of which every match contains at least one"""
+        return self._literals
 
     def match(self, entry: str) -> Optional[Match[str]]:
+        if not self._checked:
+            # Nothing to check, so the regular expression is matched directly
+            return self._pattern.match(entry)
+        if self._prefix and not entry.startswith(self._prefix):
+            return None
+        for group in self._literals:
+            for literal in group:
+                if literal in entry:
+                    break
+            else:
+                return None
         return self._pattern.match(entry)
+
+    def binary(self) -> "RegexStrategy":
+        """Creates the same strategy for ASCII byte entries, such as memory-mapped lines
+
+        NOTE: memory views cannot be searched for literals, so the byte strategy
+        runs its regular expression on every entry. It is compiled once and reused
+        by later calls
+        """
+        if self._binary is None:
+            self._binary = RegexStrategy(
+                re.compile(
+                    self._pattern.pattern.encode("utf-8"), self._pattern.flags & ~re.UNICODE
+                ),
+                "",
+                (),
+            )
+        return self._binary
@@ -0,0 +1,165 @@
+import asyncio
+import os
+
+from gla.utilities.follow import READ_SIZE, FileFollower
+
+
+def run(follower: FileFollower, count: int, *writes) -> list:
+    """Collects `count` lines from a follower while the writes run one after another"""
+
+    async def collect(lines: list):
+        follow = follower.lines()
+        try:
+            async for line in follow:
+                lines.append(line)
+                if len(lines) == count:
+                    break
+        finally:
+            await follow.aclose()
+
+    async def write():
+        for write in writes:
+            # Gives the follower time to catch up before each write
+            await asyncio.sleep(0.1)
+            write()
+
+    async def main() -> list:
+        lines: list = []
+        await asyncio.gather(asyncio.wait_for(collect(lines), 10), write())
+        return lines
+
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(main())
+    finally:
+        loop.close()
+
+
+def append(path, text: str):
+    def write():
+        with path.open("a", encoding="utf-8") as file:
+            file.write(text)
+
+    return write
+
+
+def test_follow_appended_lines(tmp_path):
+    path = tmp_path / "app.log"
+    path.write_text("old line\n")
+
+    lines = run(
+        FileFollower(str(path)), 3, append(path, "first\r\nsecond\nthi"), append(path, "rd\n")
+    )
+
+    assert lines == ["first", "second", "third"]
+
+
+def test_follow_from_start(tmp_path):
+    path = tmp_path / "app.log"
+    path.write_text("old line\n")
+
+    assert run(FileFollower(str(path), from_start=True), 1, lambda: None) == ["old line"]
+
+
+def test_follow_truncation(tmp_path):
+    path = tmp_path / "app.log"
+    path.write_text("")
+
+    lines = run(
+        FileFollower(str(path)),
+        2,
+        append(path, "before truncation\n"),
+        lambda: path.write_text("after\n"),
+    )
+
+    assert lines == ["before truncation", "after"]
+
+
+def test_follow_rotation(tmp_path):
+    path = tmp_path / "app.log"
+    path.write_text("")
+
+    def rotate():
+        os.rename(str(path), str(tmp_path / "app.log.1"))
+        path.write_text("rotated\n")
+
+    lines = run(FileFollower(str(path)), 3, append(path, "one\ntwo"), rotate)
+
+    assert lines == ["one", "two", "rotated"]
+
+
+def test_follow_resumes_from_state(tmp_path):
+    path = tmp_path / "app.log"
+    state = str(tmp_path / "app.log.offset")
+    path.write_text("")
+
+    first = FileFollower(str(path), state)
+    assert run(first, 1, append(path, "before restart\n")) == ["before restart"]
+
+    # Written while nothing follows the file
+    append(path, "during restart\n")()
+
+    second = FileFollower(str(path), state)
+    assert run(second, 2, append(path, "after restart\n")) == ["during restart", "after restart"]
+    assert second.offset == path.stat().st_size
+
+
+def test_follow_resumes_rotated_file_from_start(tmp_path):
+    path = tmp_path / "app.log"
+    state = str(tmp_path / "app.log.offset")
+    path.write_text("")
+
+    first = FileFollower(str(path), state)
+    assert run(first, 1, append(path, "before restart\n")) == ["before restart"]
+
+    # Rotated and written to while nothing follows the file
+    os.rename(str(path), str(tmp_path / "app.log.1"))
+    path.write_text("during restart\n")
+
+    second = FileFollower(str(path), state)
+    assert run(second, 2, append(path, "after restart\n")) == ["during restart", "after restart"]
+
+
+def test_follow_replaces_undecodable_bytes(tmp_path):
+    path = tmp_path / "app.log"
+    path.write_text("")
+
+    def invalid():
+        with path.open("ab") as file:
+            file.write(b"bad \xff byte\n")
+
+    lines = run(FileFollower(str(path)), 2, invalid, append(path, "next\n"))
+
+    assert lines == ["bad \ufffd byte", "next"]
+
+
+def test_follow_lets_other_tasks_run_while_catching_up(tmp_path):
+    path = tmp_path / "app.log"
+    count = READ_SIZE // 2
+    path.write_text("line\n" * count)
+    ticks = []
+
+    async def tick():
+        while True:
+            ticks.append(len(ticks))
+            await asyncio.sleep(0)
+
+    async def main() -> int:
+        ticker = asyncio.ensure_future(tick())
+        follow = FileFollower(str(path), from_start=True).lines()
+        seen = 0
+        try:
+            async for _ in follow:
+                seen += 1
+                if seen == count:
+                    break
+        finally:
+            await follow.aclose()
+            ticker.cancel()
+        return len(ticks)
+
+    loop = asyncio.new_event_loop()
+    try:
+        assert loop.run_until_complete(main()) > 1, "Should yield to the loop between reads"
+    finally:
+        loop.close()
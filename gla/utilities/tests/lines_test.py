@@ -0,0 +1,51 @@
+from pytest import raises
+
+from gla.utilities.lines import MappedLines
+
+
+def test_mapped_lines(tmp_path):
+    path = tmp_path / "test.log"
+    path.write_bytes(b"first\r\n\r\n  second  \rlast")
+
+    lines = MappedLines(str(path))
+
+    assert list(lines.lines()) == [b"first", b"", b"second", b"last"]
+
+
+def test_mapped_lines_non_ascii(tmp_path):
+    path = tmp_path / "test.log"
+    path.write_bytes("plain\ncafé\r\n".encode("utf-8") + b"sep\x1carated\n")
+
+    # Only the blocks holding non-ASCII bytes or separators are decoded
+    for block_size, expected in (
+        (1 << 16, ["plain", "café", "sep\x1carated"]),
+        (1, [b"plain", "café", "sep\x1carated"]),
+    ):
+        lines = MappedLines(str(path), block_size)
+        assert list(lines.lines()) == expected
+
+
+def test_mapped_lines_blocks(tmp_path):
+    path = tmp_path / "test.log"
+    path.write_bytes(b"".join(b"line %d\n" % number for number in range(100)) + b"last")
+
+    for block_size in (1, 7, 8, 100, 1 << 16):
+        blocks = list(MappedLines(str(path), block_size).blocks())
+        assert b"".join(blocks) == path.read_bytes()
+        assert all(block.endswith(b"\n") for block in blocks[:-1])
+
+
+def test_mapped_lines_lazy(tmp_path):
+    path = tmp_path / "missing.log"
+
+    lines = MappedLines(str(path)).lines()
+
+    with raises(FileNotFoundError):
+        next(lines)
+
+
+def test_mapped_lines_empty(tmp_path):
+    path = tmp_path / "test.log"
+    path.write_bytes(b"")
+
+    assert list(MappedLines(str(path)).lines()) == []
@@ -0,0 +1,93 @@
+import os
+import re
+from typing import List
+
+from gla.plugins.transformer.cef_transformer import CefTransformer
+from gla.plugins.transformer.log4j_transformer import Log4jTransformer
+from gla.plugins.transformer.ncsa_transformer import NcsaTransformer
+from gla.plugins.transformer.sip_transformer import SipTransformer
+from gla.plugins.transformer.syslog_transformer import SyslogTransformer
+from gla.utilities.strategy import RegexStrategy, derive
+
+
+def test_derive():
+    test_cases = [
+        {"pattern": r"^CEF:(?P<cef>\d+)\|(?P<ext>.+)", "expected": ("CEF:", ())},
+        {"pattern": r"<(\d+)> (?:ERROR|WARN) x", "expected": ("<", (("> ",), (" x",)))},
+        {
+            "pattern": r'(\S+) \[(.+)\] "(.+)" "(.+)"',
+            "expected": ("", ((" [",), ('] "',), ('" "',))),
+        },
+        # Optional parts, character classes and alternatives are not required
+        {"pattern": r"(?:\[(\w+)\] )?(-|\d+)[ab]x*", "expected": ("", ())},
+        {"pattern": r"(?:ab)+ (?:cd)* ab", "expected": ("", ((" ab",),))},
+        {"pattern": r"(?i)abc", "expected": ("", ())},
+        {"pattern": r"xx(?i:abc)yy", "expected": ("xx", (("yy",),))},
+    ]
+
+    for case in test_cases:
+        pattern = case["pattern"]
+        result = derive(re.compile(pattern))
+        assert (
+            result == case["expected"]
+        ), f"Failed for pattern: {pattern}, Expected: {case['expected']}, Got: {result}"
+
+    assert derive(re.compile(rb"^CEF:")) == ("", ()), "Should not derive from byte patterns"
+
+
+def test_derive_without_parser(monkeypatch):
+    monkeypatch.setattr("gla.utilities.strategy._sre", None)
+    assert derive(re.compile(r"^CEF:(.+)")) == ("", ()), "Should derive nothing without a parser"
+
+    regex = RegexStrategy(re.compile(r"^CEF:(.+)"))
+    assert regex.match("CEF:boom") is not None
+    assert regex.match("<34>1 boom") is None
+
+
+def test_regex_strategy_prefilter():
+    class Pattern:
+        """Records the entries the regular expression is run on"""
+
+        def __init__(self, pattern: str):
+            self.pattern = pattern
+            self.flags = re.UNICODE
+            self.entries: List[str] = []
+            self._compiled = re.compile(pattern)
+
+        def match(self, entry: str):
+            self.entries.append(entry)
+            return self._compiled.match(entry)
+
+    pattern = Pattern(r"^CEF:\d\| - (.+)")
+    strategy = RegexStrategy(pattern)
+    assert strategy.match("CEF:0| - boom") is not None
+    assert strategy.match("<34>1 2003-10-11T22:14:15Z - boom") is None
+    assert strategy.match("CEF:0|boom") is None
+    assert pattern.entries == ["CEF:0| - boom"], "Should only run the regex past the literals"
+
+    strategy = RegexStrategy(Pattern(r"(\d+) (.+)"), prefix="1", literals=[("ok", "fine")])
+    assert (strategy.prefix, strategy.literals) == ("1", (("ok", "fine"),))
+    assert strategy.match("12 fine") is not None
+    assert strategy.match("22 fine") is None
+    assert strategy.match("12 bad") is None
+
+
+def test_regex_strategy_prefilter_matches_regex():
+    logs = os.path.join(os.path.dirname(__file__), "..", "..", "plugins", "transformer", "tests")
+    lines = []
+    for log in ("log4j", "syslog", "ncsa", "sip", "cef"):
+        with open(os.path.join(logs, "logs", f"test-{log}.log"), encoding="utf-8") as file:
+            lines += [line.strip() for line in file]
+
+    for transformer in (
+        Log4jTransformer,
+        SyslogTransformer,
+        NcsaTransformer,
+        SipTransformer,
+        CefTransformer,
+    ):
+        for strategy in transformer()._strategies:
+            for line in lines:
+                expected = strategy.pattern.match(line)
+                result = strategy.match(line)
+                assert (result is None) == (expected is None), f"Failed for input: {line}"
@@ -0,0 +1,71 @@
+import dateparser
+from pytest import raises
+
+from gla.constants import LANGUAGES_SUPPORTED
+from gla.utilities.timestamp import TimestampMemo, TimestampParser
+
+
+def test_timestamp_parser_learns_layout():
+    test_cases = [
+        ["2020-02-01", "2021-05-06"],
+        ["02-2020-01", "03-2021-04"],
+        ["03-01-2020", "12-25-2021"],
+        ["Jul 20 17:41:00", "Aug 23 14:55:30"],
+        ["2003-10-11T22:14:15.000003+04:00", "2004-11-12T23:15:16.000004-05:00"],
+        ["2019-08-06T14:08:40.199Z", "2020-09-07T15:09:41.200Z"],
+        ["Jul 20 17:41:00+02:00", "Aug 23 14:55:30-05:00"],
+    ]
+
+    for timestamps in test_cases:
+        parser = TimestampParser()
+        for timestamp in timestamps:
+            expected = dateparser.parse(timestamp, languages=LANGUAGES_SUPPORTED)
+            result = parser.parse(timestamp)
+            assert result == expected, f"Failed for input: {timestamp}"
+            assert result.isoformat() == expected.isoformat(), f"Failed for input: {timestamp}"
+        assert parser.misses == 1, f"Failed to learn layout for: {timestamps}"
+        assert parser.hits == len(timestamps) - 1, f"Failed to learn layout for: {timestamps}"
+
+
+def test_timestamp_parser_fallback():
+    parser = TimestampParser()
+
+    assert parser.parse("03-01-2020").month == 3
+    # Same shape but only valid with the day first
+    assert parser.parse("13-01-2020") == dateparser.parse(
+        "13-01-2020", languages=LANGUAGES_SUPPORTED
+    )
+    assert parser.parse("not a timestamp") is None
+    assert parser.hits == 0
+    assert parser.misses == 3
+
+
+def test_timestamp_memo_evicts_least_recently_used():
+    memo = TimestampMemo(2)
+    parser = TimestampParser(memo=memo)
+
+    parser.parse("2020-02-01")
+    parser.parse("2020-02-02")
+    parser.parse("2020-02-01")
+    parser.parse("2020-02-03")  # evicts 2020-02-02
+    parser.parse("2020-02-02")
+
+    assert len(memo) == 2
+    assert memo.hits == 1
+    assert memo.misses == 4
+    assert memo.hit_rate == 0.2
+
+
+def test_timestamp_memo_shared():
+    memo = TimestampMemo()
+    first = TimestampParser(memo=memo)
+    second = TimestampParser(memo=memo)
+
+    assert first.parse("Jul 20 17:41:00") == second.parse("Jul 20 17:41:00")
+    assert memo.hits == 1
+    assert second.hits + second.misses == 0
+
+
+def test_timestamp_memo_invalid_size():
+    with raises(ValueError, match="memo size must be atleast 'one'"):
+        TimestampMemo(0)
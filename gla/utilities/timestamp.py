@@ -0,0 +1,230 @@
+"""
+The `timestamp` module defines the `TimestampParser` class, which learns concrete
+timestamp layouts from `dateparser` once and parses with the learned layout from then on,
+and the `TimestampMemo` class, a bounded memo of already parsed timestamps.
+"""
+import sys
+from collections import OrderedDict
+from datetime import date, datetime
+from itertools import product
+from typing import Callable, Dict, List, Optional
+
+import dateparser
+
+from gla.constants import LANGUAGES_SUPPORTED
+
+# Reduces a timestamp to its shape so layouts are learned once per shape
+_SHAPE = str.maketrans(
+    "+0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ",
+    "-0000000000aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+)
+
+_DATES = (
+    "%Y-%m-%d",
+    "%m-%d-%Y",
+    "%d-%m-%Y",
+    "%m-%Y-%d",
+    "%d-%Y-%m",
+    "%Y-%d-%m",
+    "%Y/%m/%d",
+    "%m/%d/%Y",
+    "%d/%m/%Y",
+    "%d/%b/%Y",
+    "%d %b %Y",
+    "%b %d %Y",
+    "%b %d",
+)
+_TIMES = ("%H:%M:%S", "%H:%M:%S.%f", "%H:%M:%S,%f", "%H:%M")
+_JOINS = ("T", " ", ":")
+_ZONES = ("", "%z", " %z")
+
+# Every layout worth trying, most common first
+LAYOUTS: List[str] = list(_DATES) + [
+    f"{day}{join}{time}{zone}" for zone, day, join, time in product(_ZONES, _DATES, _JOINS, _TIMES)
+]
+
+# Learned layouts kept per parser, unlearnable shapes included
+MAX_SHAPES = 64
+
+
+def _punctuation(layout: str) -> frozenset:
+    """Gets the literal punctuation a timestamp must contain to fit the layout"""
+    literal = layout.replace("%z", "")
+    for directive in ("%Y", "%m", "%d", "%b", "%H", "%M", "%S", "%f"):
+        literal = literal.replace(directive, "")
+    return frozenset(char for char in literal if not char.isalnum())
+
+
+_REQUIRED = [(layout, _punctuation(layout)) for layout in LAYOUTS]
+
+
+def _offset(text: str) -> str:
+    """Rewrites a `Z` or `+HH:MM` UTC offset as `+HHMM`, the only form `%z` takes on Python 3.6"""
+    if text[-1:] == "Z":
+        return f"{text[:-1]}+0000"
+    if len(text) > 6 and text[-3] == ":" and text[-6] in "+-":
+        return text[:-3] + text[-2:]
+    return text
+
+
+def _strptime(layout: str) -> Callable[[str], datetime]:
+    """Creates a parser for a concrete `strptime` layout
+
+    NOTE: layouts without a year take the current year, as `dateparser` does
+    """
+    zoned = "%z" in layout
+    if "%Y" in layout:
+        if zoned:
+            return lambda text: datetime.strptime(_offset(text), layout)
+        return lambda text: datetime.strptime(text, layout)
+    layout = f"%Y {layout}"
+    if zoned:
+        return lambda text: datetime.strptime(f"{date.today().year} {_offset(text)}", layout)
+    return lambda text: datetime.strptime(f"{date.today().year} {text}", layout)
+
+
+def _same(candidate: datetime, expected: datetime) -> bool:
+    return candidate == expected and candidate.utcoffset() == expected.utcoffset()
+
+
+class TimestampMemo:
+    """
+    The `TimestampMemo` class is a bounded least recently used memo from raw timestamp
+    text to its parsed value, which can be shared across transformers
+    """
+
+    def __init__(self, size: int = 1024):
+        """Create a new `TimestampMemo`
+
+        NOTE: once `size` timestamps are memoized, the least recently used one is evicted
+        """
+        if size < 1:
+            raise ValueError("memo size must be atleast 'one'")
+        self._size = size
+        self._entries: "OrderedDict[str, Optional[datetime]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """The number of timestamps found in the memo"""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """The number of timestamps that had to be parsed"""
+        return self._misses
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of timestamps found in the memo"""
+        total = self._hits + self._misses
+        return self._hits / total if total else 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, text: str, parse: Callable[[str], Optional[datetime]]) -> Optional[datetime]:
+        """Gets a memoized timestamp, parsing and memoizing it when missing
+
+        Args:
+            text (str): the timestamp to look up
+            parse (Callable[[str], Optional[datetime]]): parses the timestamp on a miss
+        """
+        entries = self._entries
+        try:
+            timestamp = entries[text]
+        except KeyError:
+            self._misses += 1
+            timestamp = parse(text)
+            entries[text] = timestamp
+            if len(entries) > self._size:
+                entries.popitem(last=False)
+            return timestamp
+        self._hits += 1
+        entries.move_to_end(text)
+        return timestamp
+
+
+class TimestampParser:
+    """
+    The `TimestampParser` class is responsible for parsing timestamps with a
+    layout learned from `dateparser`, falling back to `dateparser` when it fails
+    """
+
+    def __init__(self, languages: Optional[List[str]] = None, memo: Optional[TimestampMemo] = None):
+        """Create a new `TimestampParser`
+
+        NOTE: languages default to `LANGUAGES_SUPPORTED`, and a memo will be consulted
+        before any parsing
+        """
+        self._languages = LANGUAGES_SUPPORTED if languages is None else languages
+        self._memo = memo
+        self._layouts: Dict[str, Optional[Callable[[str], datetime]]] = {}
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """The number of timestamps parsed with a learned layout"""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """The number of timestamps that fell back to `dateparser`"""
+        return self._misses
+
+    def parse(self, text: str) -> Optional[datetime]:
+        """Parses a timestamp
+
+        Args:
+            text (str): the timestamp to parse
+        """
+        if not isinstance(text, str):
+            return dateparser.parse(text, languages=self._languages)
+        if self._memo is not None:
+            return self._memo.get(text, self._parse)
+        return self._parse(text)
+
+    def _parse(self, text: str) -> Optional[datetime]:
+        shape = text.translate(_SHAPE)
+        layout = self._layouts.get(shape)
+        if layout is not None:
+            try:
+                learned = layout(text)
+                self._hits += 1
+                return learned
+            except ValueError:
+                pass
+
+        self._misses += 1
+        timestamp = dateparser.parse(text, languages=self._languages)
+        if timestamp is not None and shape not in self._layouts:
+            if len(self._layouts) < MAX_SHAPES:
+                self._layouts[shape] = self._learn(text, timestamp)
+        return timestamp
+
+    def _learn(self, text: str, expected: datetime) -> Optional[Callable[[str], datetime]]:
+        """Finds a layout that parses the timestamp exactly as `dateparser` did
+
+        NOTE: `datetime.fromisoformat` is preferred from Python 3.7, before it ISO
+        timestamps are learned as `strptime` layouts
+        """
+        if sys.version_info >= (3, 7):
+            try:
+                if _same(datetime.fromisoformat(text), expected):
+                    return datetime.fromisoformat
+            except ValueError:
+                pass
+
+        present = set(text)
+        for layout, required in _REQUIRED:
+            if not required <= present:
+                continue
+            parser = _strptime(layout)
+            try:
+                if _same(parser(text), expected):
+                    return parser
+            except ValueError:
+                continue
+        return None